@@ -1,27 +1,172 @@
 import os
-from sqlalchemy import create_engine
+import threading
+import time
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from dotenv import load_dotenv
 
 # .env 파일 로딩
 load_dotenv()
 
-# .env에서 환경변수 로드 (기본값 설정 가능)
-MYSQL_USER = os.environ["MYSQL_USER"]
-MYSQL_PASSWORD = os.environ["MYSQL_PASSWORD"]
-MYSQL_HOST = os.environ["MYSQL_HOST"]
-MYSQL_PORT = os.environ["MYSQL_PORT"]
-MYSQL_DATABASE = os.environ["MYSQL_DATABASE"]
+# 접속 URL 을 직접 지정할 수 있음 (벤치마크용 SQLite 등: DATABASE_URL=sqlite:///bench.db)
+# 지정하지 않으면 .env 의 MYSQL_* 로 구성
+_ASYNC_DRIVERS = {"mysql+pymysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
 
+if os.getenv("DATABASE_URL"):
+    DATABASE_URL = os.environ["DATABASE_URL"]
+    _scheme, _rest = DATABASE_URL.split(":", 1)
+    _default_async_url = f"{_ASYNC_DRIVERS.get(_scheme, _scheme)}:{_rest}"
+else:
+    # .env에서 환경변수 로드 (기본값 설정 가능)
+    MYSQL_USER = os.environ["MYSQL_USER"]
+    MYSQL_PASSWORD = os.environ["MYSQL_PASSWORD"]
+    MYSQL_HOST = os.environ["MYSQL_HOST"]
+    MYSQL_PORT = os.environ["MYSQL_PORT"]
+    MYSQL_DATABASE = os.environ["MYSQL_DATABASE"]
+
+    # SQLAlchemy 접속 URL 구성
+    DATABASE_URL = (
+        f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
+    )
+    _default_async_url = f"mysql+aiomysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
+
+# 비동기 드라이버 URL (aiomysql, 테스트는 sqlite+aiosqlite:///...)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _default_async_url)
+
+# 커넥션 풀 / 로깅 설정
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_ECHO = os.getenv("DB_ECHO", "false").lower()             # false / true / debug
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))  # 0 = 제한 없음 (MySQL SELECT 에 적용)
+
+
+class PoolMetrics:
+    """커넥션 풀 사용 현황 (checkout 대기시간 포함)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, seconds, timed_out=False):
+        with self.lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool):
+        with self.lock:
+            data = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total * 1000, 2),
+                "wait_avg_ms": round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 2),
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                "pool_size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": DB_MAX_OVERFLOW,
+            })
+        return data
+
+
+pool_metrics = PoolMetrics()        # 동기 엔진 (engine)
+async_pool_metrics = PoolMetrics()  # 비동기 엔진 (async_engine)
+
+
+class _TimedGet:
+    # 풀에서 커넥션을 얻기까지 걸린 시간 측정 (metrics: 클래스별 PoolMetrics)
+    metrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - start, timed_out)
+
+
+class TimedQueuePool(_TimedGet, QueuePool):
+    metrics = pool_metrics
+
+
+class TimedAsyncQueuePool(_TimedGet, AsyncAdaptedQueuePool):
+    metrics = async_pool_metrics
+
+
+def _echo_setting(value):
+    if value == "debug":
+        return "debug"
+    return value in ("1", "true", "yes")
+
+
+def _pool_options(url):
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def install_pool_events(db_engine, metrics):
+    """풀 계측 + 접속 시 세션 설정 (비동기 엔진은 async_engine.sync_engine 에 등록)"""
+
+    @event.listens_for(db_engine, "connect")
+    def on_connect(dbapi_conn, conn_record):
+        with metrics.lock:
+            metrics.connects += 1
+        if DB_STATEMENT_TIMEOUT_MS and db_engine.dialect.name == "mysql":
+            cursor = dbapi_conn.cursor()
+            cursor.execute(f"SET SESSION max_execution_time = {DB_STATEMENT_TIMEOUT_MS}")
+            cursor.close()
+
+    @event.listens_for(db_engine, "checkout")
+    def on_checkout(dbapi_conn, conn_record, conn_proxy):
+        with metrics.lock:
+            metrics.checkouts += 1
+
+    @event.listens_for(db_engine, "checkin")
+    def on_checkin(dbapi_conn, conn_record):
+        with metrics.lock:
+            metrics.checkins += 1
+
+
+def create_db_engine(url=DATABASE_URL):
+    options = {"echo": _echo_setting(DB_ECHO), "future": True, **_pool_options(url)}
+    if not url.startswith("sqlite"):
+        options["poolclass"] = TimedQueuePool
+    db_engine = create_engine(url, **options)
+    install_pool_events(db_engine, pool_metrics)
+    return db_engine
 
-# SQLAlchemy 접속 URL 구성
-DATABASE_URL = (
-    f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
-)
 
 # 엔진 및 세션 생성
-engine = create_engine(DATABASE_URL, echo=True, future=True)
+engine = create_db_engine()
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
 
@@ -32,3 +177,37 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ------------------------------------------------------------------
+# 비동기 엔진/세션 (async def 핸들러용 — 이벤트 루프를 막지 않음)
+# 드라이버(aiomysql/aiosqlite)가 없는 환경에서도 import 는 되도록 처음 사용할 때 생성
+# ------------------------------------------------------------------
+async_engine = None
+AsyncSessionLocal = None
+
+
+def get_async_engine():
+    global async_engine, AsyncSessionLocal
+    if async_engine is None:
+        options = {"echo": _echo_setting(DB_ECHO), **_pool_options(ASYNC_DATABASE_URL)}
+        if not ASYNC_DATABASE_URL.startswith("sqlite"):
+            options["poolclass"] = TimedAsyncQueuePool
+        async_engine = create_async_engine(ASYNC_DATABASE_URL, **options)
+        # 동기 엔진과 같은 풀 계측 / 문장 타임아웃 (이벤트는 sync_engine 에 등록)
+        install_pool_events(async_engine.sync_engine, async_pool_metrics)
+        # commit 후 속성 접근 시 지연 로딩(I/O)이 일어나지 않도록 expire_on_commit=False
+        AsyncSessionLocal = sessionmaker(
+            bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+    return async_engine
+
+
+def async_session():
+    get_async_engine()
+    return AsyncSessionLocal()
+
+
+async def get_async_db():
+    async with async_session() as db:
+        yield db
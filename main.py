@@ -1,46 +1,59 @@
 # FastAPI 및 요청 관련
-from fastapi import FastAPI, Form, Request, Depends, HTTPException, APIRouter
+from fastapi import FastAPI, Form, Request, Depends, HTTPException, APIRouter, UploadFile, File
 from fastapi.responses import (
     HTMLResponse,
     RedirectResponse,
-    StreamingResponse,
     JSONResponse,
     FileResponse,
     Response  # CSV 다운로드용
 )
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 # 미들웨어
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.concurrency import run_in_threadpool
 
 # SQLAlchemy ORM
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, text, extract, asc, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 
 # DB 모델
-from database import get_db
-from models.models import Report, ErrorReport, MspReport, LogReport, User, Client
+import database
+from database import get_db, get_async_db, pool_metrics, async_pool_metrics
+from models.models import Report, ErrorReport, MspReport, LogReport, User, Client, Job
 
 # 유틸리티
-from datetime import datetime, timedelta
-from math import ceil
 from urllib.parse import urlencode
-from collections import defaultdict
-import io
-import csv
-import re
-import tempfile
-from utils.auth import create_access_token, verify_password, get_current_user, get_password_hash
+from utils.auth import (
+    create_access_token, verify_password, get_current_user, get_password_hash,
+    user_cache, invalidate_user
+)
+from utils.natural_sort import natural_keys, natsorted
+from utils.pagination import list_page
+from utils.search import ranked_report_ids
+from utils.csv_export import csv_response
+from utils.report_import import import_reports, iter_file_rows
+from utils.report_queries import (
+    msp_list_query, error_list_query, log_list_query,
+    MSP_CSV_HEADER, msp_csv_query, msp_csv_row,
+    ERROR_CSV_HEADER, error_csv_query, error_csv_row,
+    LOG_CSV_HEADER, log_csv_query, log_csv_row
+)
+from utils.report_service import create_report, create_report_async
+from utils.stats import compute_stats, stats_clients, stats_version
+from utils import conditional, jobs, list_api, metrics, pdf_render, query_diagnostics, report_pdf, templating
+from utils.job_tasks import TASKS as JOB_TASKS
+from utils.cache import TTLCache, FragmentCache
 from starlette.status import HTTP_401_UNAUTHORIZED
 from fastapi.exception_handlers import http_exception_handler
 from typing import List
+from markupsafe import Markup
 from datetime import datetime, time as dt_time
 
 
-# 외부 라이브러리
-from natsort import natsorted
-from weasyprint import HTML  # PDF 변환
+# 무거운 선택 의존성(weasyprint, openpyxl 등)은 해당 기능 안에서만 import
+# (워커 기동 시간/메모리 — python -m scripts.bench_startup 으로 확인)
 
 # 기타
 import os  # 필요시 파일 처리용
@@ -53,11 +66,26 @@ import os  # 필요시 파일 처리용
 
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+# 템플릿 환경 1개 (바이트코드 캐시 / auto_reload 설정 — utils.templating)
+templates = templating.create_templates()
 
 app = FastAPI()
 app.add_middleware(SessionMiddleware, secret_key="supersecret123")
 
+# 고객사/시스템/환경 드롭다운 옵션 캐시 (고객사·리포트 등록/수정/삭제 시 비움)
+option_cache = TTLCache(
+    maxsize=int(os.getenv("OPTION_CACHE_SIZE", "512")),
+    ttl=float(os.getenv("OPTION_CACHE_TTL", "60"))
+)
+
+# 메인 페이지 최근 리포트 패널 (렌더링된 HTML 조각)
+# - 키에 테이블 버전 포함 → 리포트 등록/수정/삭제 시 모든 워커에서 바로 새로 렌더링
+# - MAIN_PANEL_MAX_AGE 초가 지나면 버전이 같아도 다시 렌더링 (버전을 올리지 않는 직접 SQL 변경 대비)
+panel_cache = FragmentCache(
+    maxsize=int(os.getenv("MAIN_PANEL_CACHE_SIZE", "16")),
+    ttl=float(os.getenv("MAIN_PANEL_MAX_AGE", "300"))
+)
+
 @app.exception_handler(HTTPException)
 async def custom_http_exception_handler(request: Request, exc: HTTPException):
     if exc.status_code == HTTP_401_UNAUTHORIZED:
@@ -72,33 +100,58 @@ def dashboard(request: Request, current_user: User = Depends(get_current_user)):
     })
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+metrics.install(app, templates.env)  # 응답 시간 / DB / 템플릿 계측 (/admin/metrics)
+query_diagnostics.install(app)       # 개발/테스트: 반복(N+1)/느린 쿼리 로그 (QUERY_DIAGNOSTICS)
 app.include_router(router)
 
+# (테이블, 모델, 날짜 컬럼, 내용 컬럼, 제목, 날짜 제목, 목록 URL)
+MAIN_PANELS = (
+    ("msp_report", MspReport, MspReport.request_date, MspReport.request_content, "MSP 작업관리", "요청일자", "/reports"),
+    ("error_report", ErrorReport, ErrorReport.error_start_date, ErrorReport.error_info, "장애관리", "장애발생일자", "/error_reports"),
+    ("log_report", LogReport, LogReport.log_date, LogReport.content, "일지", "작성일자", "/log_reports"),
+)
+
+def render_main_panel(db, panel):
+    table, model, date_col, content_col, title, date_label, url = panel
+    rows = db.execute(
+        select(date_col, model.client_name, model.system_name, model.manager, model.status, content_col)
+        .order_by(date_col.desc())
+        .limit(5)
+    ).all()
+    return Markup(templates.get_template("report/_latest_panel.html").render(
+        title=title, date_label=date_label, url=url, rows=rows
+    ))
+
 @app.get("/", response_class=HTMLResponse)
 def main_page(request: Request, db: Session = Depends(get_db)):
-    msp_reports = db.query(MspReport).order_by(MspReport.request_date.desc()).limit(5).all()
-    error_reports = db.query(ErrorReport).order_by(ErrorReport.error_start_date.desc()).limit(5).all()
-    log_reports = db.query(LogReport).order_by(LogReport.log_date.desc()).limit(5).all()
-    return templates.TemplateResponse("main.html", {
+    validator = conditional.validator(db, request, [panel[0] for panel in MAIN_PANELS])
+    if validator.matches(request):
+        return validator.not_modified()
+    panels = [
+        panel_cache.get_or_render((panel[0], validator.versions[panel[0]]), lambda panel=panel: render_main_panel(db, panel))
+        for panel in MAIN_PANELS
+    ]
+    return validator.apply(templates.TemplateResponse("main.html", {
         "request": request,
-        "msp_reports": msp_reports,
-        "error_reports": error_reports,
-        "log_reports": log_reports
-    })
+        "panels": panels
+    }))
 
 @app.get("/client/options")
-def get_client_options(client_name: str, db: Session = Depends(get_db)):
-    results = db.query(Client).filter(Client.client_name == client_name).all()
-    system_names = sorted({row.system_name for row in results})
-    target_envs = sorted({row.target_env for row in results})
-    target_components = sorted({row.target_component for row in results if row.target_component})
-
-    return JSONResponse({
-        "system_names": system_names,
-        "target_envs": target_envs,
-        "target_components": target_components
-    })
+def get_client_options(client_name: str, request: Request, db: Session = Depends(get_db)):
+    validator = conditional.validator(db, request, ["client"])
+    if validator.matches(request):
+        return validator.not_modified()
+    def load():
+        results = db.query(Client).filter(Client.client_name == client_name).all()
+        return {
+            "system_names": sorted({row.system_name for row in results}),
+            "target_envs": sorted({row.target_env for row in results}),
+            "target_components": sorted({row.target_component for row in results if row.target_component})
+        }
+
+    # 캐시 키에 테이블 버전 포함 → 다른 워커의 변경 후에도 ETag 와 본문이 어긋나지 않음
+    key = ("client", client_name, validator.versions["client"])
+    return validator.apply(JSONResponse(option_cache.get_or_set(key, load)))
 
 @app.get("/client", response_class=HTMLResponse)
 def client_list(request: Request, db: Session = Depends(get_db)):
@@ -121,6 +174,7 @@ def delete_client(
     if client:
         db.delete(client)
         db.commit()
+        option_cache.clear()
 
     return RedirectResponse(url="/client", status_code=303)
 
@@ -151,6 +205,7 @@ def client_create(
     )
     db.add(new_client)
     db.commit()
+    option_cache.clear()
     return RedirectResponse(url="/client", status_code=303)
 
 
@@ -180,11 +235,11 @@ def msp_form(
 @app.get("/error", response_class=HTMLResponse)
 async def error_page(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     # 고객사명 목록 조회
-    client_names = db.query(Client.client_name).distinct().all()
+    client_names = (await db.execute(select(Client.client_name).distinct())).all()
     return templates.TemplateResponse("report/error.html", {
         "request": request,
         "client_names": [c[0] for c in client_names],
@@ -194,10 +249,10 @@ async def error_page(
 @app.get("/log", response_class=HTMLResponse)
 async def log_page(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    client_names = db.query(Client.client_name).distinct().all()
+    client_names = (await db.execute(select(Client.client_name).distinct())).all()
 
     return templates.TemplateResponse("report/log.html", {
         "request": request,
@@ -288,16 +343,16 @@ async def register(
     password: str = Form(...),
     name: str = Form(...),
     email: str = Form(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    existing_user = db.query(User).filter(User.username == username).first()
+    existing_user = await db.scalar(select(User).where(User.username == username))
     if existing_user:
         return templates.TemplateResponse("login/register.html", {
             "request": request,
             "error": "이미 존재하는 아이디입니다."
         })
 
-    hashed_pw = get_password_hash(password)  # ✅ 암호화 처리
+    hashed_pw = await run_in_threadpool(get_password_hash, password)  # ✅ 암호화 처리 (스레드풀)
 
     new_user = User(
         username=username,
@@ -307,35 +362,26 @@ async def register(
         created_at=datetime.now()
     )
     db.add(new_user)
-    db.commit()
+    await db.commit()
 
     return RedirectResponse(url="/login", status_code=303)
 
 
 @app.get("/report/{report_id}", response_class=HTMLResponse)
 def report_detail_page(request: Request, report_id: int, db: Session = Depends(get_db)):
-    report_entry = db.query(Report).filter(Report.report_id == report_id).first()
-    if not report_entry:
-        raise HTTPException(status_code=404, detail="존재하지 않는 리포트ID입니다.")
-
-    report_type = report_entry.report_type
-    if report_type == "msp":
-        report = db.query(MspReport).filter(MspReport.report_id == report_id).first()
-    elif report_type == "error":
-        report = db.query(ErrorReport).filter(ErrorReport.report_id == report_id).first()
-    elif report_type == "log":
-        report = db.query(LogReport).filter(LogReport.report_id == report_id).first()
-    else:
-        raise HTTPException(status_code=400, detail="Invalid report type")
-
+    validator = conditional.validator(db, request, ["report"])
+    if validator.matches(request):
+        return validator.not_modified()
+    # 조인 상속: 공통 + 상세 테이블을 한 번에 조회해 MspReport/ErrorReport/LogReport 로 반환
+    report = db.get(Report, report_id)
     if not report:
-        raise HTTPException(status_code=404, detail="Detailed report not found")
+        raise HTTPException(status_code=404, detail="존재하지 않는 리포트ID입니다.")
 
-    return templates.TemplateResponse("report/report_detail.html", {
+    return validator.apply(templates.TemplateResponse("report/report_detail.html", {
         "request": request,
-        "report_type": report_type,
+        "report_type": report.report_type,
         "report": report
-    })
+    }))
 
 
 
@@ -360,7 +406,7 @@ async def submit_msp(
     response: str = Form(None),
     etc: str = Form(None),
     status: str = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)  # ✅ 현재 로그인 사용자 가져오기
 ):
     request_datetime = datetime.strptime(f"{request_date} {request_time}", "%Y-%m-%d %H:%M")
@@ -368,19 +414,10 @@ async def submit_msp(
     if completed_date and completed_time:
         completed_datetime = datetime.strptime(f"{completed_date} {completed_time}", "%Y-%m-%d %H:%M")
 
-    # Report 등록
-    report = Report(
+    # MspReport 등록 (report 공통 행도 같은 트랜잭션에서 INSERT, report_type="msp")
+    await create_report_async(
+        db, MspReport,
         create_by=current_user.user_id,  # ✅ user_id 직접 참조
-        report_type="msp",
-        created_at=datetime.now()
-    )
-    db.add(report)
-    db.commit()
-    db.refresh(report)
-
-    # MspReport 등록
-    msp_report = MspReport(
-        report_id=report.report_id,
         manager=manager,
         request_date=request_datetime,
         completed_date=completed_datetime,
@@ -396,8 +433,7 @@ async def submit_msp(
         etc=etc,
         status=status
     )
-    db.add(msp_report)
-    db.commit()
+    option_cache.clear()
 
     return RedirectResponse(url="/msp", status_code=303)
 
@@ -422,23 +458,15 @@ async def submit_error(
     error_reason: str = Form(None),
     action_taken: str = Form(None),
     etc: str = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)  # ✅ 추가
 ):
-    report = Report(
-        create_by=current_user.user_id,  # ✅ 세션 → JWT 기반 사용자 ID
-        report_type="error",
-        created_at=datetime.now()
-    )
-    db.add(report)
-    db.commit()
-    db.refresh(report)
-
     error_start_dt = datetime.strptime(f"{error_start_date} {start_time}", "%Y-%m-%d %H:%M") if error_start_date and start_time else None
     error_end_dt = datetime.strptime(f"{error_end_date} {end_time}", "%Y-%m-%d %H:%M") if error_end_date and end_time else None
 
-    error_report = ErrorReport(
-        report_id=report.report_id,
+    await create_report_async(
+        db, ErrorReport,
+        create_by=current_user.user_id,  # ✅ 세션 → JWT 기반 사용자 ID
         manager=manager,
         status=status,
         error_start_date=error_start_dt,
@@ -454,17 +482,18 @@ async def submit_error(
         action_taken=action_taken,
         etc=etc
     )
-    db.add(error_report)
-    db.commit()
+    option_cache.clear()
 
     return RedirectResponse(url="/error_reports", status_code=303)
 
 @app.get("/error/components")
 def get_target_components(db: Session = Depends(get_db)):
-    # 중복 제거 + NULL 제외
-    results = db.query(ErrorReport.target_component).distinct().all()
-    components = [r[0] for r in results if r[0] is not None]
-    return JSONResponse(content={"components": components})
+    def load():
+        # 중복 제거 + NULL 제외
+        results = db.query(ErrorReport.target_component).distinct().all()
+        return {"components": [r[0] for r in results if r[0] is not None]}
+
+    return JSONResponse(content=option_cache.get_or_set(("components", ""), load))
 
 
 
@@ -487,7 +516,7 @@ async def submit_log(
     completed_time: str = Form(None),
     summary: str = Form(None),
     etc: str = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     log_datetime = datetime.strptime(f"{log_date} {log_time}", "%Y-%m-%d %H:%M")
@@ -495,17 +524,9 @@ async def submit_log(
     if completed_date and completed_time:
         completed_datetime = datetime.strptime(f"{completed_date} {completed_time}", "%Y-%m-%d %H:%M")
 
-    report = Report(
+    await create_report_async(
+        db, LogReport,
         create_by=current_user.user_id,
-        report_type="log",
-        created_at=datetime.now()
-    )
-    db.add(report)
-    db.commit()
-    db.refresh(report)
-
-    log_report = LogReport(
-        report_id=report.report_id,
         log_date=log_datetime,
         client_name=client_name,
         system_name=system_name,
@@ -520,8 +541,7 @@ async def submit_log(
         summary=summary,
         etc=etc
     )
-    db.add(log_report)
-    db.commit()
+    option_cache.clear()
 
     return RedirectResponse(url="/log_reports", status_code=303)
 
@@ -579,6 +599,28 @@ async def submit_log(
 #     })
 
 
+# 일괄 가져오기 (CSV/XLSX, 내보내기와 같은 컬럼 구성) — dry_run 이면 검증 결과만 반환
+@app.post("/reports/import")
+def import_report_file(
+    report_type: str = Form(...),
+    dry_run: bool = Form(False),
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        result = import_reports(
+            database.engine, report_type, iter_file_rows(file.filename or "", file.file),
+            create_by=current_user.user_id, dry_run=dry_run
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if result.imported and not dry_run:
+        option_cache.clear()
+    # 읽기 중단: 앞부분은 저장됨 (imported / aborted.line 으로 이어서 가져올 위치 안내)
+    return JSONResponse(result.to_dict(), status_code=400 if result.aborted else 200)
+
+
 @app.get("/reports/download")
 async def download_msp_csv(
     start_date: str = "",
@@ -590,76 +632,12 @@ async def download_msp_csv(
     system_name: str = "",
     target_env: str = "",
     request_type: str = "",
-    search: str = "",
-    db: Session = Depends(get_db)
+    search: str = ""
 ):
-    query = db.query(MspReport)
-
-    if manager:
-        query = query.filter(MspReport.manager.contains(manager))
-    if requester:
-        query = query.filter(MspReport.requester.contains(requester))
-    if status:
-        query = query.filter(MspReport.status == status)
-    if client_name:
-        query = query.filter(MspReport.client_name.contains(client_name))
-    if system_name:
-        query = query.filter(MspReport.system_name.contains(system_name))
-    if target_env:
-        query = query.filter(MspReport.target_env.contains(target_env))
-    if request_type:
-        query = query.filter(MspReport.request_type.contains(request_type))
-    if start_date and end_date:
-        query = query.filter(
-            MspReport.request_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
-        )
-    if search:
-        query = query.filter(
-            MspReport.client_name.contains(search) |
-            MspReport.system_name.contains(search) |
-            MspReport.manager.contains(search)
-        )
-
-    # ✅ 최신 요청일자 기준 내림차순 정렬 추가
-    query = query.order_by(MspReport.request_date.desc())
-
-    reports = query.all()
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "요청일자", "고객사", "시스템명", "대상 환경",
-        "요청자", "요청유형", "요청내용", "참고사항",
-        "담당자", "상태", "완료일자", "답변내용", "비고"
-    ])
-
-    for r in reports:
-        writer.writerow([
-            r.request_date.strftime("%Y-%m-%d %H:%M") if r.request_date else '',
-            r.client_name or '',
-            r.system_name or '',
-            r.target_env or '',
-            r.requester or '',
-            r.request_type or '',
-            r.request_content or '',
-            r.purpose or '',
-            r.manager or '',
-            r.status or '',
-            r.completed_date.strftime("%Y-%m-%d %H:%M") if r.completed_date else '',
-            r.response or '',
-            r.etc or ''
-        ])
-
-    output.seek(0)
-    bom = '\ufeff'
-    return Response(
-        content=bom + output.getvalue(),
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": "attachment; filename=msp_reports.csv"}
-    )
-
-
-
-
+    return csv_response("msp_reports.csv", MSP_CSV_HEADER, msp_csv_query(
+        start_date, end_date, manager, requester, status, client_name,
+        system_name, target_env, request_type, search
+    ), msp_csv_row)
 
 
 @app.get("/error_reports/download")
@@ -672,75 +650,12 @@ async def download_error_csv(
     system_name: str = "",
     target_env: str = "",
     target_component: str = "",
-    search: str = "",
-    db: Session = Depends(get_db)
+    search: str = ""
 ):
-    query = db.query(ErrorReport)
-
-    if manager:
-        query = query.filter(ErrorReport.manager.contains(manager))
-    if status:
-        query = query.filter(ErrorReport.status == status)
-    if client_name:
-        query = query.filter(ErrorReport.client_name.contains(client_name))
-    if system_name:
-        query = query.filter(ErrorReport.system_name.contains(system_name))
-    if target_env:
-        query = query.filter(ErrorReport.target_env.contains(target_env))
-    if target_component:
-        query = query.filter(ErrorReport.target_component.contains(target_component))
-    if start_date and end_date:
-        query = query.filter(
-            ErrorReport.error_start_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
-        )
-    if search:
-        query = query.filter(
-            ErrorReport.client_name.contains(search) |
-            ErrorReport.system_name.contains(search) |
-            ErrorReport.manager.contains(search)
-        )
-
-    # ✅ 최신 장애일자 기준 정렬 추가
-    query = query.order_by(ErrorReport.error_start_date.desc())
-
-    reports = query.all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "장애일자", "고객사", "시스템명", "대상 환경", "장애대상", "고객 영향",
-        "장애내용", "장애원인", "조치내용", "담당자", "상태", "장애종료일자", "비고"
-    ])
-
-    for r in reports:
-        writer.writerow([
-            r.error_start_date.strftime("%Y-%m-%d %H:%M") if r.error_start_date else '',
-            r.client_name or '',
-            r.system_name or '',
-            r.target_env or '',
-            r.target_component or '',
-            r.customer_impact or '',
-            r.error_info or '',
-            r.error_reason or '',
-            r.action_taken or '',
-            r.manager or '',
-            r.status or '',
-            r.error_end_date.strftime("%Y-%m-%d %H:%M") if r.error_end_date else '',
-            r.etc or ''
-        ])
-
-    output.seek(0)
-    bom = '\ufeff'
-    return Response(
-        content=bom + output.getvalue(),
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": "attachment; filename=error_reports.csv"}
-    )
-
-
-
-
-
+    return csv_response("error_reports.csv", ERROR_CSV_HEADER, error_csv_query(
+        start_date, end_date, manager, status, client_name,
+        system_name, target_env, target_component, search
+    ), error_csv_row)
 
 
 @app.get("/log_reports/download")
@@ -753,89 +668,99 @@ async def download_log_csv(
     system_name: str = "",
     target_env: str = "",
     log_type: str = "",
-    search: str = "",
-    db: Session = Depends(get_db)
+    search: str = ""
 ):
-    query = db.query(LogReport)
-
-    if manager:
-        query = query.filter(LogReport.manager.contains(manager))
-    if status:
-        query = query.filter(LogReport.status == status)
-    if client_name:
-        query = query.filter(LogReport.client_name.contains(client_name))
-    if system_name:
-        query = query.filter(LogReport.system_name.contains(system_name))
-    if target_env:
-        query = query.filter(LogReport.target_env.contains(target_env))
-    if log_type:
-        query = query.filter(LogReport.log_type.contains(log_type))
-    if start_date and end_date:
-        query = query.filter(
-            LogReport.log_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
-        )
-    if search:
-        query = query.filter(
-            LogReport.client_name.contains(search) |
-            LogReport.system_name.contains(search) |
-            LogReport.manager.contains(search)
-        )
+    return csv_response("log_reports.csv", LOG_CSV_HEADER, log_csv_query(
+        start_date, end_date, manager, status, client_name,
+        system_name, target_env, log_type, search
+    ), log_csv_row)
+
+
+# ------------------------------------------------------------------
+# 백그라운드 작업 (utils.jobs) — 등록 후 /jobs/{job_id} 로 진행률 조회, 완료 후 /result
+#   POST /jobs/csv_export?report_type=error&status=완료&...   (CSV 다운로드와 같은 필터)
+#   POST /jobs/pdf_export?report_type=error&format=zip&...    (목록 화면과 같은 필터/정렬)
+#   POST /jobs/rollup_rebuild                                  (관리자)
+# ------------------------------------------------------------------
+@app.post("/jobs/{kind}")
+async def submit_job(
+    kind: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    task = JOB_TASKS.get(kind)
+    if task is None:
+        raise HTTPException(status_code=404, detail="알 수 없는 작업입니다.")
+    if task.admin_only and current_user.username != "admin":
+        raise HTTPException(status_code=403, detail="관리자만 실행할 수 있습니다.")
+    try:
+        job = jobs.new_job(kind, dict(request.query_params), current_user.username)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    db.add(job)
+    await db.commit()
+    jobs.notify()
+    return JSONResponse(jobs.job_to_dict(job), status_code=202)
 
-    # ✅ 최신 일자 기준 정렬 유지
-    query = query.order_by(LogReport.log_date.desc())
-
-    reports = query.all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # ✅ 헤더: 프로젝트는 system_name 값을 CSV 상에서 "프로젝트"로 표기
-    writer.writerow(["담당자", "일자", "고객사", "프로젝트", "작업내용", "특이사항"])
-
-    for r in reports:
-        writer.writerow([
-            r.manager or '',
-            r.log_date.strftime("%Y-%m-%d") if r.log_date else '',
-            r.client_name or '',
-            r.system_name or '',   # ← CSV에서는 "프로젝트"로 표기
-            r.content or '',       # ← 작업내용
-            r.etc or ''            # ← 특이사항
-        ])
-
-    output.seek(0)
-    bom = '\ufeff'
-    return Response(
-        content=bom + output.getvalue(),
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": "attachment; filename=log_reports.csv"}
+
+@app.get("/jobs")
+async def job_list(db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    result = await db.scalars(
+        select(Job).where(Job.owner == current_user.username).order_by(Job.created_at.desc()).limit(20)
     )
+    return JSONResponse({"jobs": [jobs.job_to_dict(job) for job in result]})
 
 
-@app.get("/report/{report_id}/edit")
-async def edit_report_form(request: Request, report_id: int, db: Session = Depends(get_db)):
-    report = db.query(Report).filter(Report.report_id == report_id).first()
+async def get_job_for(db, job_id, current_user):
+    job = await db.get(Job, job_id)
+    if job is None or current_user.username not in (job.owner, "admin"):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    return JSONResponse(jobs.job_to_dict(await get_job_for(db, job_id, current_user)))
+
+
+@app.get("/jobs/{job_id}/result")
+async def job_result(job_id: str, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    job = await get_job_for(db, job_id, current_user)
+    if job.status != "done" or not job.result_name:
+        raise HTTPException(status_code=409, detail="작업 결과가 아직 없습니다.")
+    if not os.path.exists(jobs.result_path(job.job_id)):
+        raise HTTPException(status_code=404, detail="결과 파일이 만료되었습니다.")
+    return FileResponse(jobs.result_path(job.job_id), filename=job.result_name)
+
+
+# 리포트 상세 1건 PDF (내용이 같으면 스풀 파일 재사용)
+@app.get("/report/{report_id}/pdf")
+async def report_detail_pdf(report_id: int, db: AsyncSession = Depends(get_async_db)):
+    report = await db.get(Report, report_id)
     if not report:
-        raise HTTPException(status_code=404, detail="리포트를 찾을 수 없습니다.")
+        raise HTTPException(status_code=404, detail="존재하지 않는 리포트ID입니다.")
+    if not pdf_render.available():
+        raise HTTPException(status_code=503, detail="PDF 변환 모듈(weasyprint)이 설치되어 있지 않습니다.")
 
-    report_type = report.report_type
-    detail = None
+    # HTML 은 스풀에 없을 때만 생성
+    path = await pdf_render.render(
+        f"report:{report_id}", report_pdf.report_version(report), lambda: report_pdf.report_html([report], templates.env)
+    )
+    return FileResponse(path, filename=f"{report.report_type}_{report_id}.pdf", media_type="application/pdf")
 
-    if report_type == "msp":
-        detail = db.query(MspReport).filter(MspReport.report_id == report_id).first()
-    elif report_type == "error":
-        detail = db.query(ErrorReport).filter(ErrorReport.report_id == report_id).first()
-    elif report_type == "log":
-        detail = db.query(LogReport).filter(LogReport.report_id == report_id).first()
-    else:
-        raise HTTPException(status_code=400, detail="알 수 없는 리포트 유형입니다.")
 
-    if not detail:
-        raise HTTPException(status_code=404, detail="상세 리포트를 찾을 수 없습니다.")
+@app.get("/report/{report_id}/edit")
+async def edit_report_form(request: Request, report_id: int, db: AsyncSession = Depends(get_async_db)):
+    report = await db.get(Report, report_id)
+    if not report:
+        raise HTTPException(status_code=404, detail="리포트를 찾을 수 없습니다.")
 
     return templates.TemplateResponse("report/report_edit.html", {
         "request": request,
-        "report": detail,
-        "report_type": report_type
+        "report": report,
+        "report_type": report.report_type
     })
 
 
@@ -844,80 +769,74 @@ async def edit_report_form(request: Request, report_id: int, db: Session = Depen
 async def report_edit(
     request: Request,
     report_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     # form 데이터는 동적으로 받기 위해 request.form() 직접 파싱할 거야
 ):
     form = await request.form()
-    report_entry = db.query(Report).filter(Report.report_id == report_id).first()
-    if not report_entry:
+    report = await db.get(Report, report_id)
+    if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    report_type = report_entry.report_type
-
-    if report_type == "msp":
-        report = db.query(MspReport).filter(MspReport.report_id == report_id).first()
-        if report:
-            report.manager = form.get("manager")
-            report.status = form.get("status")
-            report.request_date = datetime.strptime(form.get("request_date") + " " + form.get("request_time"), "%Y-%m-%d %H:%M")
-            completed_date = form.get("completed_date")
-            completed_time = form.get("completed_time")
-            if completed_date and completed_time:
-                report.completed_date = datetime.strptime(completed_date + " " + completed_time, "%Y-%m-%d %H:%M")
-            else:
-                report.completed_date = None
-            report.client_name = form.get("client_name")
-            report.system_name = form.get("system_name")
-            report.target_env = form.get("target_env")
-            report.requester = form.get("requester")
-            report.request_type = form.get("request_type")
-            report.request_content = form.get("request_content")
-            report.purpose = form.get("purpose")
-            report.response = form.get("response")
-            report.etc = form.get("etc")
-    elif report_type == "error":
-        report = db.query(ErrorReport).filter(ErrorReport.report_id == report_id).first()
-        if report:
-            report.manager = form.get("manager")
-            report.status = form.get("status")
-            report.error_start_date = datetime.strptime(form.get("error_start_date") + " " + form.get("start_time"), "%Y-%m-%d %H:%M")
-            error_end_date = form.get("error_end_date")
-            end_time = form.get("end_time")
-            if error_end_date and end_time:
-                report.error_end_date = datetime.strptime(error_end_date + " " + end_time, "%Y-%m-%d %H:%M")
-            else:
-                report.error_end_date = None
-            report.client_name = form.get("client_name")
-            report.system_name = form.get("system_name")
-            report.target_env = form.get("target_env")
-            report.target_component = form.get("target_component")
-            report.customer_impact = form.get("customer_impact")
-            report.error_info = form.get("error_info")
-            report.error_reason = form.get("error_reason")
-            report.action_taken = form.get("action_taken")
-            report.etc = form.get("etc")
-    elif report_type == "log":
-        report = db.query(LogReport).filter(LogReport.report_id == report_id).first()
-        if report:
-            report.manager = form.get("manager")
-            report.status = form.get("status")
-            report.log_date = datetime.strptime(form.get("log_date") + " " + form.get("log_time"), "%Y-%m-%d %H:%M")
-            completed_date = form.get("completed_date")
-            completed_time = form.get("completed_time")
-            if completed_date and completed_time:
-                report.completed_date = datetime.strptime(completed_date + " " + completed_time, "%Y-%m-%d %H:%M")
-            else:
-                report.completed_date = None
-            report.client_name = form.get("client_name")
-            report.system_name = form.get("system_name")
-            report.target_env = form.get("target_env")
-            report.log_type = form.get("log_type")
-            report.content = form.get("content")
-            report.action = form.get("action")
-            report.summary = form.get("summary")
-            report.etc = form.get("etc")
-
-    db.commit()
+    # 유형별 입력 필드 반영 (report 는 이미 해당 하위 타입)
+    if isinstance(report, MspReport):
+        report.manager = form.get("manager")
+        report.status = form.get("status")
+        report.request_date = datetime.strptime(form.get("request_date") + " " + form.get("request_time"), "%Y-%m-%d %H:%M")
+        completed_date = form.get("completed_date")
+        completed_time = form.get("completed_time")
+        if completed_date and completed_time:
+            report.completed_date = datetime.strptime(completed_date + " " + completed_time, "%Y-%m-%d %H:%M")
+        else:
+            report.completed_date = None
+        report.client_name = form.get("client_name")
+        report.system_name = form.get("system_name")
+        report.target_env = form.get("target_env")
+        report.requester = form.get("requester")
+        report.request_type = form.get("request_type")
+        report.request_content = form.get("request_content")
+        report.purpose = form.get("purpose")
+        report.response = form.get("response")
+        report.etc = form.get("etc")
+    elif isinstance(report, ErrorReport):
+        report.manager = form.get("manager")
+        report.status = form.get("status")
+        report.error_start_date = datetime.strptime(form.get("error_start_date") + " " + form.get("start_time"), "%Y-%m-%d %H:%M")
+        error_end_date = form.get("error_end_date")
+        end_time = form.get("end_time")
+        if error_end_date and end_time:
+            report.error_end_date = datetime.strptime(error_end_date + " " + end_time, "%Y-%m-%d %H:%M")
+        else:
+            report.error_end_date = None
+        report.client_name = form.get("client_name")
+        report.system_name = form.get("system_name")
+        report.target_env = form.get("target_env")
+        report.target_component = form.get("target_component")
+        report.customer_impact = form.get("customer_impact")
+        report.error_info = form.get("error_info")
+        report.error_reason = form.get("error_reason")
+        report.action_taken = form.get("action_taken")
+        report.etc = form.get("etc")
+    elif isinstance(report, LogReport):
+        report.manager = form.get("manager")
+        report.status = form.get("status")
+        report.log_date = datetime.strptime(form.get("log_date") + " " + form.get("log_time"), "%Y-%m-%d %H:%M")
+        completed_date = form.get("completed_date")
+        completed_time = form.get("completed_time")
+        if completed_date and completed_time:
+            report.completed_date = datetime.strptime(completed_date + " " + completed_time, "%Y-%m-%d %H:%M")
+        else:
+            report.completed_date = None
+        report.client_name = form.get("client_name")
+        report.system_name = form.get("system_name")
+        report.target_env = form.get("target_env")
+        report.log_type = form.get("log_type")
+        report.content = form.get("content")
+        report.action = form.get("action")
+        report.summary = form.get("summary")
+        report.etc = form.get("etc")
+
+    await db.commit()
+    option_cache.clear()
 
     return RedirectResponse(url=f"/report/{report_id}", status_code=303)
 
@@ -926,43 +845,29 @@ async def report_edit(
 
 # 삭제 처리
 @app.post("/report/{report_id}/delete")
-async def report_delete(report_id: int, db: Session = Depends(get_db)):
-    report_entry = db.query(Report).filter(Report.report_id == report_id).first()
-    if not report_entry:
+async def report_delete(report_id: int, db: AsyncSession = Depends(get_async_db)):
+    report = await db.get(Report, report_id)
+    if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    report_type = report_entry.report_type
-
-    # 세부 테이블 먼저 삭제
-    if report_type == "msp":
-        db.query(MspReport).filter(MspReport.report_id == report_id).delete()
-    elif report_type == "error":
-        db.query(ErrorReport).filter(ErrorReport.report_id == report_id).delete()
-    elif report_type == "log":
-        db.query(LogReport).filter(LogReport.report_id == report_id).delete()
-
-    # 그 다음 report 테이블 삭제
-    db.delete(report_entry)
-    db.commit()
+    # 상세 → 공통 테이블 순으로 함께 삭제 (ORM 삭제 → 통계 롤업/검색 인덱스 이벤트 반영)
+    await db.delete(report)
+    await db.commit()
+    option_cache.clear()
 
     # 삭제 후 목록으로 이동
-    if report_type == "msp":
-        return RedirectResponse(url="/reports", status_code=303)
-    elif report_type == "error":
-        return RedirectResponse(url="/error_reports", status_code=303)
-    elif report_type == "log":
-        return RedirectResponse(url="/log_reports", status_code=303)
+    return RedirectResponse(url=REPORT_LIST_URLS[report.report_type], status_code=303)
+
 
-from sqlalchemy import asc, desc  # 추가
+REPORT_LIST_URLS = {"msp": "/reports", "error": "/error_reports", "log": "/log_reports"}
 
-def natural_keys(text):
-    return [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', text)]
 
 @app.get("/reports", response_class=HTMLResponse)
 def report_list(
     request: Request,
     page: int = 1,
     limit: int = 10,
+    after: str = "",
     manager: str = "",
     requester: str = "",
     status: str = "",
@@ -977,64 +882,17 @@ def report_list(
     direction: str = "desc",
     db: Session = Depends(get_db)
 ):
-    offset = (page - 1) * limit
-    query = db.query(MspReport)
-
-    if requester:
-        query = query.filter(MspReport.requester.contains(requester))
-    if manager:
-        query = query.filter(MspReport.manager.contains(manager))
-    if status:
-        query = query.filter(MspReport.status == status)
-    if client_name:
-        query = query.filter(MspReport.client_name.contains(client_name))
-    if system_name:
-        query = query.filter(MspReport.system_name.contains(system_name))
-    if target_env:
-        query = query.filter(MspReport.target_env.contains(target_env))
-    if request_type:
-        query = query.filter(MspReport.request_type.contains(request_type))
-    if start_date and end_date:
-        query = query.filter(
-            MspReport.request_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
-        )
-        
-
-    # ✅ 통합검색: 여러 필드에 OR 조건으로 적용
-    from sqlalchemy import or_
-    if search:
-        keyword = f"%{search}%"
-        query = query.filter(
-            or_(
-                MspReport.client_name.like(keyword),
-                MspReport.system_name.like(keyword),
-                MspReport.manager.like(keyword),
-                MspReport.requester.like(keyword),
-                MspReport.request_type.like(keyword),
-                MspReport.request_content.like(keyword),
-                MspReport.purpose.like(keyword),
-                MspReport.response.like(keyword),
-                MspReport.etc.like(keyword),
-                MspReport.status.like(keyword)
-            )
-        )
+    validator = conditional.validator(db, request, ["msp_report"])
+    if validator.matches(request):
+        return validator.not_modified()
 
-    all_reports = query.all()
-
-    # 자연 정렬
-    natural_sort_fields = ["client_name", "system_name", "manager", "request_type", "status", "requester"]
-    if sort in natural_sort_fields:
-        all_reports.sort(key=lambda x: natural_keys(getattr(x, sort) or ""), reverse=(direction == "desc"))
-    elif hasattr(MspReport, sort):
-        all_reports.sort(key=lambda x: getattr(x, sort), reverse=(direction == "desc"))
-
-    total = len(all_reports)
-    total_pages = ceil(total / limit)
-    start_page = max(1, page - 2)
-    end_page = min(start_page + 4, total_pages)
-    start_page = max(1, end_page - 4)
+    query = msp_list_query(
+        db, manager, requester, status, client_name, system_name,
+        target_env, request_type, start_date, end_date, search
+    )
 
-    reports = all_reports[offset:offset + limit]
+    # 정렬(자연정렬은 정렬키 컬럼) + 페이징을 DB 에서 처리 (after 지정 시 커서 페이징)
+    page_data = list_page(query, MspReport, sort, direction, "request_date", page, limit, after)
 
     query_dict = {
         "manager": manager,
@@ -1054,21 +912,50 @@ def report_list(
     filtered_query = {k: v for k, v in query_dict.items() if v}
     query_string = urlencode(filtered_query)
 
-    return templates.TemplateResponse("report/report_list.html", {
+    return validator.apply(templates.TemplateResponse("report/report_list.html", {
         "request": request,
-        "reports": reports,
-        "page": page,
-        "total_pages": total_pages,
-        "start_page": start_page,
-        "end_page": end_page,
+        "reports": page_data.items,
+        "page": page_data.page,
+        "total_pages": page_data.total_pages,
+        "start_page": page_data.start_page,
+        "end_page": page_data.end_page,
         "query_string": query_string,
         "current_sort": sort,
-        "current_direction": direction
-    })
-
-
+        "current_direction": direction,
+        "cursor_mode": bool(after),
+        "next_cursor": page_data.next_cursor
+    }))
 
 
+# 목록 JSON API (열 방향 배열 + fields 선택 — utils.list_api)
+@app.get("/api/v1/msp/reports")
+def msp_reports_api(
+    request: Request,
+    page: int = 1,
+    limit: int = 10,
+    after: str = "",
+    fields: str = "",
+    manager: str = "",
+    requester: str = "",
+    status: str = "",
+    client_name: str = "",
+    system_name: str = "",
+    target_env: str = "",
+    request_type: str = "",
+    start_date: str = "",
+    end_date: str = "",
+    search: str = "",
+    sort: str = "request_date",
+    direction: str = "desc",
+    db: Session = Depends(get_db)
+):
+    query = msp_list_query(
+        db, manager, requester, status, client_name, system_name,
+        target_env, request_type, start_date, end_date, search
+    )
+    return list_api.list_response(
+        db, request, query, MspReport, sort, direction, "request_date", page, limit, after, fields
+    )
 
 
 @app.get("/error_reports", response_class=HTMLResponse)
@@ -1076,6 +963,7 @@ def error_report_list(
     request: Request,
     page: int = 1,
     limit: int = 10,
+    after: str = "",
     manager: str = "",
     status: str = "",
     client_name: str = "",
@@ -1090,59 +978,15 @@ def error_report_list(
     db: Session = Depends(get_db),
     
 ):
-    offset = (page - 1) * limit
-    query = db.query(ErrorReport)
-
-    if manager:
-        query = query.filter(ErrorReport.manager.contains(manager))
-    if status:
-        query = query.filter(ErrorReport.status == status)
-    if client_name:
-        query = query.filter(ErrorReport.client_name.contains(client_name))
-    if system_name:
-        query = query.filter(ErrorReport.system_name.contains(system_name))
-    if target_env:
-        query = query.filter(ErrorReport.target_env.contains(target_env))
-    if target_component:
-        query = query.filter(ErrorReport.target_component.contains(target_component))
-    if start_date and end_date:
-        query = query.filter(
-            ErrorReport.error_start_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
-        )
-
-    # ✅ 통합검색
-    from sqlalchemy import or_
-    if search:
-        keyword = f"%{search}%"
-        query = query.filter(
-            or_(
-                ErrorReport.client_name.like(keyword),
-                ErrorReport.system_name.like(keyword),
-                ErrorReport.manager.like(keyword),
-                ErrorReport.status.like(keyword),
-                ErrorReport.target_env.like(keyword),
-                ErrorReport.target_component.like(keyword),
-                ErrorReport.customer_impact.like(keyword),
-                ErrorReport.error_info.like(keyword),
-                ErrorReport.error_reason.like(keyword),
-                ErrorReport.action_taken.like(keyword),
-                ErrorReport.etc.like(keyword)
-            )
-        )
-
-    all_reports = query.all()
-    if sort in ["client_name", "system_name", "manager"]:
-        all_reports.sort(key=lambda x: natural_keys(getattr(x, sort) or ""), reverse=(direction == "desc"))
-    elif hasattr(ErrorReport, sort):
-        all_reports.sort(key=lambda x: getattr(x, sort), reverse=(direction == "desc"))
-
-    total = len(all_reports)
-    total_pages = ceil(total / limit)
-    start_page = max(1, page - 2)
-    end_page = min(start_page + 4, total_pages)
-    start_page = max(1, end_page - 4)
+    validator = conditional.validator(db, request, ["error_report"])
+    if validator.matches(request):
+        return validator.not_modified()
 
-    reports = all_reports[offset:offset + limit]
+    query = error_list_query(
+        db, manager, status, client_name, system_name, target_env,
+        target_component, start_date, end_date, search
+    )
+    page_data = list_page(query, ErrorReport, sort, direction, "error_start_date", page, limit, after)
 
     query_dict = {
         "manager": manager,
@@ -1159,20 +1003,48 @@ def error_report_list(
     }
     query_string = urlencode({k: v for k, v in query_dict.items() if v})
 
-    return templates.TemplateResponse("report/error_report_list.html", {
+    return validator.apply(templates.TemplateResponse("report/error_report_list.html", {
         "request": request,
-        "reports": reports,
-        "page": page,
-        "total_pages": total_pages,
-        "start_page": start_page,
-        "end_page": end_page,
+        "reports": page_data.items,
+        "page": page_data.page,
+        "total_pages": page_data.total_pages,
+        "start_page": page_data.start_page,
+        "end_page": page_data.end_page,
         "query_string": query_string,
         "current_sort": sort,
-        "current_direction": direction
-    })
-
+        "current_direction": direction,
+        "cursor_mode": bool(after),
+        "next_cursor": page_data.next_cursor
+    }))
 
 
+@app.get("/api/v1/error/reports")
+def error_reports_api(
+    request: Request,
+    page: int = 1,
+    limit: int = 10,
+    after: str = "",
+    fields: str = "",
+    manager: str = "",
+    status: str = "",
+    client_name: str = "",
+    system_name: str = "",
+    target_env: str = "",
+    target_component: str = "",
+    start_date: str = "",
+    end_date: str = "",
+    search: str = "",
+    sort: str = "error_start_date",
+    direction: str = "desc",
+    db: Session = Depends(get_db)
+):
+    query = error_list_query(
+        db, manager, status, client_name, system_name, target_env,
+        target_component, start_date, end_date, search
+    )
+    return list_api.list_response(
+        db, request, query, ErrorReport, sort, direction, "error_start_date", page, limit, after, fields
+    )
 
 
 @app.get("/log_reports", response_class=HTMLResponse)
@@ -1191,99 +1063,51 @@ def log_report_list(
     search: str = "",
     sort: str = "log_date",
     direction: str = "desc",
+    after: str = "",
     db: Session = Depends(get_db)
 ):
-    offset = (page - 1) * limit
+    validator = conditional.validator(db, request, ["log_report"])
+    if validator.matches(request):
+        return validator.not_modified()
 
     # 1) 드롭다운용 고객사 목록 (LogReport 기준, NULL/빈값 제외)
-    client_rows = (
-        db.query(LogReport.client_name)
-          .filter(LogReport.client_name.isnot(None))
-          .filter(LogReport.client_name != "")
-          .distinct()
-          .all()
-    )
-    client_names = sorted([r[0] for r in client_rows], key=natural_keys)
-
-    # 2) 드롭다운용 프로젝트명 목록
-    if client_name:
-        system_rows = (
-            db.query(LogReport.system_name)
-              .filter(LogReport.system_name.isnot(None))
-              .filter(LogReport.system_name != "")
-              .filter(LogReport.client_name == client_name)
+    #    페이지 이동마다 DISTINCT 를 다시 돌리지 않도록 log_report 테이블 버전별로 캐시
+    log_version = validator.versions["log_report"]
+
+    def load_client_names():
+        client_rows = (
+            db.query(LogReport.client_name)
+              .filter(LogReport.client_name.isnot(None))
+              .filter(LogReport.client_name != "")
               .distinct()
               .all()
         )
-    else:
-        system_rows = (
+        return sorted([r[0] for r in client_rows], key=natural_keys)
+
+    client_names = option_cache.get_or_set(("log_clients", log_version), load_client_names)
+
+    # 2) 드롭다운용 프로젝트명 목록
+    def load_system_names():
+        system_query = (
             db.query(LogReport.system_name)
               .filter(LogReport.system_name.isnot(None))
               .filter(LogReport.system_name != "")
-              .distinct()
-              .all()
-        )
-    system_names = sorted([r[0] for r in system_rows], key=natural_keys)
-
-    # 3) 목록 조회(필터)
-    query = db.query(LogReport)
-
-    if manager:
-        query = query.filter(LogReport.manager.contains(manager))
-    if status:
-        query = query.filter(LogReport.status == status)
-    if client_name:
-        query = query.filter(LogReport.client_name == client_name)  # 정확 매칭
-    if system_name:
-        query = query.filter(LogReport.system_name == system_name)  # 정확 매칭
-    if target_env:
-        query = query.filter(LogReport.target_env.contains(target_env))
-    if log_type:
-        query = query.filter(LogReport.log_type.contains(log_type))
-    if start_date and end_date:
-        query = query.filter(
-            LogReport.log_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
-        )
-
-    # 통합검색(여러 컬럼 OR)
-    from sqlalchemy import or_
-    if search:
-        keyword = f"%{search}%"
-        query = query.filter(
-            or_(
-                LogReport.client_name.like(keyword),
-                LogReport.system_name.like(keyword),
-                LogReport.manager.like(keyword),
-                LogReport.status.like(keyword),
-                LogReport.target_env.like(keyword),
-                LogReport.log_type.like(keyword),
-                LogReport.content.like(keyword),
-                LogReport.action.like(keyword),
-                LogReport.summary.like(keyword),
-                LogReport.etc.like(keyword)
-            )
         )
+        if client_name:
+            system_query = system_query.filter(LogReport.client_name == client_name)
+        return sorted([r[0] for r in system_query.distinct().all()], key=natural_keys)
 
-    # 일단 모두 가져와서(테이블 크면 ORDER BY 최적화 고려)
-    all_reports = query.all()
+    system_names = option_cache.get_or_set(("log_systems", client_name, log_version), load_system_names)
 
-    # 4) 정렬 (자연정렬 포함)
-    reverse = (direction == "desc")
-    if sort in ["client_name", "system_name", "manager"]:
-        all_reports.sort(key=lambda x: natural_keys(getattr(x, sort) or ""), reverse=reverse)
-    elif hasattr(LogReport, sort):
-        all_reports.sort(key=lambda x: getattr(x, sort), reverse=reverse)
-    else:
-        # 기본: 날짜 내림차순
-        all_reports.sort(key=lambda x: x.log_date, reverse=True)
+    # 3) 목록 조회(필터)
+    query = log_list_query(
+        db, manager, status, client_name, system_name, target_env,
+        log_type, start_date, end_date, search
+    )
 
-    # 5) 페이징
-    total = len(all_reports)
-    total_pages = ceil(total / limit) if limit > 0 else 1
-    start_page = max(1, page - 2)
-    end_page = min(start_page + 4, total_pages)
-    start_page = max(1, end_page - 4)
-    reports = all_reports[offset:offset + limit]
+    # 4) 정렬 (자연정렬은 정렬키 컬럼, 그 외 컬럼 직접 / 기본: 일자)
+    # 5) 페이징 (COUNT / LIMIT / OFFSET 모두 DB 에서, after 지정 시 커서 페이징)
+    page_data = list_page(query, LogReport, sort, direction, "log_date", page, limit, after)
 
     # 6) 쿼리스트링(정렬/페이지 제외 → 링크 중복 방지)
     query_dict = {
@@ -1302,23 +1126,113 @@ def log_report_list(
     }
     query_string = urlencode({k: v for k, v in query_dict.items() if v})
 
-    return templates.TemplateResponse("report/log_reports.html", {
+    return validator.apply(templates.TemplateResponse("report/log_reports.html", {
         "request": request,
-        "reports": reports,
-        "page": page,
-        "total_pages": total_pages,
-        "start_page": start_page,
-        "end_page": end_page,
+        "reports": page_data.items,
+        "page": page_data.page,
+        "total_pages": page_data.total_pages,
+        "start_page": page_data.start_page,
+        "end_page": page_data.end_page,
         "query_string": query_string,
         "current_sort": sort,
         "current_direction": direction,
+        "cursor_mode": bool(after),
+        "next_cursor": page_data.next_cursor,
         # ▼ 드롭다운 데이터 전달
         "client_names": client_names,
         "system_names": system_names,
+    }))
+
+
+@app.get("/api/v1/log/reports")
+def log_reports_api(
+    request: Request,
+    page: int = 1,
+    limit: int = 10,
+    after: str = "",
+    fields: str = "",
+    manager: str = "",
+    status: str = "",
+    client_name: str = "",
+    system_name: str = "",
+    target_env: str = "",
+    log_type: str = "",
+    start_date: str = "",
+    end_date: str = "",
+    search: str = "",
+    sort: str = "log_date",
+    direction: str = "desc",
+    db: Session = Depends(get_db)
+):
+    query = log_list_query(
+        db, manager, status, client_name, system_name, target_env,
+        log_type, start_date, end_date, search
+    )
+    return list_api.list_response(
+        db, request, query, LogReport, sort, direction, "log_date", page, limit, after, fields
+    )
+
+
+# 통합검색: 리포트 유형 전체에서 관련도 순 report_id 목록
+@app.get("/search")
+def search_reports(q: str = "", types: str = "msp,error,log", limit: int = 50, db: Session = Depends(get_db)):
+    models = {"msp": MspReport, "error": ErrorReport, "log": LogReport}
+    selected = [models[t] for t in types.split(",") if t in models]
+    if not q.strip() or not selected:
+        return JSONResponse({"results": []})
+
+    results = ranked_report_ids(db, selected, q.strip(), limit=min(max(limit, 1), 500))
+    return JSONResponse({
+        "results": [
+            {"report_id": report_id, "report_type": report_type, "score": score}
+            for report_id, report_type, score in results
+        ]
     })
 
 
 
+# 옵션 캐시 적중률 (TTL 조정용)
+@app.get("/admin/cache")
+def cache_stats(current_user: User = Depends(get_current_user)):
+    if current_user.username != "admin":
+        return RedirectResponse(url="/login", status_code=303)
+    return JSONResponse({
+        "option_cache": option_cache.stats(),
+        "main_panels": panel_cache.stats(),
+        "user_cache": user_cache.stats(),
+        "pdf_spool": pdf_render.spool_stats(),
+        "templates": {**templating.stats(), "render": metrics.registry.template_summary()}
+    })
+
+
+# 요청 처리 시간 계측 (Prometheus 텍스트 형식 — 관리자 또는 METRICS_TOKEN)
+@app.get("/admin/metrics")
+def prometheus_metrics(request: Request, db: Session = Depends(get_db)):
+    if not metrics.token_allowed(request):
+        current_user = get_current_user(request, db)
+        if current_user.username != "admin":
+            return RedirectResponse(url="/login", status_code=303)
+    gauges = {}
+    for prefix, pool in db_pool_snapshots().items():
+        gauges.update({f"db_{prefix}_{name}": value for name, value in pool.items() if isinstance(value, (int, float))})
+    return Response(metrics.registry.render(gauges), media_type=metrics.CONTENT_TYPE)
+
+
+# DB 커넥션 풀 현황 (checkout/overflow/대기시간) — 비동기 엔진은 생성된 뒤부터
+def db_pool_snapshots():
+    pools = {"pool": pool_metrics.snapshot(database.engine.pool)}
+    if database.async_engine is not None:
+        pools["async_pool"] = async_pool_metrics.snapshot(database.async_engine.pool)
+    return pools
+
+
+@app.get("/admin/db/pool")
+def db_pool_stats(current_user: User = Depends(get_current_user)):
+    if current_user.username != "admin":
+        return RedirectResponse(url="/login", status_code=303)
+    return JSONResponse(db_pool_snapshots())
+
+
 @app.get("/admin/users", response_class=HTMLResponse)
 def user_management_page(
     request: Request,
@@ -1362,20 +1276,22 @@ async def update_user_info(
     username: str = Form(...),
     name: str = Form(...),
     email: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.username != "admin":
         return RedirectResponse(url="/login", status_code=303)
 
-    user = db.query(User).filter(User.user_id == user_id).first()
+    user = await db.scalar(select(User).where(User.user_id == user_id))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    old_username = user.username
     user.username = username
     user.name = name
     user.email = email
-    db.commit()
+    await db.commit()
+    invalidate_user(old_username, username)
 
     return RedirectResponse(url="/admin/users", status_code=303)
 
@@ -1384,18 +1300,20 @@ async def update_user_info(
 @app.post("/admin/users/{user_id}/delete")
 async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.username != "admin":
         return RedirectResponse(url="/login", status_code=303)
 
-    user = db.query(User).filter(User.user_id == user_id).first()
+    user = await db.scalar(select(User).where(User.user_id == user_id))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    db.delete(user)
-    db.commit()
+    username = user.username
+    await db.delete(user)
+    await db.commit()
+    invalidate_user(username)
     return RedirectResponse(url="/admin/users", status_code=303)
 
 
@@ -1404,7 +1322,6 @@ async def delete_user(
 @app.get("/profile", response_class=HTMLResponse)
 async def profile(
     request: Request,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     return templates.TemplateResponse("user/profile.html", {
@@ -1430,11 +1347,11 @@ async def change_password(
     current_password: str = Form(...),
     new_password: str = Form(...),
     confirm_password: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    # 🔐 bcrypt 해시 비교
-    if not verify_password(current_password, current_user.password):
+    # 🔐 bcrypt 해시 비교 (CPU 작업 → 스레드풀, 이벤트 루프를 막지 않음)
+    if not await run_in_threadpool(verify_password, current_password, current_user.password):
         return templates.TemplateResponse("user/change_password.html", {
             "request": request,
             "error": "현재 비밀번호가 일치하지 않습니다."
@@ -1446,124 +1363,44 @@ async def change_password(
             "error": "새 비밀번호가 일치하지 않습니다."
         })
 
-    # 🔐 bcrypt 해시로 저장
-    current_user.password = get_password_hash(new_password)
-    db.commit()
+    # 🔐 bcrypt 해시로 저장 (current_user 는 캐시된 분리 객체라 세션의 행을 수정)
+    user = await db.scalar(select(User).where(User.user_id == current_user.user_id))
+    user.password = await run_in_threadpool(get_password_hash, new_password)
+    await db.commit()
+    invalidate_user(user.username)
 
     return RedirectResponse(url="/", status_code=303)
 
 
 @app.get("/admin/stats", response_class=HTMLResponse)
-def admin_stats(request: Request, db: Session = Depends(get_db)):
-    user = Depends(get_current_user)
-    if user.username != "admin":
+def admin_stats(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.username != "admin":
         return RedirectResponse(url="/login", status_code=303)
 
-    total_reports = db.query(Report).count()
-    last_7_days = datetime.today() - timedelta(days=7)
-    last_30_days = datetime.today() - timedelta(days=30)
-    recent_7 = db.query(Report).filter(Report.created_at >= last_7_days).count()
-    recent_30 = db.query(Report).filter(Report.created_at >= last_30_days).count()
-
-    # 상태 분포
-    status_counts = defaultdict(int)
-    for model in [MspReport, ErrorReport, LogReport]:
-        for row in db.query(model.status).all():
-            status_counts[row[0]] += 1
-
-    # 기업별 리포트 개수
-    client_summary = defaultdict(lambda: {"msp": 0, "error": 0, "log": 0})
-    for row in db.query(MspReport.client_name).all():
-        client_summary[row[0]]["msp"] += 1
-    for row in db.query(ErrorReport.client_name).all():
-        client_summary[row[0]]["error"] += 1
-    for row in db.query(LogReport.client_name).all():
-        client_summary[row[0]]["log"] += 1
-
-    # 담당자별 처리 현황
-    manager_counts = defaultdict(lambda: {"count": 0, "done": 0})
-    for model in [MspReport, ErrorReport, LogReport]:
-        for row in db.query(model.manager, model.status).all():
-            manager_counts[row[0]]["count"] += 1
-            if row[1] == "완료":
-                manager_counts[row[0]]["done"] += 1
-
-    # 시스템별 리포트 수
-    system_counts = defaultdict(int)
-    for model in [MspReport, ErrorReport, LogReport]:
-        for row in db.query(model.system_name).all():
-            system_counts[row[0]] += 1
-
-    # 장애 대상별 장애 건수
-    component_counts = defaultdict(int)
-    for row in db.query(ErrorReport.target_component).all():
-        if row[0]:
-            component_counts[row[0]] += 1
-
-    # ✅ 월별 리포트 수
-    from sqlalchemy import extract, func
-    monthly_counts = defaultdict(lambda: {"msp": 0, "error": 0, "log": 0})
-
-    for year, month, count in db.query(
-        extract('year', MspReport.request_date),
-        extract('month', MspReport.request_date),
-        func.count()
-    ).group_by(
-        extract('year', MspReport.request_date),
-        extract('month', MspReport.request_date)
-    ).all():
-        key = f"{int(year):04d}-{int(month):02d}"
-        monthly_counts[key]["msp"] += count
-
-    for year, month, count in db.query(
-        extract('year', ErrorReport.error_start_date),
-        extract('month', ErrorReport.error_start_date),
-        func.count()
-    ).group_by(
-        extract('year', ErrorReport.error_start_date),
-        extract('month', ErrorReport.error_start_date)
-    ).all():
-        key = f"{int(year):04d}-{int(month):02d}"
-        monthly_counts[key]["error"] += count
-
-    for year, month, count in db.query(
-        extract('year', LogReport.log_date),
-        extract('month', LogReport.log_date),
-        func.count()
-    ).group_by(
-        extract('year', LogReport.log_date),
-        extract('month', LogReport.log_date)
-    ).all():
-        key = f"{int(year):04d}-{int(month):02d}"
-        monthly_counts[key]["log"] += count
+    # 상태/기업/담당자/시스템/장애대상/월별 집계 (GROUP BY 결과만 조회)
+    stats = compute_stats(db)
 
     return templates.TemplateResponse("admin/stats.html", {
         "request": request,
-        "total_reports": total_reports,
-        "recent_7": recent_7,
-        "recent_30": recent_30,
-        "status_counts": dict(status_counts),
-        "client_summary": dict(client_summary),
-        "manager_counts": dict(manager_counts),
-        "system_counts": dict(system_counts),
-        "monthly_counts": dict(sorted(monthly_counts.items())),
-        "component_counts": dict(component_counts)  # ✅ 장애대상별 건수 추가
+        "stats": stats
     })
 
 
 @app.get("/admin/stats/client", response_class=HTMLResponse)
-def client_stats_list(request: Request, db: Session = Depends(get_db)):
-    user = Depends(get_current_user)
-    if user.username != "admin":
+def client_stats_list(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.username != "admin":
         return RedirectResponse(url="/login", status_code=303)
 
-    # msp, error, log 리포트에서 고객사 목록 추출
-    msp_clients = db.query(MspReport.client_name).distinct().all()
-    error_clients = db.query(ErrorReport.client_name).distinct().all()
-    log_clients = db.query(LogReport.client_name).distinct().all()
-
-    # set으로 중복 제거 후 정렬
-    clients = sorted(set(row[0] for row in (msp_clients + error_clients + log_clients) if row[0]))
+    # 통계 롤업 테이블에서 고객사 목록 추출
+    clients = stats_clients(db)
 
     return templates.TemplateResponse("admin/client_list.html", {
         "request": request,
@@ -1571,181 +1408,78 @@ def client_stats_list(request: Request, db: Session = Depends(get_db)):
     })
 
 @app.get("/admin/stats/client/{client_name}", response_class=HTMLResponse)
-def client_stats_detail(client_name: str, request: Request, db: Session = Depends(get_db)):
-    user = Depends(get_current_user)
-    if user.username != "admin":
+def client_stats_detail(
+    client_name: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.username != "admin":
         return RedirectResponse(url="/login", status_code=303)
 
-    # 리포트 수
-    msp_count = db.query(MspReport).filter(MspReport.client_name == client_name).count()
-    error_count = db.query(ErrorReport).filter(ErrorReport.client_name == client_name).count()
-    log_count = db.query(LogReport).filter(LogReport.client_name == client_name).count()
-    total = msp_count + error_count + log_count
-
-    # 상태 분포
-    status_counts = defaultdict(int)
-    for model in [MspReport, ErrorReport, LogReport]:
-        for row in db.query(model.status).filter(model.client_name == client_name).all():
-            status_counts[row[0]] += 1
-
-    # 시스템별 분포
-    system_counts = defaultdict(int)
-    for model in [MspReport, ErrorReport, LogReport]:
-        for row in db.query(model.system_name).filter(model.client_name == client_name).all():
-            system_counts[row[0]] += 1
-
-    # 장애 대상별 분포 (ErrorReport만)
-    component_counts = defaultdict(int)
-    for row in db.query(ErrorReport.target_component).filter(ErrorReport.client_name == client_name).all():
-        if row[0]:
-            component_counts[row[0]] += 1
-
-    # 월별 리포트 수
-    from sqlalchemy import extract, func
-    monthly_counts = defaultdict(lambda: {"msp": 0, "error": 0, "log": 0})
-
-    for year, month, count in db.query(
-        extract('year', MspReport.request_date),
-        extract('month', MspReport.request_date),
-        func.count()
-    ).filter(MspReport.client_name == client_name).group_by(
-        extract('year', MspReport.request_date),
-        extract('month', MspReport.request_date)
-    ).all():
-        key = f"{int(year):04d}-{int(month):02d}"
-        monthly_counts[key]["msp"] += count
-
-    for year, month, count in db.query(
-        extract('year', ErrorReport.error_start_date),
-        extract('month', ErrorReport.error_start_date),
-        func.count()
-    ).filter(ErrorReport.client_name == client_name).group_by(
-        extract('year', ErrorReport.error_start_date),
-        extract('month', ErrorReport.error_start_date)
-    ).all():
-        key = f"{int(year):04d}-{int(month):02d}"
-        monthly_counts[key]["error"] += count
-
-    for year, month, count in db.query(
-        extract('year', LogReport.log_date),
-        extract('month', LogReport.log_date),
-        func.count()
-    ).filter(LogReport.client_name == client_name).group_by(
-        extract('year', LogReport.log_date),
-        extract('month', LogReport.log_date)
-    ).all():
-        key = f"{int(year):04d}-{int(month):02d}"
-        monthly_counts[key]["log"] += count
+    stats = compute_stats(db, client_name=client_name)
 
     return templates.TemplateResponse("admin/client_stats.html", {
         "request": request,
         "client_name": client_name,
-        "msp_count": msp_count,
-        "error_count": error_count,
-        "log_count": log_count,
-        "total": total,
-        "status_counts": dict(status_counts),
-        "system_counts": dict(system_counts),
-        "component_counts": dict(component_counts),
-        "monthly_counts": dict(sorted(monthly_counts.items()))
+        "stats": stats
     })
 
 
 
 
-# @app.get("/admin/stats/client/{client_name}/pdf")
-# def download_client_pdf(client_name: str, request: Request, db: Session = Depends(get_db)):
-#     user = Depends(get_current_user)
-# if user.username != "admin":
-#         return RedirectResponse(url="/login", status_code=303)
-
-#     # 기존 로직과 동일하게 데이터 수집
-#     msp_count = db.query(MspReport).filter(MspReport.client_name == client_name).count()
-#     error_count = db.query(ErrorReport).filter(ErrorReport.client_name == client_name).count()
-#     log_count = db.query(LogReport).filter(LogReport.client_name == client_name).count()
-#     total = msp_count + error_count + log_count
-
-#     status_counts = defaultdict(int)
-#     for model in [MspReport, ErrorReport, LogReport]:
-#         for row in db.query(model.status).filter(model.client_name == client_name).all():
-#             status_counts[row[0]] += 1
-
-#     system_counts = defaultdict(int)
-#     for model in [MspReport, ErrorReport, LogReport]:
-#         for row in db.query(model.system_name).filter(model.client_name == client_name).all():
-#             system_counts[row[0]] += 1
-
-#     component_counts = defaultdict(int)
-#     for row in db.query(ErrorReport.target_component).filter(ErrorReport.client_name == client_name).all():
-#         if row[0]:
-#             component_counts[row[0]] += 1
-
-#     from sqlalchemy import extract
-#     monthly_counts = defaultdict(lambda: {"msp": 0, "error": 0, "log": 0})
-
-#     for year, month, count in db.query(
-#         extract('year', MspReport.request_date),
-#         extract('month', MspReport.request_date),
-#         func.count()
-#     ).filter(MspReport.client_name == client_name).group_by(
-#         extract('year', MspReport.request_date),
-#         extract('month', MspReport.request_date)
-#     ).all():
-#         key = f"{int(year):04d}-{int(month):02d}"
-#         monthly_counts[key]["msp"] += count
-
-#     for year, month, count in db.query(
-#         extract('year', ErrorReport.error_start_date),
-#         extract('month', ErrorReport.error_start_date),
-#         func.count()
-#     ).filter(ErrorReport.client_name == client_name).group_by(
-#         extract('year', ErrorReport.error_start_date),
-#         extract('month', ErrorReport.error_start_date)
-#     ).all():
-#         key = f"{int(year):04d}-{int(month):02d}"
-#         monthly_counts[key]["error"] += count
-
-#     for year, month, count in db.query(
-#         extract('year', LogReport.log_date),
-#         extract('month', LogReport.log_date),
-#         func.count()
-#     ).filter(LogReport.client_name == client_name).group_by(
-#         extract('year', LogReport.log_date),
-#         extract('month', LogReport.log_date)
-#     ).all():
-#         key = f"{int(year):04d}-{int(month):02d}"
-#         monthly_counts[key]["log"] += count
-
-#     # HTML 렌더링 → PDF
-#     html_content = templates.get_template("admin/client_stats.html").render({
-#         "request": request,
-#         "client_name": client_name,
-#         "msp_count": msp_count,
-#         "error_count": error_count,
-#         "log_count": log_count,
-#         "total": total,
-#         "status_counts": dict(status_counts),
-#         "system_counts": dict(system_counts),
-#         "component_counts": dict(component_counts),
-#         "monthly_counts": dict(sorted(monthly_counts.items()))
-#     })
+# 기업별 통계 PDF — 렌더링은 utils.pdf_render 프로세스 풀, 결과는 (고객사, 집계 버전) 별로 스풀에 캐시
+@app.get("/admin/stats/client/{client_name}/pdf")
+async def download_client_pdf(
+    client_name: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.username != "admin":
+        return RedirectResponse(url="/login", status_code=303)
+    if not pdf_render.available():
+        raise HTTPException(status_code=503, detail="PDF 변환 모듈(weasyprint)이 설치되어 있지 않습니다.")
+
+    stats = await db.run_sync(compute_stats, client_name)
+
+    def build_html():
+        return templates.get_template("admin/client_stats.html").render({
+            "request": request,
+            "client_name": client_name,
+            "stats": stats,
+            "pdf": True
+        })
+
+    path = await pdf_render.render(f"client_stats:{client_name}", stats_version(stats), build_html)
+    return FileResponse(path, filename=f"{client_name}_통계.pdf", media_type="application/pdf")
+
 
-#     with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-#         HTML(string=html_content, base_url="http://localhost:8000/static").write_pdf(tmp_file.name) # 운영시 변경 필요
-#         return FileResponse(tmp_file.name, filename=f"{client_name}_통계.pdf", media_type="application/pdf")
-# 
+@app.on_event("startup")
+def start_workers():
+    templating.warm_up(templates.env)  # 전체 템플릿 미리 로드 (첫 요청 컴파일 대기 없음)
+    jobs.start()
+
+
+@app.on_event("shutdown")
+def shutdown_workers():
+    jobs.stop()
+    pdf_render.shutdown()
 
 
 # ------------------------------------------------------------------
 # 솔리데오 옵션: 고객사 / (고객사 선택 시) 시스템/환경 목록
 # ------------------------------------------------------------------
 @app.get("/solideo/options", response_class=JSONResponse)
-def solideo_options(client: str = "", db: Session = Depends(get_db)):
+def solideo_options(request: Request, client: str = "", db: Session = Depends(get_db)):
     """
     - client 미지정: 고객사 목록 반환
     - client 지정: 해당 고객사의 시스템/환경 목록 반환
     """
-    if not client:
+    validator = conditional.validator(db, request, ["msp_report", "error_report", "log_report"])
+    if validator.matches(request):
+        return validator.not_modified()
+    def load_clients():
         clients = set()
         for cls in (MspReport, ErrorReport, LogReport):
             # .all() 결과는 튜플(값,) 이므로 c[0] 형태
@@ -1753,34 +1487,42 @@ def solideo_options(client: str = "", db: Session = Depends(get_db)):
                 if c[0]:
                     clients.add(c[0].strip())
         # 자연 정렬
-        return JSONResponse({"clients": natsorted(clients), "systems": [], "envs": []})
+        return {"clients": natsorted(clients), "systems": [], "envs": []}
 
-    # 특정 고객사일 때
-    systems, envs = set(), set()
+    def load_systems():
+        systems, envs = set(), set()
 
-    for cls in (MspReport, ErrorReport, LogReport):
-        for s in (
-            db.query(cls.system_name)
-              .filter(cls.client_name == client)
-              .distinct()
-              .all()
-        ):
-            if s[0]:
-                systems.add(s[0].strip())
-        for e in (
-            db.query(cls.target_env)
-              .filter(cls.client_name == client)
-              .distinct()
-              .all()
-        ):
-            if e[0]:
-                envs.add(e[0].strip())
+        for cls in (MspReport, ErrorReport, LogReport):
+            for s in (
+                db.query(cls.system_name)
+                  .filter(cls.client_name == client)
+                  .distinct()
+                  .all()
+            ):
+                if s[0]:
+                    systems.add(s[0].strip())
+            for e in (
+                db.query(cls.target_env)
+                  .filter(cls.client_name == client)
+                  .distinct()
+                  .all()
+            ):
+                if e[0]:
+                    envs.add(e[0].strip())
+
+        return {
+            "clients": [],
+            "systems": natsorted(systems),
+            "envs": natsorted(envs),
+        }
+
+    # 캐시 키에 테이블 버전 포함 → 다른 워커의 변경 후에도 ETag 와 본문이 어긋나지 않음
+    versions = tuple(validator.versions.values())
+    if not client:
+        return validator.apply(JSONResponse(option_cache.get_or_set(("solideo", "", versions), load_clients)))
 
-    return JSONResponse({
-        "clients": [],
-        "systems": natsorted(systems),
-        "envs": natsorted(envs),
-    })
+    # 특정 고객사일 때
+    return validator.apply(JSONResponse(option_cache.get_or_set(("solideo", client, versions), load_systems)))
 
 
 # ------------------------------------------------------------------
@@ -1838,7 +1580,8 @@ def solideo_submit(
     time_slot_str = ",".join(time_slot_list)
 
     # --- 저장 ---
-    item = LogReport(
+    create_report(
+        db, LogReport,
         log_date=log_dt,
         client_name=(client_name.strip() or None),
         system_name=(system_name.strip() or None),
@@ -1851,8 +1594,7 @@ def solideo_submit(
         summary=summary.strip(),
         etc=time_slot_str                          # 체크박스 선택값 보관
     )
-    db.add(item)
-    db.commit()
+    option_cache.clear()
 
     return RedirectResponse(url="/", status_code=303)
 
@@ -1861,19 +1603,22 @@ def solideo_submit(
 # 고객사/시스템/환경 옵션 (기존 리포트에서 distinct 추출)
 @app.get("/leave/options", response_class=JSONResponse)
 def leave_options(client: str = "", db: Session = Depends(get_db)):
-    clients, systems, envs = set(), set(), set()
-    if not client:
+    def load():
+        clients, systems, envs = set(), set(), set()
+        if not client:
+            for cls in (MspReport, ErrorReport, LogReport):
+                for c in db.query(cls.client_name).distinct():
+                    if c[0]: clients.add(c[0])
+            return {"clients": sorted(clients), "systems": [], "envs": []}
+
         for cls in (MspReport, ErrorReport, LogReport):
-            for c in db.query(cls.client_name).distinct():
-                if c[0]: clients.add(c[0])
-        return JSONResponse({"clients": sorted(clients), "systems": [], "envs": []})
+            for s in db.query(cls.system_name).filter(cls.client_name == client).distinct():
+                if s[0]: systems.add(s[0])
+            for e in db.query(cls.target_env).filter(cls.client_name == client).distinct():
+                if e[0]: envs.add(e[0])
+        return {"clients": [], "systems": sorted(systems), "envs": sorted(envs)}
 
-    for cls in (MspReport, ErrorReport, LogReport):
-        for s in db.query(cls.system_name).filter(cls.client_name == client).distinct():
-            if s[0]: systems.add(s[0])
-        for e in db.query(cls.target_env).filter(cls.client_name == client).distinct():
-            if e[0]: envs.add(e[0])
-    return JSONResponse({"clients": [], "systems": sorted(systems), "envs": sorted(envs)})
+    return JSONResponse(option_cache.get_or_set(("leave", client), load))
 
 # 폼 보기
 @app.get("/leave/comp/new", response_class=HTMLResponse)
@@ -1915,7 +1660,8 @@ def leave_comp_submit(
         raise HTTPException(status_code=400, detail="완료일시가 시작일시 이후여야 합니다.")
 
     # 저장 매핑 (새 컬럼 추가 없이 운영)
-    item = LogReport(
+    create_report(
+        db, LogReport,
         log_date=start_dt,            # 시작일시
         completed_date=end_dt,        # 완료일시
         client_name=client_name or None,
@@ -1929,8 +1675,7 @@ def leave_comp_submit(
         action=(memo.strip() or None),
         etc=f"start_time={start_time.strip()},end_time={end_time.strip()}"
     )
-    db.add(item)
-    db.commit()
+    option_cache.clear()
     return RedirectResponse(url="/", status_code=303)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
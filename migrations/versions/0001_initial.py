@@ -0,0 +1,109 @@
+"""initial schema (user, report, msp/error/log report, client)
+
+기존 운영 DB 의 스키마 그대로 — 운영 DB 는 alembic stamp 0001_initial 후 upgrade head
+(정렬키 컬럼 0002, 통계 롤업 0003 부터 순서대로 적용)
+
+Revision ID: 0001_initial
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_initial"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "user",
+        sa.Column("user_id", sa.Integer, primary_key=True),
+        sa.Column("username", sa.String(50), nullable=False, unique=True),
+        sa.Column("password", sa.String(255), nullable=False),
+        sa.Column("name", sa.String(50), nullable=False),
+        sa.Column("email", sa.String(100)),
+        sa.Column("created_at", sa.DateTime),
+    )
+    op.create_index("ix_user_user_id", "user", ["user_id"])
+
+    op.create_table(
+        "report",
+        sa.Column("report_id", sa.Integer, primary_key=True),
+        sa.Column("create_by", sa.Integer, sa.ForeignKey("user.user_id")),
+        sa.Column("report_type", sa.String(10)),
+        sa.Column("created_at", sa.DateTime),
+    )
+    op.create_index("ix_report_report_id", "report", ["report_id"])
+
+    op.create_table(
+        "msp_report",
+        sa.Column("report_id", sa.Integer, sa.ForeignKey("report.report_id"), primary_key=True),
+        sa.Column("request_date", sa.DateTime),
+        sa.Column("completed_date", sa.DateTime),
+        sa.Column("client_name", sa.String(50)),
+        sa.Column("system_name", sa.String(50)),
+        sa.Column("target_env", sa.String(10)),
+        sa.Column("requester", sa.String(10)),
+        sa.Column("request_type", sa.String(20)),
+        sa.Column("request_content", sa.Text),
+        sa.Column("purpose", sa.Text),
+        sa.Column("manager", sa.String(10)),
+        sa.Column("status", sa.String(10)),
+        sa.Column("response", sa.Text),
+        sa.Column("etc", sa.Text),
+        sa.Column("cloud_type", sa.String(50)),
+    )
+
+    op.create_table(
+        "error_report",
+        sa.Column("report_id", sa.Integer, sa.ForeignKey("report.report_id"), primary_key=True),
+        sa.Column("error_start_date", sa.DateTime),
+        sa.Column("client_name", sa.String(50)),
+        sa.Column("system_name", sa.String(50)),
+        sa.Column("target_env", sa.String(10)),
+        sa.Column("target_component", sa.String(50)),
+        sa.Column("customer_impact", sa.Text),
+        sa.Column("error_info", sa.Text),
+        sa.Column("error_reason", sa.Text),
+        sa.Column("action_taken", sa.Text),
+        sa.Column("manager", sa.String(10)),
+        sa.Column("status", sa.String(10)),
+        sa.Column("error_end_date", sa.DateTime),
+        sa.Column("etc", sa.Text),
+        sa.Column("cloud_type", sa.String(50)),
+    )
+
+    op.create_table(
+        "log_report",
+        sa.Column("report_id", sa.Integer, sa.ForeignKey("report.report_id"), primary_key=True),
+        sa.Column("log_date", sa.DateTime),
+        sa.Column("client_name", sa.String(50)),
+        sa.Column("system_name", sa.String(50)),
+        sa.Column("target_env", sa.String(10)),
+        sa.Column("log_type", sa.String(20)),
+        sa.Column("content", sa.Text),
+        sa.Column("action", sa.Text),
+        sa.Column("manager", sa.String(10)),
+        sa.Column("status", sa.String(10)),
+        sa.Column("completed_date", sa.DateTime),
+        sa.Column("summary", sa.Text),
+        sa.Column("etc", sa.Text),
+        sa.Column("cloud_type", sa.String(50)),
+    )
+
+    op.create_table(
+        "client",
+        sa.Column("client_id", sa.Integer, primary_key=True),
+        sa.Column("client_name", sa.String(100)),
+        sa.Column("system_name", sa.String(50)),
+        sa.Column("target_env", sa.String(10)),
+        sa.Column("target_component", sa.String(50)),
+        sa.Column("cloud_type", sa.String(50)),
+    )
+
+
+def downgrade():
+    for table in ("client", "log_report", "error_report", "msp_report", "report", "user"):
+        op.drop_table(table)
@@ -0,0 +1,83 @@
+"""natural-sort key columns + indexes for msp/error/log report lists, backfilled
+
+utils.natural_sort 의 정렬키를 컬럼으로 저장 (목록 정렬을 DB ORDER BY 로 처리)
+- 이미 scripts.backfill_sort_keys 로 컬럼/인덱스를 만든 DB 는 없는 것만 추가
+- 값은 항상 다시 채움 (report_id 순 배치)
+
+Revision ID: 0002_sort_key_columns
+Revises: 0001_initial
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from utils.natural_sort import natural_sort_key
+
+revision = "0002_sort_key_columns"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+SortKey = sa.String(255).with_variant(mysql.VARCHAR(255, collation="utf8mb4_bin"), "mysql")
+
+SORT_FIELDS = {
+    "msp_report": ("client_name", "system_name", "manager", "request_type", "status", "requester"),
+    "error_report": ("client_name", "system_name", "manager"),
+    "log_report": ("client_name", "system_name", "manager"),
+}
+
+BATCH_SIZE = 1000
+
+
+def _backfill(bind, table_name, fields):
+    table = sa.table(
+        table_name,
+        sa.column("report_id"),
+        *[sa.column(f) for f in fields],
+        *[sa.column(f"{f}_sort_key") for f in fields],
+    )
+    stmt = (
+        sa.update(table)
+        .where(table.c.report_id == sa.bindparam("_id"))
+        .values({f"{f}_sort_key": sa.bindparam(f"{f}_sort_key") for f in fields})
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.report_id, *[table.c[f] for f in fields])
+            .where(table.c.report_id > last_id)
+            .order_by(table.c.report_id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(stmt, [
+            {"_id": row[0], **{f"{f}_sort_key": natural_sort_key(v) for f, v in zip(fields, row[1:])}}
+            for row in rows
+        ])
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    bind = op.get_bind()
+    insp = sa.inspect(bind)
+    for table_name, fields in SORT_FIELDS.items():
+        columns = {c["name"] for c in insp.get_columns(table_name)}
+        indexes = {ix["name"] for ix in insp.get_indexes(table_name)}
+        for field in fields:
+            column = f"{field}_sort_key"
+            if column not in columns:
+                op.add_column(table_name, sa.Column(column, SortKey))
+            if f"ix_{table_name}_{column}" not in indexes:
+                op.create_index(f"ix_{table_name}_{column}", table_name, [column])
+        _backfill(bind, table_name, fields)
+
+
+def downgrade():
+    for table_name, fields in SORT_FIELDS.items():
+        for field in fields:
+            op.drop_index(f"ix_{table_name}_{field}_sort_key", table_name=table_name)
+        with op.batch_alter_table(table_name) as batch:
+            for field in fields:
+                batch.drop_column(f"{field}_sort_key")
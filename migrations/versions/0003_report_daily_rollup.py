@@ -0,0 +1,57 @@
+"""report_daily_rollup (statistics rollup) table, filled from existing reports
+
+utils.rollup / utils.stats — 통계 화면은 이 테이블만 조회
+- 이미 scripts.rebuild_rollup 으로 테이블을 만든 DB 는 생성을 건너뜀
+  (day 가 NULL 허용인 이전 구조면 다시 생성 — 일자 없는 리포트는 utils.rollup.NO_DAY)
+- 내용은 항상 원본 리포트 테이블에서 전체 재계산
+
+Revision ID: 0003_report_daily_rollup
+Revises: 0002_sort_key_columns
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from models.models import ReportDailyRollup
+from utils.rollup import rebuild
+from utils.stats import REPORT_MODELS
+
+revision = "0003_report_daily_rollup"
+down_revision = "0002_sort_key_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    insp = sa.inspect(bind)
+    if insp.has_table("report_daily_rollup"):
+        day = next(c for c in insp.get_columns("report_daily_rollup") if c["name"] == "day")
+        if day["nullable"]:
+            # 내용은 아래에서 전체 재계산하므로 그대로 버리고 다시 생성
+            op.drop_table("report_daily_rollup")
+    if not sa.inspect(bind).has_table("report_daily_rollup"):
+        op.create_table(
+            "report_daily_rollup",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("day", sa.Date, nullable=False),
+            sa.Column("report_type", sa.String(10), nullable=False),
+            sa.Column("client_name", sa.String(100), nullable=False),
+            sa.Column("system_name", sa.String(50), nullable=False),
+            sa.Column("manager", sa.String(10), nullable=False),
+            sa.Column("status", sa.String(10), nullable=False),
+            sa.Column("target_component", sa.String(50), nullable=False),
+            sa.Column("report_count", sa.Integer, nullable=False),
+            sa.UniqueConstraint(
+                "day", "report_type", "client_name", "system_name", "manager", "status", "target_component",
+                name="uq_report_daily_rollup"
+            ),
+        )
+        op.create_index("ix_report_daily_rollup_client_day", "report_daily_rollup", ["client_name", "day"])
+
+    # 상세 테이블의 날짜/분류 컬럼만 읽음 (0001 스키마에 모두 있음)
+    rebuild(bind, ReportDailyRollup.__table__, REPORT_MODELS)
+
+
+def downgrade():
+    op.drop_table("report_daily_rollup")
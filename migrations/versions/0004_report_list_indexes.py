@@ -0,0 +1,51 @@
+"""composite indexes for report list filters, date ranges and ORDER BY
+
+목록 쿼리(main.py *_list_query + utils.pagination.apply_sort) 형태 기준
+- 기본 정렬: 날짜 DESC, report_id DESC          → (date, report_id)
+- 상태 일치 + 날짜 범위/정렬                   → (status, date)
+- 고객사/시스템 일치(로그) + 날짜               → (client_name, date), (system_name, date)
+- 부분일치(contains → LIKE '%x%') 필터 컬럼은 인덱스를 만들지 않음 (선두 컬럼으로 쓸 수 없음)
+  → MSP/장애 고객사·담당자·장애대상, 일지 유형: (date, report_id) 인덱스 순서로 읽으며 필터
+
+Revision ID: 0004_report_list_indexes
+Revises: 0003_report_daily_rollup
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_report_list_indexes"
+down_revision = "0003_report_daily_rollup"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_report_report_type", "report", ["report_type"]),
+
+    ("ix_msp_report_date", "msp_report", ["request_date", "report_id"]),
+    ("ix_msp_report_status_date", "msp_report", ["status", "request_date"]),
+
+    ("ix_error_report_date", "error_report", ["error_start_date", "report_id"]),
+    ("ix_error_report_status_date", "error_report", ["status", "error_start_date"]),
+
+    ("ix_log_report_date", "log_report", ["log_date", "report_id"]),
+    ("ix_log_report_client_date", "log_report", ["client_name", "log_date"]),
+    ("ix_log_report_system_date", "log_report", ["system_name", "log_date"]),
+    ("ix_log_report_status_date", "log_report", ["status", "log_date"]),
+)
+
+
+def upgrade():
+    # scripts.backfill_sort_keys 는 모델의 인덱스를 모두 만들므로 이미 있는 인덱스는 건너뜀
+    insp = sa.inspect(op.get_bind())
+    existing = {}
+    for name, table, columns in INDEXES:
+        if table not in existing:
+            existing[table] = {ix["name"] for ix in insp.get_indexes(table)}
+        if name not in existing[table]:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,40 @@
+"""background job queue table (utils.jobs)
+
+Revision ID: 0005_job_queue
+Revises: 0004_report_list_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_job_queue"
+down_revision = "0004_report_list_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "job",
+        sa.Column("job_id", sa.String(32), primary_key=True),
+        sa.Column("kind", sa.String(30), nullable=False),
+        sa.Column("params", sa.Text),
+        sa.Column("status", sa.String(10), nullable=False),
+        sa.Column("progress", sa.Integer, nullable=False),
+        sa.Column("total", sa.Integer),
+        sa.Column("result_name", sa.String(255)),
+        sa.Column("error", sa.Text),
+        sa.Column("owner", sa.String(50)),
+        sa.Column("created_at", sa.DateTime),
+        sa.Column("started_at", sa.DateTime),
+        sa.Column("updated_at", sa.DateTime),
+        sa.Column("finished_at", sa.DateTime),
+        sa.Column("expires_at", sa.DateTime),
+    )
+    op.create_index("ix_job_status_created", "job", ["status", "created_at"])
+    op.create_index("ix_job_owner_created", "job", ["owner", "created_at"])
+    op.create_index("ix_job_expires_at", "job", ["expires_at"])
+
+
+def downgrade():
+    op.drop_table("job")
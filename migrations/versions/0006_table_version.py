@@ -0,0 +1,26 @@
+"""per-table data versions for conditional GET (utils.versions / utils.conditional)
+
+Revision ID: 0006_table_version
+Revises: 0005_job_queue
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_table_version"
+down_revision = "0005_job_queue"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "table_version",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("version", sa.Integer, nullable=False),
+        sa.Column("updated_at", sa.DateTime),
+    )
+
+
+def downgrade():
+    op.drop_table("table_version")
@@ -1,7 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Text, UniqueConstraint, Index, event, inspect
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import relationship, Session
 from datetime import datetime
 from database import Base
+from utils.natural_sort import natural_sort_key, sort_key_column
+from utils.search import index_report, unindex_report
+from utils.rollup import DIMENSIONS, rollup_key, apply_delta
+from utils.versions import bump, flushed_tables
+
+# 자연정렬 키 컬럼: 코드포인트 순으로 비교해야 하므로 MySQL 에서는 바이너리 collation 사용
+SortKey = String(255).with_variant(mysql.VARCHAR(255, collation="utf8mb4_bin"), "mysql")
 
 class User(Base):
     __tablename__ = "user"
@@ -17,16 +25,22 @@ class User(Base):
 
 
 class Report(Base):
+    """
+    리포트 공통 행 — report_type 으로 MspReport/ErrorReport/LogReport 를 구분하는 조인 테이블 상속
+    db.get(Report, id) 한 번(LEFT OUTER JOIN)으로 해당 하위 타입 객체가 바로 로드됨
+    """
     __tablename__ = "report"
 
     report_id = Column(Integer, primary_key=True, index=True)
     create_by = Column(Integer, ForeignKey("user.user_id"))
-    report_type = Column(String(10))
+    report_type = Column(String(10), index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     creator = relationship("User", back_populates="reports")
 
-class MspReport(Base):
+    __mapper_args__ = {"polymorphic_on": report_type}
+
+class MspReport(Report):
     __tablename__ = "msp_report"
 
     report_id = Column(Integer, ForeignKey("report.report_id"), primary_key=True)
@@ -45,10 +59,34 @@ class MspReport(Base):
     etc = Column(Text)
     cloud_type = Column(String(50))
 
-    report = relationship("Report")
+    __report_type__ = "msp"
+    # Report 조회 시 하위 테이블까지 같은 쿼리로 로드 (inline)
+    __mapper_args__ = {"polymorphic_identity": "msp", "polymorphic_load": "inline"}
+    __date_column__ = "request_date"
+    # 통합검색 대상 컬럼
+    __search_columns__ = (
+        "client_name", "system_name", "manager", "requester", "request_type",
+        "request_content", "purpose", "response", "etc", "status"
+    )
+
+    # 자연정렬 키 (목록 정렬을 DB ORDER BY 로 처리)
+    __natural_sort__ = ("client_name", "system_name", "manager", "request_type", "status", "requester")
+    client_name_sort_key = Column(SortKey, index=True)
+    system_name_sort_key = Column(SortKey, index=True)
+    manager_sort_key = Column(SortKey, index=True)
+    request_type_sort_key = Column(SortKey, index=True)
+    status_sort_key = Column(SortKey, index=True)
+    requester_sort_key = Column(SortKey, index=True)
 
+    # 목록 필터 + 날짜 범위/정렬 (migrations 0004)
+    # 고객사/담당자 등 부분일치(LIKE '%x%') 필터는 인덱스를 쓸 수 없으므로 날짜 인덱스 순서로 조회
+    __table_args__ = (
+        Index("ix_msp_report_date", "request_date", "report_id"),
+        Index("ix_msp_report_status_date", "status", "request_date"),
+    )
 
-class ErrorReport(Base):
+
+class ErrorReport(Report):
     __tablename__ = "error_report"
 
     report_id = Column(Integer, ForeignKey("report.report_id"), primary_key=True)
@@ -67,11 +105,29 @@ class ErrorReport(Base):
     etc = Column(Text)
     cloud_type = Column(String(50))
 
-    report = relationship("Report")
+    __report_type__ = "error"
+    # Report 조회 시 하위 테이블까지 같은 쿼리로 로드 (inline)
+    __mapper_args__ = {"polymorphic_identity": "error", "polymorphic_load": "inline"}
+    __date_column__ = "error_start_date"
+    __search_columns__ = (
+        "client_name", "system_name", "manager", "status", "target_env", "target_component",
+        "customer_impact", "error_info", "error_reason", "action_taken", "etc"
+    )
+
+    # 자연정렬 키
+    __natural_sort__ = ("client_name", "system_name", "manager")
+    client_name_sort_key = Column(SortKey, index=True)
+    system_name_sort_key = Column(SortKey, index=True)
+    manager_sort_key = Column(SortKey, index=True)
 
+    __table_args__ = (
+        Index("ix_error_report_date", "error_start_date", "report_id"),
+        Index("ix_error_report_status_date", "status", "error_start_date"),
+    )
 
 
-class LogReport(Base):
+
+class LogReport(Report):
     __tablename__ = "log_report"
 
     report_id = Column(Integer, ForeignKey("report.report_id"), primary_key=True)
@@ -89,7 +145,27 @@ class LogReport(Base):
     etc = Column(Text)
     cloud_type = Column(String(50))
 
-    report = relationship("Report")
+    __report_type__ = "log"
+    # Report 조회 시 하위 테이블까지 같은 쿼리로 로드 (inline)
+    __mapper_args__ = {"polymorphic_identity": "log", "polymorphic_load": "inline"}
+    __date_column__ = "log_date"
+    __search_columns__ = (
+        "client_name", "system_name", "manager", "status", "target_env", "log_type",
+        "content", "action", "summary", "etc"
+    )
+
+    # 자연정렬 키
+    __natural_sort__ = ("client_name", "system_name", "manager")
+    client_name_sort_key = Column(SortKey, index=True)
+    system_name_sort_key = Column(SortKey, index=True)
+    manager_sort_key = Column(SortKey, index=True)
+
+    __table_args__ = (
+        Index("ix_log_report_date", "log_date", "report_id"),
+        Index("ix_log_report_client_date", "client_name", "log_date"),
+        Index("ix_log_report_system_date", "system_name", "log_date"),
+        Index("ix_log_report_status_date", "status", "log_date"),
+    )
 
 class Client(Base):
     __tablename__ = 'client'
@@ -99,4 +175,124 @@ class Client(Base):
     system_name = Column(String(50))
     target_env = Column(String(10))
     target_component = Column(String(50))
-    cloud_type = Column(String(50))
\ No newline at end of file
+    cloud_type = Column(String(50))
+
+
+class ReportDailyRollup(Base):
+    """일자/유형/고객사/시스템/담당자/상태/장애대상별 리포트 건수 (통계용 집계 테이블)"""
+    __tablename__ = "report_daily_rollup"
+
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False)  # 일자 없는 리포트는 utils.rollup.NO_DAY (NULL 은 유니크 키로 합쳐지지 않음)
+    report_type = Column(String(10), nullable=False)
+    client_name = Column(String(100), nullable=False, default="")
+    system_name = Column(String(50), nullable=False, default="")
+    manager = Column(String(10), nullable=False, default="")
+    status = Column(String(10), nullable=False, default="")
+    target_component = Column(String(50), nullable=False, default="")
+    report_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "day", "report_type", "client_name", "system_name", "manager", "status", "target_component",
+            name="uq_report_daily_rollup"
+        ),
+        Index("ix_report_daily_rollup_client_day", "client_name", "day"),
+    )
+
+
+class TableVersion(Base):
+    """테이블별 데이터 버전 — 변경 시 +1 (조회 화면 ETag, utils.versions / utils.conditional)"""
+    __tablename__ = "table_version"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime)
+
+
+class Job(Base):
+    """백그라운드 작업 큐 (utils.jobs) — CSV 내보내기 / 통계 롤업 재계산 등"""
+    __tablename__ = "job"
+
+    job_id = Column(String(32), primary_key=True)
+    kind = Column(String(30), nullable=False)
+    params = Column(Text)                                           # JSON
+    status = Column(String(10), nullable=False, default="queued")  # queued / running / done / failed
+    progress = Column(Integer, nullable=False, default=0)
+    total = Column(Integer)
+    result_name = Column(String(255))                               # 다운로드 파일 이름 (결과 파일이 있을 때)
+    error = Column(Text)
+    owner = Column(String(50))                                      # 등록한 사용자 username
+    created_at = Column(DateTime, default=datetime.now)
+    started_at = Column(DateTime)
+    updated_at = Column(DateTime)                                   # 실행 중 주기적으로 갱신 (워커 생존 확인)
+    finished_at = Column(DateTime)
+    expires_at = Column(DateTime)                                   # 이 시각 이후 결과 파일과 함께 삭제
+
+    __table_args__ = (
+        Index("ix_job_status_created", "status", "created_at"),
+        Index("ix_job_owner_created", "owner", "created_at"),
+        Index("ix_job_expires_at", "expires_at"),
+    )
+
+
+# 저장 시 자연정렬 키 자동 갱신 (등록/수정 모든 ORM 경로 공통)
+def _fill_sort_keys(mapper, connection, target):
+    for field in target.__natural_sort__:
+        setattr(target, sort_key_column(field), natural_sort_key(getattr(target, field)))
+
+
+for _model in (MspReport, ErrorReport, LogReport):
+    event.listen(_model, "before_insert", _fill_sort_keys)
+    event.listen(_model, "before_update", _fill_sort_keys)
+    # SQLite 검색 인덱스(FTS5) 동기화
+    event.listen(_model, "after_insert", index_report)
+    event.listen(_model, "after_update", index_report)
+    event.listen(_model, "after_delete", unindex_report)
+
+
+# 통계 롤업 증감 (등록 +1 / 삭제 -1 / 수정 시 키가 바뀌면 이전 키 -1, 새 키 +1)
+def _rollup_values(target):
+    return {c.key: getattr(target, c.key) for c in target.__table__.columns}
+
+
+def _rollup_insert(mapper, connection, target):
+    apply_delta(connection, ReportDailyRollup.__table__, rollup_key(type(target), _rollup_values(target)), 1)
+
+
+def _rollup_update(mapper, connection, target):
+    state = inspect(target)
+    old_values = {}
+    for c in target.__table__.columns:
+        history = state.attrs[c.key].history
+        old_values[c.key] = history.deleted[0] if history.deleted else getattr(target, c.key)
+
+    old_key = rollup_key(type(target), old_values)
+    new_key = rollup_key(type(target), _rollup_values(target))
+    if old_key != new_key:
+        apply_delta(connection, ReportDailyRollup.__table__, old_key, -1)
+        apply_delta(connection, ReportDailyRollup.__table__, new_key, 1)
+
+
+def _rollup_delete(mapper, connection, target):
+    apply_delta(connection, ReportDailyRollup.__table__, rollup_key(type(target), _rollup_values(target)), -1)
+
+
+def _keep_old_value(target, value, oldvalue, initiator):
+    pass
+
+
+for _model in (MspReport, ErrorReport, LogReport):
+    event.listen(_model, "after_insert", _rollup_insert)
+    event.listen(_model, "before_update", _rollup_update)
+    event.listen(_model, "after_delete", _rollup_delete)
+    # 롤업 키 컬럼은 값 변경 시 이전 값을 항상 기록 (commit 후 만료된 속성을 바로 수정해도 이전 키 -1 가능)
+    for _name in (_model.__date_column__,) + DIMENSIONS:
+        if _name in _model.__table__.columns:
+            event.listen(getattr(_model, _name), "set", _keep_old_value, active_history=True)
+
+
+# 리포트/고객사 변경 시 테이블 버전 +1 (같은 트랜잭션)
+@event.listens_for(Session, "after_flush")
+def _bump_versions(session, flush_context):
+    bump(session.connection(), TableVersion.__table__, flushed_tables(session))
@@ -0,0 +1,66 @@
+# scripts/backfill_sort_keys.py
+#
+# 기존 DB 에 자연정렬 키 컬럼/인덱스를 추가하고 값을 채움
+#   python -m scripts.backfill_sort_keys
+
+from sqlalchemy import inspect, select, update, bindparam, text
+
+from database import engine
+from models.models import MspReport, ErrorReport, LogReport
+from utils.natural_sort import natural_sort_key, sort_key_column
+
+BATCH_SIZE = 1000
+
+
+def ensure_columns(conn, model):
+    table = model.__table__
+    existing = {c["name"] for c in inspect(conn).get_columns(table.name)}
+    for field in model.__natural_sort__:
+        column = table.c[sort_key_column(field)]
+        if column.name not in existing:
+            col_type = column.type.compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}"))
+    for index in table.indexes:
+        index.create(conn, checkfirst=True)
+
+
+def backfill(conn, model):
+    table = model.__table__
+    fields = model.__natural_sort__
+    stmt = (
+        update(table)
+        .where(table.c.report_id == bindparam("_id"))
+        .values({sort_key_column(f): bindparam(sort_key_column(f)) for f in fields})
+    )
+
+    count = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(table.c.report_id, *[table.c[f] for f in fields])
+            .where(table.c.report_id > last_id)
+            .order_by(table.c.report_id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(stmt, [
+            {"_id": row[0], **{sort_key_column(f): natural_sort_key(v) for f, v in zip(fields, row[1:])}}
+            for row in rows
+        ])
+        last_id = rows[-1][0]
+        count += len(rows)
+    return count
+
+
+def main():
+    for model in (MspReport, ErrorReport, LogReport):
+        with engine.begin() as conn:
+            ensure_columns(conn, model)
+        with engine.begin() as conn:
+            count = backfill(conn, model)
+        print(f"{model.__tablename__}: {count} rows")
+
+
+if __name__ == "__main__":
+    main()
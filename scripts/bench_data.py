@@ -0,0 +1,197 @@
+# scripts/bench_data.py
+#
+# 벤치마크용 합성 데이터 생성 (같은 --seed 면 같은 데이터)
+#   python -m scripts.bench_data --url sqlite:///bench.db
+#   python -m scripts.bench_data --url mysql+pymysql://u:pw@host/bench_db --log 1000000 --clients 200
+#
+# - models.models 구조 그대로: 사용자 / 고객사(시스템·환경·장애대상) / MSP·장애·일지 리포트
+# - 고객사는 소수에 몰리는 분포(상위 고객사일수록 리포트가 많음), 날짜는 최근 --days 일에 분산
+# - 저장은 utils.report_import.insert_batch (정렬키 / 통계 롤업 / 검색 인덱스 / 테이블 버전 함께 반영)
+# - 로그인 계정: admin (관리자 화면 포함) + bench01.. / 비밀번호 --password
+# 운영 DB 가 아닌 별도 DB 를 지정할 것 (테이블이 없으면 생성, 기존 데이터에 추가됨)
+# 생성한 DB 로 서버 실행: DATABASE_URL=<같은 URL> uvicorn main:app → python -m scripts.bench_load
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+
+from database import Base, create_db_engine
+from models.models import User, Client, MspReport, ErrorReport, LogReport
+from utils.auth import get_password_hash
+from utils.natural_sort import natural_sort_key, sort_key_column
+from utils.report_import import insert_batch
+from utils.search import create_search_index
+
+ENVS = ("prd", "stg", "dev")
+CLOUDS = ("AWS", "Azure", "GCP", "NCP", "On-Premise")
+COMPONENTS = ("WEB", "WAS", "DB", "LB", "Storage", "Network")
+STATUSES = (("완료", 70), ("진행", 20), ("대기", 10))
+REQUEST_TYPES = ("변경", "신규", "점검", "장애", "문의", "권한")
+LOG_TYPES = ("정기점검", "모니터링", "작업", "교육", "회의")
+
+WORDS = (
+    "서버", "점검", "디스크", "사용률", "증가", "확인", "패치", "적용", "백업", "복구", "계정", "권한",
+    "로그", "분석", "네트워크", "지연", "재기동", "배포", "인증서", "갱신", "모니터링", "알람", "설정",
+    "변경", "요청", "완료", "메모리", "CPU", "트래픽", "DB", "쿼리", "튜닝", "보안", "취약점", "조치",
+)
+
+
+class Generator:
+    def __init__(self, seed, clients, systems, days, managers):
+        self.rng = random.Random(seed)
+        self.end = datetime(2025, 1, 1)
+        self.days = days
+        self.managers = [f"담당{i:02d}" for i in range(1, managers + 1)]
+        self.requesters = [f"요청{i:02d}" for i in range(1, 31)]
+
+        # (고객사, 시스템, 환경, 장애대상, 클라우드) — 고객사 순위가 높을수록 가중치가 큼 (1/순위)
+        self.clients = []
+        for i in range(1, clients + 1):
+            name = f"고객사{i:03d}"
+            for j in range(1, self.rng.randint(1, systems) + 1):
+                self.clients.append((
+                    name, f"{name[-3:]}-시스템{j}", self.rng.choice(ENVS),
+                    self.rng.choice(COMPONENTS), self.rng.choice(CLOUDS),
+                ))
+        names = [c[0] for c in self.clients]
+        rank = {name: i for i, name in enumerate(dict.fromkeys(names), start=1)}
+        self.weights = [1 / (rank[name] * names.count(name)) for name in names]
+
+    def _client(self):
+        return self.rng.choices(self.clients, self.weights)[0]
+
+    def _date(self):
+        return self.end - timedelta(minutes=self.rng.randrange(self.days * 24 * 60))
+
+    def _text(self, low=5, high=30):
+        return " ".join(self.rng.choices(WORDS, k=self.rng.randint(low, high)))
+
+    def _status(self):
+        return self.rng.choices([s for s, _ in STATUSES], [w for _, w in STATUSES])[0]
+
+    def msp(self):
+        name, system, env, _, cloud = self._client()
+        start = self._date()
+        status = self._status()
+        return {
+            "request_date": start,
+            "completed_date": start + timedelta(hours=self.rng.randint(1, 72)) if status == "완료" else None,
+            "client_name": name, "system_name": system, "target_env": env, "cloud_type": cloud,
+            "requester": self.rng.choice(self.requesters), "request_type": self.rng.choice(REQUEST_TYPES),
+            "request_content": self._text(), "purpose": self._text(0, 10), "manager": self.rng.choice(self.managers),
+            "status": status, "response": self._text(0, 20), "etc": None,
+        }
+
+    def error(self):
+        name, system, env, component, cloud = self._client()
+        start = self._date()
+        status = self._status()
+        return {
+            "error_start_date": start,
+            "error_end_date": start + timedelta(minutes=self.rng.randint(5, 600)) if status == "완료" else None,
+            "client_name": name, "system_name": system, "target_env": env, "cloud_type": cloud,
+            "target_component": component, "customer_impact": self._text(0, 8), "error_info": self._text(),
+            "error_reason": self._text(0, 15), "action_taken": self._text(0, 15),
+            "manager": self.rng.choice(self.managers), "status": status, "etc": None,
+        }
+
+    def log(self):
+        name, system, env, _, cloud = self._client()
+        start = self._date()
+        status = self._status()
+        return {
+            "log_date": start,
+            "completed_date": start + timedelta(hours=self.rng.randint(1, 8)) if status == "완료" else None,
+            "client_name": name, "system_name": system, "target_env": env, "cloud_type": cloud,
+            "log_type": self.rng.choice(LOG_TYPES), "content": self._text(), "action": self._text(0, 10),
+            "manager": self.rng.choice(self.managers), "status": status, "summary": self._text(0, 6), "etc": None,
+        }
+
+
+def create_users(conn, count, password):
+    """admin + bench01.. (이미 있으면 건너뜀), 반환: admin user_id"""
+    table = User.__table__
+    hashed = get_password_hash(password)
+    existing = set(conn.execute(select(table.c.username)).scalars())
+    names = [("admin", "관리자")] + [(f"bench{i:02d}", f"벤치{i:02d}") for i in range(1, count + 1)]
+    rows = [
+        {"username": username, "password": hashed, "name": name, "created_at": datetime.now()}
+        for username, name in names if username not in existing
+    ]
+    if rows:
+        conn.execute(insert(table), rows)
+    return conn.execute(select(table.c.user_id).where(table.c.username == "admin")).scalar_one()
+
+
+def create_clients(conn, generator):
+    rows = [
+        {"client_name": name, "system_name": system, "target_env": env, "target_component": component, "cloud_type": cloud}
+        for name, system, env, component, cloud in generator.clients
+    ]
+    conn.execute(insert(Client.__table__), rows)
+    return len(rows)
+
+
+def load_reports(engine, model, make_row, count, batch_size, create_by):
+    start = time.perf_counter()
+    done = 0
+    while done < count:
+        size = min(batch_size, count - done)
+        rows = []
+        for _ in range(size):
+            row = make_row()
+            for name in model.__natural_sort__:
+                row[sort_key_column(name)] = natural_sort_key(row.get(name))
+            rows.append(row)
+        with engine.begin() as conn:
+            insert_batch(conn, model, rows, create_by)
+        done += size
+        elapsed = time.perf_counter() - start
+        print(f"\r{model.__tablename__:12} {done:>9}/{count}  {done / elapsed:8.0f} rows/s", end="", flush=True)
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--url", required=True, help="대상 DB URL (운영 DB 금지)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--systems", type=int, default=4, help="고객사당 최대 시스템 수")
+    parser.add_argument("--log", type=int, default=100000, help="일지 건수 (예: 1000000)")
+    parser.add_argument("--msp", type=int, default=30000)
+    parser.add_argument("--error", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=730, help="리포트 날짜 분포 기간(일)")
+    parser.add_argument("--managers", type=int, default=25)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--password", default="bench1234")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    engine = create_db_engine(args.url)
+    Base.metadata.create_all(engine)
+    generator = Generator(args.seed, args.clients, args.systems, args.days, args.managers)
+
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        admin_id = create_users(conn, args.users, args.password)
+        systems = create_clients(conn, generator)
+    print(f"{engine.dialect.name}: users admin + {args.users}, clients {args.clients} ({systems} systems)")
+
+    for model, make_row, count in (
+        (MspReport, generator.msp, args.msp),
+        (ErrorReport, generator.error, args.error),
+        (LogReport, generator.log, args.log),
+    ):
+        load_reports(engine, model, make_row, count, args.batch_size, admin_id)
+
+    # 대량 적재 후 검색 인덱스 생성/재색인 (적재 중에 인덱스를 유지하는 것보다 빠름)
+    with engine.begin() as conn:
+        create_search_index(conn, (MspReport, ErrorReport, LogReport))
+    print(f"done in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
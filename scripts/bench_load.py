@@ -0,0 +1,248 @@
+# scripts/bench_load.py
+#
+# 부하 테스트 (httpx) — 실행 중인 서버에 실제 화면/다운로드/등록 요청을 섞어서 보냄
+#   DATABASE_URL=sqlite:///bench.db uvicorn main:app --workers 4        # scripts.bench_data 로 만든 DB
+#   python -m scripts.bench_load --base-url http://localhost:8000 --duration 60 --concurrency 16 --out result.json
+#   python -m scripts.bench_load ... --baseline result.json            # p95 가 --tolerance 이상 느려지면 exit 1
+#
+# - 시나리오와 가중치는 SCENARIOS (--only log_list,log_search 로 일부만 실행)
+# - 고객사/시스템 이름은 /solideo/options 에서 받아 필터 값으로 사용, 요청 순서는 --seed 로 재현
+# - 결과 JSON: 시나리오별 / 전체 count, errors, p50·p95·p99·max (ms), 처리량(req/s)
+# - 등록(submit_*) 시나리오는 데이터를 추가함 → --read-only 로 제외
+# 서버 쪽 DB 접속 없이 HTTP 만 사용 (부하 발생기를 다른 서버에서 실행 가능)
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+
+import httpx
+
+SEARCH_WORDS = ("디스크", "점검", "패치", "인증서", "네트워크", "재기동")
+STATUSES = ("완료", "진행", "대기")
+LOG_API_FIELDS = "report_id,log_date,client_name,system_name,manager,content"  # 일지 목록 화면(list_api.js)과 같은 컬럼
+
+
+# ------------------------------------------------------------------
+# 시나리오: (이름, 가중치, 요청 생성 함수(ctx, rng) → (method, url, form 또는 None))
+# ------------------------------------------------------------------
+def _client(ctx, rng):
+    return rng.choice(ctx["clients"]) if ctx["clients"] else ""
+
+
+def _submit_common(ctx, rng):
+    client = _client(ctx, rng)
+    return client, rng.choice(ctx["systems"].get(client) or ["bench"])
+
+
+def submit_msp(ctx, rng):
+    client, system = _submit_common(ctx, rng)
+    return "POST", "/msp/submit", {
+        "manager": "bench", "request_date": datetime.now().strftime("%Y-%m-%d"), "request_time": "10:00",
+        "client_name": client, "system_name": system, "target_env": "prd", "requester": "bench",
+        "request_type": "변경", "request_content": "부하 테스트 등록", "status": "진행",
+    }
+
+
+def submit_error(ctx, rng):
+    client, system = _submit_common(ctx, rng)
+    return "POST", "/error/submit", {
+        "manager": "bench", "error_start_date": datetime.now().strftime("%Y-%m-%d"), "start_time": "10:00",
+        "client_name": client, "system_name": system, "target_env": "prd", "target_component": "WAS",
+        "error_info": "부하 테스트 장애", "status": "진행",
+    }
+
+
+def submit_log(ctx, rng):
+    client, system = _submit_common(ctx, rng)
+    return "POST", "/log/submit", {
+        "manager": "bench", "log_date": datetime.now().strftime("%Y-%m-%d"), "log_time": "10:00",
+        "client_name": client, "system_name": system, "target_env": "prd", "content": "부하 테스트 일지",
+        "status": "완료",
+    }
+
+
+def _get(path, **params):
+    query = httpx.QueryParams({k: v for k, v in params.items() if v not in ("", None)})
+    return "GET", f"{path}?{query}" if query else path, None
+
+
+SCENARIOS = [
+    ("main", 5, lambda ctx, rng: _get("/")),
+    ("log_list", 15, lambda ctx, rng: _get("/log_reports", page=rng.randint(1, 50))),
+    ("log_filter", 10, lambda ctx, rng: _get("/log_reports", client_name=_client(ctx, rng), status=rng.choice(STATUSES))),
+    ("log_search", 5, lambda ctx, rng: _get("/log_reports", search=rng.choice(SEARCH_WORDS))),
+    ("log_api", 10, lambda ctx, rng: _get("/api/v1/log/reports", page=rng.randint(1, 50), fields=LOG_API_FIELDS)),
+    ("msp_list", 8, lambda ctx, rng: _get("/reports", page=rng.randint(1, 20))),
+    ("error_list", 5, lambda ctx, rng: _get("/error_reports", client_name=_client(ctx, rng))),
+    ("msp_download", 1, lambda ctx, rng: _get("/reports/download", client_name=_client(ctx, rng))),
+    ("error_download", 1, lambda ctx, rng: _get("/error_reports/download", client_name=_client(ctx, rng))),
+    ("log_download", 2, lambda ctx, rng: _get("/log_reports/download", client_name=_client(ctx, rng))),
+    ("admin_stats", 3, lambda ctx, rng: _get("/admin/stats")),
+    ("client_options", 8, lambda ctx, rng: _get("/client/options", client_name=_client(ctx, rng))),
+    ("submit_msp", 1, submit_msp),
+    ("submit_error", 1, submit_error),
+    ("submit_log", 2, submit_log),
+]
+
+
+# ------------------------------------------------------------------
+# 실행
+# ------------------------------------------------------------------
+def login(base_url, username, password, timeout):
+    with httpx.Client(base_url=base_url, timeout=timeout) as http:
+        response = http.post("/login", data={"username": username, "password": password})
+        token = response.cookies.get("access_token")
+        if not token:
+            sys.exit(f"로그인 실패: {username} (HTTP {response.status_code})")
+        return dict(response.cookies)
+
+
+def load_context(base_url, cookies, timeout, max_clients=50):
+    """필터에 쓸 고객사/시스템 이름"""
+    with httpx.Client(base_url=base_url, cookies=cookies, timeout=timeout) as http:
+        clients = http.get("/solideo/options").json().get("clients", [])[:max_clients]
+        systems = {c: http.get("/solideo/options", params={"client": c}).json().get("systems", []) for c in clients}
+    return {"clients": clients, "systems": systems}
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples, elapsed):
+    latencies = sorted(ms for ms, _ in samples)
+    return {
+        "count": len(samples),
+        "errors": sum(1 for _, ok in samples if not ok),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def worker(index, args, cookies, ctx, scenarios, deadline, warmup_until, results):
+    rng = random.Random(args.seed * 1000 + index)
+    names = [s[0] for s in scenarios]
+    weights = [s[1] for s in scenarios]
+    builders = {s[0]: s[2] for s in scenarios}
+    samples = {}
+    with httpx.Client(base_url=args.base_url, cookies=cookies, timeout=args.timeout) as http:
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights)[0]
+            method, url, form = builders[name](ctx, rng)
+            start = time.perf_counter()
+            try:
+                response = http.request(method, url, data=form)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            ms = (time.perf_counter() - start) * 1000
+            if time.monotonic() >= warmup_until:
+                samples.setdefault(name, []).append((ms, ok))
+    results[index] = samples
+
+
+def compare(result, baseline, tolerance):
+    """p95 가 기준보다 tolerance 비율 이상 느려진 시나리오 목록"""
+    regressions = []
+    for name, current in result["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base and base["p95_ms"] and current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {base['p95_ms']}ms → {current['p95_ms']}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트 (httpx)")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="bench1234")
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=5, help="측정에서 제외할 처음 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", help="실행할 시나리오 (쉼표 구분)")
+    parser.add_argument("--read-only", action="store_true", help="등록(submit_*) 시나리오 제외")
+    parser.add_argument("--label", default="", help="결과 파일에 함께 기록할 이름 (브랜치/커밋 등)")
+    parser.add_argument("--out", help="결과 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 p95 증가율 (기본 20%%)")
+    args = parser.parse_args()
+
+    scenarios = SCENARIOS
+    if args.only:
+        only = set(args.only.split(","))
+        unknown = only - {s[0] for s in SCENARIOS}
+        if unknown:
+            sys.exit(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+        scenarios = [s for s in scenarios if s[0] in only]
+    if args.read_only:
+        scenarios = [s for s in scenarios if not s[0].startswith("submit_")]
+
+    cookies = login(args.base_url, args.username, args.password, args.timeout)
+    ctx = load_context(args.base_url, cookies, args.timeout)
+    print(f"{args.base_url}: {len(scenarios)} scenarios, {args.concurrency} workers, "
+          f"{args.warmup:.0f}s warmup + {args.duration:.0f}s, clients {len(ctx['clients'])}")
+
+    start = time.monotonic()
+    warmup_until = start + args.warmup
+    deadline = warmup_until + args.duration
+    results = [None] * args.concurrency
+    threads = [
+        threading.Thread(target=worker, args=(i, args, cookies, ctx, scenarios, deadline, warmup_until, results))
+        for i in range(args.concurrency)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - warmup_until
+
+    merged = {}
+    for samples in results:
+        for name, values in (samples or {}).items():
+            merged.setdefault(name, []).extend(values)
+    result = {
+        "label": args.label,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "base_url": args.base_url,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "seed": args.seed,
+        "total": summarize([s for values in merged.values() for s in values], elapsed),
+        "scenarios": {name: summarize(merged[name], elapsed) for name, _, _ in scenarios if name in merged},
+    }
+
+    print(f"{'scenario':16} {'count':>7} {'err':>5} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'req/s':>8}")
+    for name, s in list(result["scenarios"].items()) + [("TOTAL", result["total"])]:
+        print(f"{name:16} {s['count']:7} {s['errors']:5} {s['p50_ms']:9.1f} {s['p95_ms']:9.1f} "
+              f"{s['p99_ms']:9.1f} {s['rps']:8.1f}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"saved: {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+    if result["total"]["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# scripts/bench_startup.py
+#
+# 워커 기동(import main) 시간/메모리 측정 — python -X importtime 기반
+#   python -m scripts.bench_startup                      # 측정 + 기준값과 비교
+#   python -m scripts.bench_startup --save               # 현재 값을 기준값으로 저장
+#   python -m scripts.bench_startup --top 30
+#
+# 실패(exit 1) 조건
+# - 지연 로딩 대상 모듈(LAZY_MODULES)이 import main 중에 로드됨
+# - import main 시간/RSS 가 기준값(서버별로 --save 해서 생성) 대비 --tolerance 이상 증가
+# - --max-ms 지정 시 import main 시간이 그 값을 넘음
+
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "startup_baseline.json")
+
+# 기동 시점에 로드되면 안 되는 무거운 선택 의존성
+LAZY_MODULES = ("weasyprint", "natsort", "openpyxl", "cairocffi", "pydyf", "fontTools")
+
+# 측정 후 자신의 최대 RSS(KB, Linux) 를 출력하는 코드
+_RSS = "import resource; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+
+
+def measure(statement):
+    """(import 누적시간 ms, 최대 RSS MB, importtime 행 목록)"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{statement}\n{_RSS}"],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} 실패:\n{proc.stderr[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2]
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), depth, self_us, cumulative_us))
+
+    total_ms = sum(r[3] for r in rows if r[1] == 0) / 1000
+    rss_mb = int(proc.stdout.strip().splitlines()[-1]) / 1024
+    return total_ms, rss_mb, rows
+
+
+def best_of(statement, repeat):
+    runs = [measure(statement) for _ in range(repeat)]
+    return min(runs, key=lambda r: r[0])
+
+
+def main_imports():
+    """main.py 의 최상위 import 모듈 목록"""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기동 시간/메모리 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15, help="import main 중 누적시간 상위 N 모듈 출력")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="기준값 대비 허용 증가율")
+    parser.add_argument("--save", action="store_true", help="측정값을 기준값으로 저장")
+    parser.add_argument("--max-ms", type=float, help="import main 허용 시간(ms)")
+    args = parser.parse_args()
+
+    base_ms, base_rss, _ = best_of("pass", args.repeat)
+    print(f"{'module':40} {'import(ms)':>10} {'rss(MB)':>8}")
+    print(f"{'(python)':40} {base_ms:10.1f} {base_rss:8.1f}")
+    for module in main_imports():
+        ms, rss, _ = best_of(f"import {module}", args.repeat)
+        print(f"{module:40} {ms - base_ms:+10.1f} {rss - base_rss:+8.1f}")
+
+    # 인터프리터 자체 기동분(site 등)은 제외한 증가분
+    total_ms, total_rss, rows = best_of("import main", args.repeat)
+    total_ms -= base_ms
+    print(f"{'main (total)':40} {total_ms:+10.1f} {total_rss - base_rss:+8.1f}")
+
+    print(f"\nimport main — 누적시간 상위 {args.top}")
+    for name, _, _, cumulative_us in sorted(rows, key=lambda r: -r[3])[:args.top]:
+        print(f"  {name:50} {cumulative_us / 1000:8.1f}ms")
+
+    failures = []
+    loaded = {r[0].split(".")[0] for r in rows}
+    for module in LAZY_MODULES:
+        if module in loaded:
+            failures.append(f"{module} 가 기동 시점에 import 됨 (기능 안에서 지연 로딩할 것)")
+
+    if args.max_ms is not None and total_ms > args.max_ms:
+        failures.append(f"import main {total_ms:.1f}ms > {args.max_ms}ms")
+
+    current = {"import_ms": round(total_ms, 1), "rss_mb": round(total_rss - base_rss, 1)}
+    if args.save:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nbaseline saved: {BASELINE_PATH} {current}")
+    elif os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for key, value in current.items():
+            limit = baseline[key] * (1 + args.tolerance)
+            status = "FAIL" if value > limit else "ok"
+            print(f"{key}: {value} (baseline {baseline[key]}, limit {limit:.1f}) {status}")
+            if value > limit:
+                failures.append(f"{key} {value} > {limit:.1f}")
+
+    if failures:
+        print("\n" + "\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# scripts/bench_submit.py
+#
+# 리포트 등록 지연시간 벤치마크: 기존 방식 vs 단일 트랜잭션(utils.report_service)
+#   python -m scripts.bench_submit                                   # 임시 SQLite 파일
+#   python -m scripts.bench_submit --url mysql+pymysql://.../bench_db --threads 16 --count 2000
+#
+# legacy : report INSERT → COMMIT → SELECT(refresh) → msp_report INSERT(+롤업) → COMMIT
+# single : 같은 문장을 트랜잭션 1개로 (report INSERT → msp_report INSERT(+롤업) → COMMIT)
+#          legacy/single 은 Core 로 재현 — 커밋 방식 차이만 비교
+# service: 실제 create_report() (ORM flush + 이벤트 포함)
+# 운영 DB 가 아닌 별도 DB 를 지정할 것 (테이블이 없으면 생성, 데이터가 쌓임)
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, create_db_engine
+from models.models import Report, MspReport, ReportDailyRollup
+from utils.natural_sort import natural_sort_key, sort_key_column
+from utils.rollup import rollup_key, apply_delta
+from utils.report_service import create_report
+
+
+def _values(i):
+    return {
+        "manager": f"m{i % 5}",
+        "request_date": datetime(2024, 1 + i % 12, 1 + i % 28, 10, 0),
+        "client_name": f"client{i % 20}",
+        "system_name": f"sys{i % 7}",
+        "target_env": "prd",
+        "requester": f"r{i % 9}",
+        "request_type": "변경",
+        "request_content": f"bench {i}",
+        "status": "완료",
+    }
+
+
+def _detail_values(i):
+    values = _values(i)
+    values.update({sort_key_column(f): natural_sort_key(values.get(f)) for f in MspReport.__natural_sort__})
+    return values
+
+
+def _insert_detail(conn, report_id, values):
+    conn.execute(insert(MspReport.__table__).values(report_id=report_id, **values))
+    apply_delta(conn, ReportDailyRollup.__table__, rollup_key(MspReport, values), 1)
+
+
+def legacy_submit(engine, i):
+    report = Report.__table__
+    values = _detail_values(i)
+    with engine.connect() as conn:
+        result = conn.execute(insert(report).values(report_type="msp", created_at=datetime.now()))
+        conn.commit()
+        report_id = result.inserted_primary_key[0]
+        conn.execute(select(report).where(report.c.report_id == report_id)).one()
+        _insert_detail(conn, report_id, values)
+        conn.commit()
+
+
+def single_submit(engine, i):
+    values = _detail_values(i)
+    with engine.begin() as conn:
+        result = conn.execute(insert(Report.__table__).values(report_type="msp", created_at=datetime.now()))
+        _insert_detail(conn, result.inserted_primary_key[0], values)
+
+
+def service_submit(Session, i):
+    db = Session()
+    try:
+        create_report(db, MspReport, **_values(i))
+    finally:
+        db.close()
+
+
+def run(label, fn, count, threads):
+    def timed(i):
+        start = time.perf_counter()
+        fn(i)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = sorted(pool.map(timed, range(count)))
+    elapsed = time.perf_counter() - start
+
+    p50 = statistics.median(latencies) * 1000
+    p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+    print(f"{label:8} p50 {p50:7.2f}ms  p95 {p95:7.2f}ms  {count / elapsed:8.1f} req/s")
+    return p50
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리포트 등록 벤치마크")
+    parser.add_argument("--url", help="벤치마크용 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_submit.db')}"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    print(f"{engine.dialect.name}: {args.count} submits, {args.threads} threads")
+    legacy = run("legacy", lambda i: legacy_submit(engine, i), args.count, args.threads)
+    single = run("single", lambda i: single_submit(engine, i), args.count, args.threads)
+    run("service", lambda i: service_submit(Session, i), args.count, args.threads)
+    print(f"p50 latency ratio (single / legacy): {single / legacy:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+# scripts/build_search_index.py
+#
+# 통합검색 인덱스 생성/재색인
+#   MySQL : FULLTEXT ... WITH PARSER ngram 인덱스 생성
+#   SQLite: FTS5 report_search 테이블 생성 후 전체 재색인
+#   python -m scripts.build_search_index
+
+from database import engine
+from models.models import MspReport, ErrorReport, LogReport
+from utils.search import create_search_index
+
+
+def main():
+    with engine.begin() as conn:
+        create_search_index(conn, (MspReport, ErrorReport, LogReport))
+    print(f"search index ready ({engine.dialect.name})")
+
+
+if __name__ == "__main__":
+    main()
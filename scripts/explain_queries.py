@@ -0,0 +1,113 @@
+# scripts/explain_queries.py
+#
+# 목록/통계 쿼리 실행계획 점검 — 풀스캔이 있으면 종료코드 1
+#   python -m scripts.explain_queries
+#   MySQL : EXPLAIN 결과 type = ALL
+#   SQLite: EXPLAIN QUERY PLAN 결과 "SCAN <table>" (인덱스 미사용)
+# 케이스마다 사용한 인덱스도 출력 — 필터가 날짜 인덱스 순서 읽기로 처리되는지(부분일치 LIKE 등) 확인용
+
+import sys
+
+from database import SessionLocal
+from models.models import MspReport, ErrorReport, LogReport
+from utils.pagination import apply_sort
+from utils.report_queries import msp_list_query, error_list_query, log_list_query
+from utils.stats import stats_statements, stats_clients_statement
+
+LIMIT = 10
+
+# 전체 읽기가 정상인 쿼리: 전체 통계는 롤업 테이블(이미 일자/분류별로 집계된 작은 테이블)을 모두 합산
+FULL_SCAN_OK = {"stats_breakdown"}
+DATE_RANGE = {"start_date": "2024-01-01", "end_date": "2024-01-31"}
+
+
+def list_cases(db):
+    """(이름, SELECT) — 핸들러 기본 정렬(날짜 DESC) + LIMIT"""
+    specs = [
+        ("msp", MspReport, "request_date", msp_list_query, [
+            {}, {"status": "완료"}, DATE_RANGE, {"status": "완료", **DATE_RANGE},
+            {"client_name": "A"}, {"manager": "A"}, {"system_name": "A"}, {"requester": "A"},
+            {"request_type": "A"}, {"target_env": "A"}, {"client_name": "A", **DATE_RANGE},
+        ]),
+        ("error", ErrorReport, "error_start_date", error_list_query, [
+            {}, {"status": "완료"}, DATE_RANGE, {"status": "완료", **DATE_RANGE},
+            {"client_name": "A"}, {"manager": "A"}, {"system_name": "A"}, {"target_component": "A"},
+            {"target_env": "A"}, {"client_name": "A", **DATE_RANGE},
+        ]),
+        ("log", LogReport, "log_date", log_list_query, [
+            {}, {"status": "완료"}, DATE_RANGE, {"client_name": "A"}, {"system_name": "A"},
+            {"client_name": "A", **DATE_RANGE}, {"status": "완료", **DATE_RANGE},
+            {"manager": "A"}, {"log_type": "A"}, {"target_env": "A"},
+        ]),
+    ]
+    for name, model, date_field, build, filters in specs:
+        for params in filters:
+            query = apply_sort(build(db, **params), model, date_field, "desc", date_field).limit(LIMIT)
+            label = ",".join(params) or "default"
+            yield f"{name}_list[{label}]", query.statement
+
+
+def stats_cases():
+    breakdown, daily = stats_statements("A")
+    yield "client_stats_breakdown", breakdown
+    yield "client_stats_daily", daily
+    yield "stats_clients", stats_clients_statement()
+    breakdown, daily = stats_statements()
+    yield "stats_breakdown", breakdown
+    yield "stats_daily", daily
+
+
+def explain(conn, stmt):
+    compiled = stmt.compile(dialect=conn.dialect)
+    params = compiled.construct_params()
+    if compiled.positiontup is not None:
+        params = tuple(params[key] for key in compiled.positiontup)
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    return [dict(row) for row in conn.exec_driver_sql(prefix + str(compiled), params).mappings()]
+
+
+def full_scans(dialect, plan):
+    if dialect == "sqlite":
+        return [
+            row["detail"] for row in plan
+            if row["detail"].startswith("SCAN ") and "USING" not in row["detail"]
+        ]
+    return [row["table"] for row in plan if row.get("type") == "ALL"]
+
+
+def used_indexes(dialect, plan):
+    if dialect == "sqlite":
+        return [
+            row["detail"].split(" INDEX ", 1)[1].split(" ")[0]
+            for row in plan if " INDEX " in row["detail"]
+        ]
+    return [row["key"] for row in plan if row.get("key")]
+
+
+def main():
+    db = SessionLocal()
+    failed = []
+    try:
+        conn = db.connection()
+        dialect = conn.dialect.name
+        for name, stmt in [*list_cases(db), *stats_cases()]:
+            plan = explain(conn, stmt)
+            scans = full_scans(dialect, plan)
+            if scans and name in FULL_SCAN_OK:
+                status = "ok (scan)"
+            else:
+                status = "FULL SCAN" if scans else "ok"
+                if scans:
+                    failed.append(name)
+            detail = scans or used_indexes(dialect, plan)
+            print(f"{status:9}  {name:45} {', '.join(map(str, detail))}")
+    finally:
+        db.close()
+
+    if failed:
+        print(f"{len(failed)} query(s) do a full table scan")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
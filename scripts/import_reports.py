@@ -0,0 +1,58 @@
+# scripts/import_reports.py
+#
+# 리포트 일괄 가져오기 (CSV/XLSX, download_*_csv 와 같은 컬럼 구성)
+#   python -m scripts.import_reports msp reports.csv
+#   python -m scripts.import_reports log logs.xlsx --user admin --dry-run
+
+import argparse
+import sys
+import time
+
+from database import engine, SessionLocal
+from models.models import User
+from utils.report_import import import_reports, iter_file_rows, BATCH_SIZE, IMPORT_COLUMNS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리포트 일괄 가져오기")
+    parser.add_argument("report_type", choices=sorted(IMPORT_COLUMNS))
+    parser.add_argument("path")
+    parser.add_argument("--user", help="작성자 username (report.create_by)")
+    parser.add_argument("--dry-run", action="store_true", help="검증만 하고 저장하지 않음")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    create_by = None
+    if args.user:
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter(User.username == args.user).first()
+        finally:
+            db.close()
+        if not user:
+            sys.exit(f"사용자를 찾을 수 없습니다: {args.user}")
+        create_by = user.user_id
+
+    start = time.perf_counter()
+    with open(args.path, "rb") as f:
+        try:
+            result = import_reports(
+                engine, args.report_type, iter_file_rows(args.path, f),
+                create_by=create_by, dry_run=args.dry_run, batch_size=args.batch_size
+            )
+        except ValueError as e:
+            sys.exit(str(e))
+    elapsed = time.perf_counter() - start
+
+    for error in result.errors:
+        print(f"line {error.line}: {error.message}")
+    action = "valid" if args.dry_run else "imported"
+    print(f"{result.imported}/{result.total} rows {action}, {result.failed} failed ({elapsed:.1f}s)")
+    if result.aborted:
+        print(f"aborted at line {result.aborted.line}: {result.aborted.message} (rows before it were {action})")
+    if result.failed or result.aborted:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# scripts/job_worker.py
+#
+# 백그라운드 작업(job 테이블) 전용 워커 — 웹 서버와 분리해서 실행할 때
+#   JOB_WORKERS=0 uvicorn main:app ...          # 웹: 등록/조회만
+#   JOB_WORKERS=4 python -m scripts.job_worker   # 워커: 실행 (여러 대 실행해도 작업은 1번씩만 실행)
+
+import signal
+
+from database import engine
+from utils import jobs
+
+
+def main():
+    workers = max(jobs.JOB_WORKERS, 1)
+    dispatcher = jobs.Dispatcher(engine, workers)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)  # SIGTERM 도 Ctrl-C 와 같이 종료
+    print(f"job worker: {workers} process(es), results in {jobs.JOB_RESULT_DIR}")
+    try:
+        dispatcher.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dispatcher.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+# scripts/rebuild_rollup.py
+#
+# 통계 롤업(report_daily_rollup) 테이블 생성 및 전체 재계산
+#   python -m scripts.rebuild_rollup
+
+from database import engine
+from models.models import ReportDailyRollup
+from utils.rollup import rebuild
+from utils.stats import REPORT_MODELS
+
+
+def main():
+    ReportDailyRollup.__table__.create(engine, checkfirst=True)
+    with engine.begin() as conn:
+        rebuild(conn, ReportDailyRollup.__table__, REPORT_MODELS)
+    print("report_daily_rollup rebuilt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+// 서버에서 오래 걸리는 내보내기(PDF 일괄 / 백그라운드 CSV) 작업 시작
+// 진행률을 버튼에 표시하다가 완료되면 결과 파일 다운로드
+async function startExport(url, button) {
+  const label = button.textContent;
+  button.disabled = true;
+  try {
+    const res = await fetch(url, { method: 'POST' });
+    let job = await res.json();
+    if (!res.ok) {
+      alert(job.detail || '내보내기에 실패했습니다.');
+      return;
+    }
+    while (job.status === 'queued' || job.status === 'running') {
+      button.textContent = job.status === 'queued' ? '대기 중' : `생성 중 ${job.done}/${job.total ?? '?'}`;
+      await new Promise(resolve => setTimeout(resolve, 1000));
+      job = await (await fetch(job.status_url)).json();
+    }
+    if (job.status === 'done') {
+      location.href = job.download_url;
+    } else {
+      alert(job.error || '내보내기에 실패했습니다.');
+    }
+  } finally {
+    button.disabled = false;
+    button.textContent = label;
+  }
+}
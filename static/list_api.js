@@ -0,0 +1,126 @@
+// 목록 페이지 이동을 /api/v1/.../reports (JSON) 로 처리 — 페이지 전체(헤더/필터/드롭다운)를 다시 받지 않음
+// <tbody data-list-api="/api/v1/log/reports" data-fields="log_date,client_name,..."
+//        data-link-field="log_date" data-clamp-field="content" data-detail-type="log">
+// - .pagination 링크 클릭 시 같은 쿼리스트링으로 API 호출 → tbody / 페이지 번호만 다시 그림
+// - 주소창은 history.pushState 로 갱신 (새로고침/공유 시 서버 렌더링 화면과 동일)
+// - API 호출 실패 시 원래 링크로 이동
+
+(function () {
+  function init() {
+    const tbody = document.querySelector('tbody[data-list-api]');
+    const pagination = document.querySelector('.pagination');
+    if (!tbody || !pagination || !window.fetch) return;
+
+    const fields = tbody.dataset.fields.split(',');
+    const linkField = tbody.dataset.linkField;
+    const clampField = tbody.dataset.clampField;
+    const detailType = tbody.dataset.detailType;
+
+    function cell(field, value, reportId) {
+      const td = document.createElement('td');
+      let text = value == null ? '' : String(value);
+      if (field === linkField) {
+        const a = document.createElement('a');
+        a.href = '/report/' + reportId + '?type=' + detailType;
+        a.textContent = text.slice(0, 10);
+        td.appendChild(a);
+      } else if (field === clampField) {
+        const span = document.createElement('span');
+        span.className = 'line-clamp-2';
+        span.title = text;
+        span.textContent = text;
+        td.appendChild(span);
+      } else {
+        td.textContent = text;
+      }
+      return td;
+    }
+
+    function renderRows(data) {
+      const index = {};
+      data.fields.forEach((f, i) => { index[f] = i; });
+      const ids = data.columns[index.report_id];
+      const rows = document.createDocumentFragment();
+      for (let r = 0; r < data.count; r++) {
+        const tr = document.createElement('tr');
+        fields.forEach(f => tr.appendChild(cell(f, data.columns[index[f]][r], ids[r])));
+        rows.appendChild(tr);
+      }
+      tbody.replaceChildren(rows);
+    }
+
+    function link(params, changes, label, title) {
+      const next = new URLSearchParams(params);
+      ['page', 'after'].forEach(k => next.delete(k));
+      Object.entries(changes).forEach(([k, v]) => next.set(k, v));
+      const a = document.createElement('a');
+      a.href = '?' + next.toString();
+      a.innerHTML = label;
+      if (title) a.title = title;
+      return a;
+    }
+
+    // templates 의 페이지 번호 규칙과 동일 (최대 5개)
+    function renderPagination(data, params) {
+      const items = [];
+      if (!data.page) {
+        items.push(link(params, {}, '&laquo;'));
+        if (data.next_cursor) items.push(link(params, { after: data.next_cursor }, '&rsaquo;'));
+      } else {
+        const page = data.page, total = data.total_pages;
+        if (page > 1) {
+          items.push(link(params, { page: 1 }, '&laquo;'));
+          items.push(link(params, { page: page - 1 }, '&lsaquo;'));
+        }
+        let start = Math.max(1, page - 2);
+        const end = Math.min(start + 4, total);
+        start = Math.max(1, end - 4);
+        for (let p = start; p <= end; p++) {
+          if (p === page) {
+            const span = document.createElement('span');
+            span.className = 'current';
+            span.textContent = p;
+            items.push(span);
+          } else {
+            items.push(link(params, { page: p }, String(p)));
+          }
+        }
+        if (page < total) {
+          items.push(link(params, { page: page + 1 }, '&rsaquo;'));
+          items.push(link(params, { page: total }, '&raquo;'));
+        }
+        if (data.next_cursor) items.push(link(params, { after: data.next_cursor }, '이어보기', '번호 없이 이어서 보기'));
+      }
+      pagination.replaceChildren(...items);
+    }
+
+    function load(search, push) {
+      const params = new URLSearchParams(search);
+      const query = new URLSearchParams(params);
+      query.set('fields', ['report_id'].concat(fields).join(','));
+      return fetch(tbody.dataset.listApi + '?' + query.toString(), { headers: { Accept: 'application/json' } })
+        .then(r => {
+          if (!r.ok) throw new Error('HTTP ' + r.status);
+          return r.json();
+        })
+        .then(data => {
+          renderRows(data);
+          renderPagination(data, params);
+          if (push) history.pushState(null, '', '?' + params.toString());
+        });
+    }
+
+    pagination.addEventListener('click', function (event) {
+      const a = event.target.closest('a');
+      if (!a || event.ctrlKey || event.metaKey || event.shiftKey) return;
+      event.preventDefault();
+      load(new URL(a.href).search, true).catch(() => { location.href = a.href; });
+    });
+
+    window.addEventListener('popstate', function () {
+      load(location.search, false).catch(() => location.reload());
+    });
+  }
+
+  document.addEventListener('DOMContentLoaded', init);
+})();
@@ -0,0 +1,90 @@
+# tests/conftest.py
+#
+# 테스트용 SQLite DB + TestClient (main 을 import 하기 전에 접속 URL 지정)
+# - 실행: python -m pytest (pytest.ini 에서 utils.pytest_query_budget 플러그인 로드)
+
+import os
+import tempfile
+from datetime import datetime
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("JOB_WORKERS", "0")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import database
+from models.models import ErrorReport, LogReport, MspReport, User
+from utils import auth
+from utils.auth import create_access_token
+
+CLIENTS = ["고객사2", "고객사10", "Alpha", "alpha"]
+
+
+def seed(db, count=30):
+    admin = User(username="admin", password="-", name="관리자")
+    db.add(admin)
+    db.flush()
+    for i in range(count):
+        common = dict(
+            create_by=admin.user_id, client_name=CLIENTS[i % len(CLIENTS)], system_name=f"sys{i % 3}",
+            target_env="prd" if i % 2 else "dev", manager=f"m{i % 3}", status="완료" if i % 2 else "진행",
+        )
+        db.add(MspReport(request_date=datetime(2024, 1, 1 + i % 28), requester="r", request_type="변경",
+                         request_content=f"요청 {i}", **common))
+        db.add(ErrorReport(error_start_date=datetime(2024, 2, 1 + i % 28), target_component=f"comp{i % 2}",
+                           error_info=f"장애 {i}", **common))
+        db.add(LogReport(log_date=datetime(2024, 3, 1 + i % 28), content=f"일지 {i}", **common))
+    db.commit()
+
+
+@pytest.fixture(scope="session")
+def app():
+    import main
+
+    database.Base.metadata.create_all(database.engine)
+    db = database.SessionLocal()
+    try:
+        seed(db)
+    finally:
+        db.close()
+    return main.app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def admin_client(client):
+    client.cookies.set("access_token", create_access_token({"sub": "admin"}))
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """프로세스 메모리 캐시 초기화 (쿼리 예산 등이 테스트 실행 순서에 좌우되지 않도록)"""
+    import main
+
+    for cache in (main.option_cache, main.panel_cache, auth.user_cache):
+        cache.clear()
+
+
+@pytest.fixture
+def db_engine(tmp_path):
+    """테스트마다 빈 SQLite DB (공용 시드 데이터를 건드리는 테스트용)"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'isolated.db'}", future=True)
+    database.Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    with Session(db_engine) as session:
+        yield session
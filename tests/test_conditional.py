@@ -0,0 +1,40 @@
+# 조건부 응답 (utils.conditional) — 변경이 없으면 304, 리포트 저장 후에는 ETag 가 바뀌는지
+
+import pytest
+
+import database
+from models.models import MspReport
+
+
+def edit_msp_report():
+    db = database.SessionLocal()
+    try:
+        report = db.query(MspReport).order_by(MspReport.report_id).first()
+        report.etc = f"{report.etc or ''}."
+        db.commit()
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("path", ["/api/v1/msp/reports", "/solideo/options"])
+def test_not_modified_until_write(client, path):
+    first = client.get(path)
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert not cached.content
+
+    edit_msp_report()
+
+    changed = client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_other_table_write_keeps_etag(client):
+    etag = client.get("/api/v1/log/reports").headers["etag"]
+    edit_msp_report()
+    assert client.get("/api/v1/log/reports", headers={"If-None-Match": etag}).status_code == 304
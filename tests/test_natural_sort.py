@@ -0,0 +1,27 @@
+# 자연정렬 키 (utils.natural_sort) — DB 정렬키 순서가 natural_keys() 와 같은지
+
+from datetime import datetime
+
+from models.models import LogReport
+from utils.natural_sort import natural_keys, natural_sort_key
+from utils.pagination import list_page
+
+VALUES = [
+    "고객사10", "고객사2", "고객사1", "Alpha", "alpha", "ALPHA2", "alpha10", "a1b2", "a1b10",
+    "a01", "a1", "", "10", "9", "x-1", "x 1", "sys002", "sys2a",
+]
+
+
+def test_sort_key_order_matches_natural_keys():
+    expected = [natural_keys(v) for v in sorted(VALUES, key=natural_keys)]
+    assert [natural_keys(v) for v in sorted(VALUES, key=natural_sort_key)] == expected
+
+
+def test_order_by_sort_key_column(db):
+    for i, name in enumerate(VALUES):
+        db.add(LogReport(log_date=datetime(2024, 1, 1), client_name=name, manager=f"m{i}"))
+    db.commit()
+
+    page = list_page(db.query(LogReport), LogReport, "client_name", "asc", "log_date", 1, 100)
+    names = [r.client_name for r in page.items]
+    assert [natural_keys(n) for n in names] == [natural_keys(v) for v in sorted(VALUES, key=natural_keys)]
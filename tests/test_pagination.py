@@ -0,0 +1,52 @@
+# 커서(keyset) 페이징 — 커서로 끝까지 넘긴 결과가 전체 정렬 결과와 같은지 (NULL 정렬값 포함)
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from models.models import LogReport
+from utils.pagination import apply_sort, list_page
+
+# completed_date: NULL / 같은 값 여러 건 섞어서 (report_id 보조 정렬 확인)
+COMPLETED = [None, datetime(2024, 1, 2), None, datetime(2024, 1, 1), datetime(2024, 1, 2),
+             None, datetime(2024, 1, 3), datetime(2024, 1, 1), None]
+
+
+@pytest.fixture
+def reports(db):
+    for i, completed in enumerate(COMPLETED):
+        db.add(LogReport(log_date=datetime(2024, 3, 1 + i), completed_date=completed,
+                         client_name=f"c{i % 2}", manager="m"))
+    db.commit()
+
+
+def walk(db, sort, direction, limit):
+    """1페이지(번호) 이후 next_cursor 로 끝까지 조회한 report_id 목록"""
+    page = list_page(db.query(LogReport), LogReport, sort, direction, "log_date", 1, limit)
+    ids = [r.report_id for r in page.items]
+    while page.next_cursor:
+        page = list_page(db.query(LogReport), LogReport, sort, direction, "log_date", 1, limit, page.next_cursor)
+        assert page.total is None
+        ids += [r.report_id for r in page.items]
+    return ids
+
+
+@pytest.mark.parametrize("sort", ["completed_date", "client_name", "log_date"])
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+@pytest.mark.parametrize("limit", [1, 2, 4])
+def test_cursor_walk_matches_full_sort(db, reports, sort, direction, limit):
+    expected = [r.report_id for r in apply_sort(db.query(LogReport), LogReport, sort, direction, "log_date")]
+    assert walk(db, sort, direction, limit) == expected
+
+
+def test_last_page_has_no_cursor(db, reports):
+    page = list_page(db.query(LogReport), LogReport, "log_date", "desc", "log_date", 1, len(COMPLETED))
+    assert page.next_cursor is None
+
+
+def test_cursor_for_other_sort_is_rejected(db, reports):
+    page = list_page(db.query(LogReport), LogReport, "completed_date", "asc", "log_date", 1, 2)
+    with pytest.raises(HTTPException) as e:
+        list_page(db.query(LogReport), LogReport, "completed_date", "desc", "log_date", 1, 2, page.next_cursor)
+    assert e.value.status_code == 400
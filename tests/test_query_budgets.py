@@ -0,0 +1,31 @@
+# 엔드포인트별 SQL 수 예산 (pytest.ini 의 query_budgets) — 예산을 넘으면 쿼리 보고서와 함께 실패
+
+import pytest
+
+
+# 고객사 목록: 유형별 DISTINCT 1개씩 (+ solideo 는 테이블 버전 조회 1개)
+@pytest.mark.parametrize("path, budget", [("/solideo/options", 4), ("/leave/options", 3)])
+def test_options(client, query_budget, path, budget):
+    with query_budget(budget):
+        data = client.get(path).json()
+    assert {"Alpha", "alpha", "고객사2", "고객사10"} <= set(data["clients"])
+
+
+@pytest.mark.parametrize("path", ["/solideo/options", "/leave/options"])
+def test_options_for_client(client, path):
+    data = client.get(path, params={"client": "Alpha"}).json()
+    assert data["systems"]
+
+
+def test_admin_stats(admin_client):
+    assert admin_client.get("/admin/stats").status_code == 200
+
+
+def test_client_stats_list(admin_client):
+    response = admin_client.get("/admin/stats/client")
+    assert response.status_code == 200
+    assert "고객사10" in response.text
+
+
+def test_client_stats_detail(admin_client):
+    assert admin_client.get("/admin/stats/client/고객사2").status_code == 200
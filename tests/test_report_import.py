@@ -0,0 +1,75 @@
+# 리포트 일괄 가져오기 (utils.report_import) — 정상/오류 행, 배치 경계, 읽기 중단
+
+import csv
+
+import pytest
+from sqlalchemy import func, select
+
+from models.models import LogReport, ReportDailyRollup
+from utils.report_import import import_reports
+
+HEADER = ["담당자", "일자", "고객사", "프로젝트", "작업내용"]
+
+
+def rows(*values):
+    """(행 번호, 값 목록) — 1행은 헤더"""
+    return list(enumerate([HEADER, *values], start=1))
+
+
+def valid(i):
+    return ["m", f"2024-03-{i + 1:02d}", "고객사1", "sys", f"작업 {i}"]
+
+
+def count(db_engine):
+    with db_engine.connect() as conn:
+        return conn.scalar(select(func.count()).select_from(LogReport.__table__))
+
+
+def rollup_total(db_engine):
+    with db_engine.connect() as conn:
+        return conn.scalar(select(func.coalesce(func.sum(ReportDailyRollup.report_count), 0)))
+
+
+@pytest.mark.parametrize("total, batch_size", [(5, 2), (4, 2), (3, 5), (1, 1)])
+def test_batch_boundaries(db_engine, total, batch_size):
+    result = import_reports(db_engine, "log", rows(*[valid(i) for i in range(total)]), batch_size=batch_size)
+    assert (result.total, result.imported, result.failed, result.aborted) == (total, total, 0, None)
+    assert count(db_engine) == total
+    assert rollup_total(db_engine) == total
+
+
+def test_bad_rows_are_reported_and_skipped(db_engine):
+    data = rows(
+        valid(0),
+        ["m", "2024-13-40", "고객사1", "sys", "날짜 오류"],
+        ["", "2024-03-02", "고객사1", "sys", "담당자 없음"],
+        ["", "", "", "", ""],  # 빈 행은 건수에서 제외
+        ["m" * 20, "2024-03-03", "고객사1", "sys", "길이 초과"],
+        valid(1),
+    )
+    result = import_reports(db_engine, "log", data, batch_size=1)
+    assert (result.total, result.imported, result.failed) == (5, 2, 3)
+    assert [e.line for e in result.errors] == [3, 4, 6]
+    assert count(db_engine) == 2
+
+
+def test_dry_run_saves_nothing(db_engine):
+    result = import_reports(db_engine, "log", rows(valid(0), valid(1)), dry_run=True)
+    assert result.imported == 2
+    assert count(db_engine) == 0
+
+
+def test_missing_header_column(db_engine):
+    with pytest.raises(ValueError):
+        import_reports(db_engine, "log", [(1, ["담당자", "일자"])])
+
+
+def test_read_error_keeps_rows_before_it(db_engine):
+    def broken():
+        yield from rows(valid(0), valid(1), valid(2))
+        raise csv.Error("line contains NUL")
+
+    result = import_reports(db_engine, "log", broken(), batch_size=2)
+    assert result.imported == 3
+    assert result.aborted.line == 5
+    assert count(db_engine) == 3
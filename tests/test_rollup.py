@@ -0,0 +1,56 @@
+# 통계 롤업 (utils.rollup) — 등록/수정/삭제 증감 누적 결과가 rebuild() 전체 재계산과 같은지
+
+from datetime import datetime
+
+from sqlalchemy import select
+
+from models.models import ErrorReport, LogReport, MspReport, ReportDailyRollup
+from utils.rollup import KEY_COLUMNS, NO_DAY, rebuild
+
+MODELS = (MspReport, ErrorReport, LogReport)
+
+
+def snapshot(db):
+    """(롤업 키, 건수) 목록 — 건수 0 행은 증감 누적 쪽에만 남으므로 제외"""
+    table = ReportDailyRollup.__table__
+    columns = [table.c[k] for k in KEY_COLUMNS] + [table.c.report_count]
+    return sorted(db.execute(select(*columns).where(table.c.report_count != 0)).all())
+
+
+def assert_matches_rebuild(db):
+    incremental = snapshot(db)
+    rebuild(db.connection(), ReportDailyRollup.__table__, MODELS)
+    assert snapshot(db) == incremental
+    db.rollback()
+
+
+def test_insert_update_delete(db):
+    reports = [
+        MspReport(request_date=datetime(2024, 1, 1, 9), client_name="A", system_name="s", manager="m", status="진행"),
+        MspReport(request_date=datetime(2024, 1, 1, 18), client_name="A", system_name="s", manager="m", status="진행"),
+        MspReport(request_date=None, client_name="A", manager="m"),
+        MspReport(request_date=None, client_name="A", manager="m"),
+        ErrorReport(error_start_date=datetime(2024, 1, 2), client_name="B", target_component="db", status="완료"),
+        LogReport(log_date=datetime(2024, 1, 3), client_name=None, system_name="s"),
+    ]
+    db.add_all(reports)
+    db.commit()
+    assert_matches_rebuild(db)
+
+    # 일자 없는 리포트는 한 행(NO_DAY)으로 합쳐짐
+    table = ReportDailyRollup.__table__
+    undated = db.execute(select(table.c.report_count).where(table.c.day == NO_DAY)).scalars().all()
+    assert undated == [2]
+
+    reports[0].status = "완료"
+    reports[2].request_date = datetime(2024, 1, 5)
+    reports[4].error_start_date = None
+    reports[5].client_name = "C"
+    reports[1].etc = "키와 무관한 변경"
+    db.commit()
+    assert_matches_rebuild(db)
+
+    db.delete(reports[1])
+    db.delete(reports[3])
+    db.commit()
+    assert_matches_rebuild(db)
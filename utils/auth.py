@@ -7,6 +7,7 @@ from fastapi import Request, HTTPException, Depends
 from models.models import User
 from sqlalchemy.orm import Session
 from database import get_db
+from utils.cache import TTLCache
 from dotenv import load_dotenv
 import os
 
@@ -18,6 +19,15 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 365  # 1 year
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 인증 사용자 캐시: (username, 토큰 iat) → 세션에서 분리된 User
+# 사용자 수정/삭제/비밀번호 변경 시 invalidate_user() 로 비움
+# 주의: 워커(프로세스)별 메모리 캐시 → 다른 워커에는 최대 USER_CACHE_TTL 초 동안 이전 권한/계정이 남음
+#       즉시 반영이 필요하면 USER_CACHE_TTL=0 (캐시 끔)
+user_cache = TTLCache(
+    maxsize=int(os.getenv("USER_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("USER_CACHE_TTL", "30"))
+)
+
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -26,8 +36,9 @@ def get_password_hash(password):
 
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
+    now = datetime.utcnow()
+    expire = now + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+    to_encode.update({"exp": expire, "iat": now})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 def decode_access_token(token: str):
@@ -46,8 +57,25 @@ def get_current_user(request: Request, db: Session = Depends(get_db)):
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    cache_key = (username, payload.get("iat"))
+    user = user_cache.get(cache_key)
+    if user is not None:
+        return user
+
     user = db.query(User).filter(User.username == username).first()
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
+    # 다른 요청과 공유하므로 세션에서 분리 (commit 시 만료/지연 로딩 방지)
+    db.expunge(user)
+    user_cache.set(cache_key, user)
     return user
+
+
+def invalidate_user(*usernames):
+    """
+    해당 사용자의 캐시 항목 제거 (토큰 iat 무관)
+    현재 프로세스의 캐시만 비움 — 다른 워커는 TTL(USER_CACHE_TTL) 만료 후 반영
+    """
+    names = set(usernames)
+    user_cache.invalidate_where(lambda key: key[0] in names)
@@ -0,0 +1,109 @@
+# utils/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    프로세스 내 TTL + LRU 캐시
+    - ttl 초가 지난 항목은 조회 시 만료
+    - maxsize 초과 시 가장 오래 사용하지 않은 항목부터 제거
+    """
+
+    def __init__(self, maxsize=512, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] < time.monotonic():
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, loader):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate_where(self, predicate):
+        """predicate(key) 가 참인 항목 모두 제거"""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0
+            }
+
+
+_MISSING = object()
+
+
+class FragmentCache(TTLCache):
+    """
+    렌더링 결과(HTML 조각) 캐시
+    - 미적중 시 render() 소요 시간을 함께 저장, 적중할 때마다 그 시간을 절약 시간으로 누적
+    - 키에 데이터 버전을 넣어 쓰면 변경 즉시 새 키 → 이전 항목은 LRU/TTL 로 정리
+    - ttl = 최대 허용 지연(버전을 올리지 않는 변경도 ttl 초 안에는 반영)
+    """
+
+    def __init__(self, maxsize=64, ttl=300):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.render_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def get_or_render(self, key, render):
+        item = self.get(key)
+        if item is not None:
+            html, seconds = item
+            with self._lock:
+                self.saved_seconds += seconds
+            return html
+
+        start = time.perf_counter()
+        html = render()
+        seconds = time.perf_counter() - start
+        self.set(key, (html, seconds))
+        with self._lock:
+            self.render_seconds += seconds
+        return html
+
+    def stats(self):
+        stats = super().stats()
+        with self._lock:
+            stats["render_ms"] = round(self.render_seconds * 1000, 1)
+            stats["saved_ms"] = round(self.saved_seconds * 1000, 1)
+        return stats
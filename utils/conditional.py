@@ -0,0 +1,96 @@
+# utils/conditional.py
+#
+# 조회 화면 조건부 응답 (ETag / Last-Modified → 304)
+# - 의존 테이블의 version 행(utils.versions)만 읽어 ETag 를 만들고,
+#   If-None-Match 가 같으면 ORM 조회/템플릿 렌더링 없이 304
+# - ETag = 테이블 버전 + 경로/쿼리스트링 + 세션(헤더의 사용자 이름) + 템플릿/코드 수정 시각
+# - Cache-Control: private, no-cache → 브라우저는 매번 재검증 (수정 직후 이전 화면이 보이지 않음)
+
+import hashlib
+import os
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from sqlalchemy import select
+from starlette.responses import Response
+
+from models.models import TableVersion
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _code_version():
+    """배포(템플릿/코드 변경) 시 ETag 가 바뀌도록 — 모든 워커에서 같은 값"""
+    latest = os.path.getmtime(os.path.join(BASE_DIR, "main.py"))
+    for root in ("templates", "static"):
+        for dirpath, _, filenames in os.walk(os.path.join(BASE_DIR, root)):
+            for name in filenames:
+                latest = max(latest, os.path.getmtime(os.path.join(dirpath, name)))
+    return os.getenv("ETAG_SALT", str(int(latest)))
+
+
+CODE_VERSION = _code_version()
+
+
+def versions_statement(names):
+    table = TableVersion.__table__
+    return select(table.c.name, table.c.version, table.c.updated_at).where(table.c.name.in_(names))
+
+
+class Validator:
+    def __init__(self, request, rows, names):
+        found = {name: (version, updated_at) for name, version, updated_at in rows}
+        self.versions = {name: found.get(name, (0, None))[0] for name in names}
+        digest = hashlib.sha1(CODE_VERSION.encode())
+        for name in sorted(names):
+            digest.update(repr((name, self.versions[name])).encode())
+        digest.update(request.url.path.encode())
+        digest.update(repr(sorted(request.query_params.multi_items())).encode())
+        digest.update(repr(sorted(request.session.items())).encode())
+        self.etag = f'"{digest.hexdigest()[:24]}"'
+
+        times = [updated_at for _, updated_at in found.values() if updated_at is not None]
+        self.last_modified = max(times) if times else None
+
+    def matches(self, request):
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or self.etag in tags or f"W/{self.etag}" in tags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return self._last_modified_utc() <= since
+        return False
+
+    def _last_modified_utc(self):
+        return self.last_modified.astimezone(timezone.utc)
+
+    def headers(self):
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self._last_modified_utc(), usegmt=True)
+        return headers
+
+    def not_modified(self):
+        return Response(status_code=304, headers=self.headers())
+
+    def apply(self, response):
+        response.headers.update(self.headers())
+        return response
+
+
+def validator(db, request, names):
+    """동기 Session 용"""
+    return Validator(request, db.execute(versions_statement(names)).all(), names)
+
+
+async def validator_async(db, request, names):
+    """AsyncSession 용"""
+    return Validator(request, (await db.execute(versions_statement(names))).all(), names)
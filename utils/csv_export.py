@@ -0,0 +1,44 @@
+# utils/csv_export.py
+
+import csv
+import io
+
+from fastapi.responses import StreamingResponse
+
+import database
+
+BATCH_SIZE = 1000
+# 이 크기(문자 수)만큼 모이면 클라이언트로 내보냄
+FLUSH_SIZE = 64 * 1024
+
+
+async def iter_csv(stmt, header, to_row, batch_size=BATCH_SIZE):
+    """
+    select 결과를 서버 커서(stream + yield_per)로 나눠 읽으면서 CSV 조각을 생성
+    - 응답이 끝날 때까지 세션을 유지해야 하므로 요청 의존성(get_async_db)이 아닌 별도 세션 사용
+    - 비동기 세션이라 내보내는 동안 이벤트 루프를 막지 않음
+    - 첫 조각에 UTF-8 BOM 포함 (엑셀 한글 깨짐 방지)
+    """
+    async with database.async_session() as db:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write('\ufeff')
+        writer.writerow(header)
+
+        result = await db.stream(stmt.execution_options(yield_per=batch_size))
+        async for row in result.scalars():
+            writer.writerow(to_row(row))
+            if buffer.tell() >= FLUSH_SIZE:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue().encode("utf-8")
+
+
+def csv_response(filename, header, stmt, to_row):
+    return StreamingResponse(
+        iter_csv(stmt, header, to_row),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
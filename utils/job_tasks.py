@@ -0,0 +1,123 @@
+# utils/job_tasks.py
+#
+# 백그라운드 작업 종류 (utils.jobs 워커 프로세스에서 실행)
+# - validate(params) : 등록 시점에 파라미터 검사/정리 (잘못되면 ValueError)
+# - run(ctx, **params): ctx.path 에 결과 파일 작성, ctx.progress(done, total) 로 진행률 보고
+#                      반환값은 다운로드 파일 이름 (결과 파일이 없으면 None)
+
+import csv
+import inspect
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import select, func
+
+import database
+from utils.report_queries import CSV_EXPORTS, PDF_EXPORTS
+
+CSV_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Task:
+    run: Callable
+    validate: Callable
+    admin_only: bool = False
+
+
+# ------------------------------------------------------------------
+# CSV 내보내기 — /reports/download 등과 같은 조회 조건/컬럼
+# ------------------------------------------------------------------
+def validate_csv_export(params):
+    report_type = params.get("report_type", "")
+    if report_type not in CSV_EXPORTS:
+        raise ValueError(f"알 수 없는 리포트 유형입니다: {report_type}")
+    names = inspect.signature(CSV_EXPORTS[report_type][2]).parameters
+    return {"report_type": report_type, **{k: v for k, v in params.items() if k in names and v}}
+
+
+def run_csv_export(ctx, report_type, **filters):
+    filename, header, build, to_row = CSV_EXPORTS[report_type]
+    stmt = build(**{name: filters.get(name, "") for name in inspect.signature(build).parameters})
+
+    db = database.SessionLocal()
+    try:
+        ctx.progress(0, db.scalar(select(func.count()).select_from(stmt.order_by(None).subquery())))
+        # utf-8-sig: 엑셀 한글 깨짐 방지 BOM
+        with open(ctx.path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            result = db.execute(stmt.execution_options(yield_per=CSV_BATCH_SIZE)).scalars()
+            for count, row in enumerate(result, start=1):
+                writer.writerow(to_row(row))
+                if count % CSV_BATCH_SIZE == 0:
+                    ctx.progress(count)
+    finally:
+        db.close()
+    return filename
+
+
+# ------------------------------------------------------------------
+# 리포트 상세 PDF 일괄 내보내기 — 목록 화면과 같은 필터/정렬 (utils.report_pdf)
+# ------------------------------------------------------------------
+def validate_pdf_export(params):
+    from utils import pdf_render, report_pdf
+
+    report_type = params.get("report_type", "")
+    if report_type not in PDF_EXPORTS:
+        raise ValueError(f"알 수 없는 리포트 유형입니다: {report_type}")
+    fmt = params.get("format", "zip")
+    if fmt not in report_pdf.FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+    if not pdf_render.available():
+        raise ValueError("PDF 변환 모듈(weasyprint)이 설치되어 있지 않습니다.")
+    names = set(inspect.signature(PDF_EXPORTS[report_type][1]).parameters) - {"db"} | {"sort", "direction"}
+    return {
+        "report_type": report_type, "format": fmt,
+        **{k: v for k, v in params.items() if k in names and v}
+    }
+
+
+def run_pdf_export(ctx, report_type, format, sort="", direction="desc", **filters):
+    from utils import report_pdf
+    from utils.pagination import apply_sort
+
+    model, list_query, default_sort = PDF_EXPORTS[report_type]
+    db = database.SessionLocal()
+    try:
+        query = apply_sort(list_query(db, **filters), model, sort or default_sort, direction, default_sort)
+        total = query.order_by(None).count()
+        report_pdf.check_total(total)
+        ctx.progress(0, total)
+        reports = db.execute(query.statement.execution_options(yield_per=report_pdf.YIELD_PER)).scalars()
+        report_pdf.write_export(ctx.path, report_type, format, reports, total, ctx.progress)
+    finally:
+        db.close()
+    return f"{report_type}_reports_{datetime.now():%Y%m%d_%H%M}.{format}"
+
+
+# ------------------------------------------------------------------
+# 통계 롤업 전체 재계산 (scripts.rebuild_rollup 과 동일)
+# ------------------------------------------------------------------
+def run_rollup_rebuild(ctx):
+    from models.models import ReportDailyRollup
+    from utils.rollup import rebuild
+    from utils.stats import REPORT_MODELS
+
+    ctx.progress(0, len(REPORT_MODELS))
+    with database.engine.begin() as conn:
+        rebuild(conn, ReportDailyRollup.__table__, REPORT_MODELS)
+    ctx.progress(len(REPORT_MODELS))
+    return None
+
+
+def _no_params(params):
+    return {}
+
+
+TASKS = {
+    "csv_export": Task(run_csv_export, validate_csv_export),
+    "pdf_export": Task(run_pdf_export, validate_pdf_export),
+    "rollup_rebuild": Task(run_rollup_rebuild, _no_params, admin_only=True),
+}
@@ -0,0 +1,300 @@
+# utils/jobs.py
+#
+# 백그라운드 작업 큐 (job 테이블)
+# - 요청 처리 중에는 job 행만 INSERT(queued) 하고 바로 응답 → 진행률/결과는 /jobs/{job_id} 로 조회
+# - 디스패처 스레드가 queued 작업을 조건부 UPDATE 로 선점 (여러 웹 워커 / scripts.job_worker 가 같이 돌아도 1번만 실행)
+#   실행은 별도 프로세스 풀(JOB_WORKERS 개, nice)에서 → 웹 요청 처리와 CPU/GIL 을 나누지 않음
+# - 실행 중에는 updated_at 을 주기적으로 갱신, JOB_STALE_SECONDS 동안 갱신이 없으면(워커 종료) failed 처리
+# - 결과 파일은 JOB_RESULT_DIR/<job_id>, 완료 후 JOB_RESULT_TTL 초가 지나면 job 행과 함께 삭제
+# - 작업 종류는 utils.job_tasks.TASKS
+# - 디스패처 오류(DB 재시작/연결 끊김/job 테이블 미생성 등)는 로그 후 대기 시간을 늘려가며 재시도
+
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update, delete
+
+import database
+from models.models import Job
+from utils.job_tasks import TASKS
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))  # 0 이면 이 프로세스에서는 실행하지 않음 (등록/조회만)
+JOB_WORKER_NICE = int(os.getenv("JOB_WORKER_NICE", "10"))
+JOB_RESULT_DIR = os.getenv("JOB_RESULT_DIR", os.path.join(tempfile.gettempdir(), "report_system_jobs"))
+JOB_RESULT_TTL = float(os.getenv("JOB_RESULT_TTL", str(24 * 3600)))
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "1"))
+JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", "300"))
+
+HEARTBEAT_SECONDS = 30
+PROGRESS_INTERVAL = 1.0
+CLEANUP_INTERVAL = 60
+ERROR_BACKOFF_MAX = 60
+
+logger = logging.getLogger("report_system.jobs")
+
+
+def result_path(job_id):
+    return os.path.join(JOB_RESULT_DIR, job_id)
+
+
+def new_job(kind, params, owner):
+    """등록할 Job 객체 (파라미터 오류는 ValueError)"""
+    task = TASKS.get(kind)
+    if task is None:
+        raise ValueError(f"알 수 없는 작업입니다: {kind}")
+    return Job(
+        job_id=uuid.uuid4().hex,
+        kind=kind,
+        params=json.dumps(task.validate(params), ensure_ascii=False),
+        status="queued",
+        progress=0,
+        owner=owner,
+        created_at=datetime.now(),
+    )
+
+
+def job_to_dict(job):
+    def iso(value):
+        return value.isoformat(timespec="seconds") if value else None
+
+    return {
+        "job_id": job.job_id,
+        "kind": job.kind,
+        "params": json.loads(job.params or "{}"),
+        "status": job.status,
+        "done": job.progress,
+        "total": job.total,
+        "filename": job.result_name,
+        "error": job.error,
+        "created_at": iso(job.created_at),
+        "started_at": iso(job.started_at),
+        "finished_at": iso(job.finished_at),
+        "expires_at": iso(job.expires_at),
+        "status_url": f"/jobs/{job.job_id}",
+        "download_url": f"/jobs/{job.job_id}/result" if job.result_name else None,
+    }
+
+
+def _update(engine, job_id, **values):
+    table = Job.__table__
+    with engine.begin() as conn:
+        conn.execute(update(table).where(table.c.job_id == job_id).values(**values))
+
+
+def _finish(engine, job_id, **values):
+    now = datetime.now()
+    _update(engine, job_id, finished_at=now, updated_at=now,
+            expires_at=now + timedelta(seconds=JOB_RESULT_TTL), **values)
+
+
+# ------------------------------------------------------------------
+# 풀 프로세스에서 실행
+# ------------------------------------------------------------------
+class JobContext:
+    """작업 함수에 전달: 결과 파일 경로 / 진행률 보고"""
+
+    def __init__(self, engine, job_id):
+        self.engine = engine
+        self.job_id = job_id
+        self.path = result_path(job_id)
+        self.done = 0
+        self.total = None
+        self._reported = 0.0
+
+    def progress(self, done, total=None):
+        self.done = done
+        if total is not None:
+            self.total = total
+        now = time.monotonic()
+        if total is not None or now - self._reported >= PROGRESS_INTERVAL:
+            self._reported = now
+            _update(self.engine, self.job_id, progress=done, total=self.total, updated_at=datetime.now())
+
+
+def _init_worker(nice):
+    if nice and hasattr(os, "nice"):
+        os.nice(nice)
+
+
+def execute(job_id):
+    engine = database.engine
+    table = Job.__table__
+    with engine.connect() as conn:
+        job = conn.execute(select(table).where(table.c.job_id == job_id)).one()
+
+    ctx = JobContext(engine, job_id)
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(HEARTBEAT_SECONDS):
+            _update(engine, job_id, updated_at=datetime.now())
+
+    threading.Thread(target=heartbeat, daemon=True).start()
+    try:
+        os.makedirs(JOB_RESULT_DIR, exist_ok=True)
+        result_name = TASKS[job.kind].run(ctx, **json.loads(job.params or "{}"))
+        progress = ctx.total if ctx.total is not None else ctx.done
+        _finish(engine, job_id, status="done", progress=progress, result_name=result_name)
+    except Exception as e:
+        if os.path.exists(ctx.path):
+            os.remove(ctx.path)
+        _finish(engine, job_id, status="failed", error=f"{type(e).__name__}: {e}")
+    finally:
+        stop.set()
+
+
+# ------------------------------------------------------------------
+# 디스패처 (웹 프로세스 스레드 또는 scripts.job_worker)
+# ------------------------------------------------------------------
+def claim_next(engine):
+    """가장 오래된 queued 작업을 running 으로 바꾸고 job_id 반환 (없으면 None)"""
+    table = Job.__table__
+    for _ in range(3):
+        with engine.begin() as conn:
+            job_id = conn.execute(
+                select(table.c.job_id).where(table.c.status == "queued").order_by(table.c.created_at).limit(1)
+            ).scalar()
+            if job_id is None:
+                return None
+            now = datetime.now()
+            claimed = conn.execute(
+                update(table)
+                .where(table.c.job_id == job_id, table.c.status == "queued")
+                .values(status="running", started_at=now, updated_at=now)
+            ).rowcount
+        if claimed:
+            return job_id
+    return None
+
+
+def cleanup(engine):
+    """멈춘 running 작업 failed 처리 + 만료된 작업/결과 파일 삭제, 삭제 건수 반환"""
+    table = Job.__table__
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(
+            update(table)
+            .where(table.c.status == "running", table.c.updated_at < now - timedelta(seconds=JOB_STALE_SECONDS))
+            .values(status="failed", error="작업이 중단되었습니다. (워커 응답 없음)", finished_at=now,
+                    expires_at=now + timedelta(seconds=JOB_RESULT_TTL))
+        )
+        expired = conn.execute(select(table.c.job_id).where(table.c.expires_at < now)).scalars().all()
+        if expired:
+            conn.execute(delete(table).where(table.c.job_id.in_(expired)))
+    for job_id in expired:
+        if os.path.exists(result_path(job_id)):
+            os.remove(result_path(job_id))
+    return len(expired)
+
+
+class Dispatcher:
+    def __init__(self, engine, workers=JOB_WORKERS):
+        self.engine = engine
+        self.workers = workers
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pool = None
+        self._running = {}  # Future → job_id
+        self._last_cleanup = 0.0
+
+    def notify(self):
+        """새 작업 등록 시 대기 없이 바로 확인"""
+        self._wake.set()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="job-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(JOB_WORKER_NICE,),
+        )
+
+    def _reap(self, futures):
+        for future in futures:
+            job_id = self._running.pop(future)
+            error = future.exception()
+            if error is None:
+                continue
+            # 작업 함수 예외는 execute 안에서 처리 — 여기는 프로세스 비정상 종료 등
+            _finish(self.engine, job_id, status="failed", error=f"{type(error).__name__}: {error}")
+            if isinstance(error, BrokenProcessPool) and self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+
+    def run(self):
+        backoff = 0.0
+        while not self._stop.is_set():
+            try:
+                self._step()
+                backoff = 0.0
+            except Exception:
+                # 한 번의 오류로 스레드가 끝나면 이 워커에서는 더 이상 작업이 실행되지 않음
+                backoff = min(max(backoff * 2, JOB_POLL_SECONDS), ERROR_BACKOFF_MAX)
+                logger.exception("job dispatcher error, retrying in %.0fs", backoff)
+                self._stop.wait(backoff)
+
+    def _step(self):
+        self._reap([f for f in self._running if f.done()])
+
+        if time.monotonic() - self._last_cleanup >= CLEANUP_INTERVAL:
+            self._last_cleanup = time.monotonic()
+            cleanup(self.engine)
+
+        while len(self._running) < self.workers and not self._stop.is_set():
+            job_id = claim_next(self.engine)
+            if job_id is None:
+                break
+            if self._pool is None:
+                self._pool = self._new_pool()
+            self._running[self._pool.submit(execute, job_id)] = job_id
+
+        if self._running:
+            wait(list(self._running), timeout=JOB_POLL_SECONDS, return_when=FIRST_COMPLETED)
+        else:
+            self._wake.wait(JOB_POLL_SECONDS)
+        self._wake.clear()
+
+
+dispatcher = None
+
+
+def start():
+    """웹 프로세스 기동 시 (JOB_WORKERS=0 이면 실행 안 함)"""
+    global dispatcher
+    if JOB_WORKERS > 0 and dispatcher is None:
+        dispatcher = Dispatcher(database.engine)
+        dispatcher.start()
+
+
+def stop():
+    global dispatcher
+    if dispatcher is not None:
+        dispatcher.stop()
+        dispatcher = None
+
+
+def notify():
+    if dispatcher is not None:
+        dispatcher.notify()
@@ -0,0 +1,68 @@
+# utils/list_api.py
+#
+# 목록 JSON API (/api/v1/{msp,error,log}/reports) 응답 구성
+# - 열 방향(column-oriented) 배열: {"fields": [...], "columns": [[값, ...], ...]}
+#   columns[i] 는 fields[i] 컬럼의 값 목록 → 행마다 키 이름을 반복하지 않음
+# - fields=a,b,c 로 필요한 컬럼만 SELECT (본문 Text 컬럼을 빼면 조회/직렬화/전송량이 크게 줄어듦)
+# - 필터/정렬/페이징(번호·커서)은 HTML 목록과 같은 함수 사용 (main.*_list_query, utils.pagination.list_page)
+# - 페이지 틀(header/footer)과 드롭다운 옵션은 포함하지 않음 → 옵션은 /solideo/options, /client/options (캐시)
+# - ETag: 해당 리포트 테이블 버전 기준 (utils.conditional) → 변경이 없으면 304
+
+import os
+from datetime import datetime
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from utils import conditional
+from utils.pagination import list_page, sort_column
+
+LIST_API_MAX_LIMIT = int(os.getenv("LIST_API_MAX_LIMIT", "500"))
+
+
+def api_fields(model):
+    """응답 가능한 컬럼 (정렬키 컬럼 제외, 공통 report 컬럼 포함)"""
+    return tuple(
+        attr.key for attr in model.__mapper__.column_attrs
+        if not attr.key.endswith("_sort_key")
+    )
+
+
+def parse_fields(model, fields):
+    """fields 파라미터 → 컬럼 이름 목록 (비어 있으면 전체)"""
+    available = api_fields(model)
+    if not fields.strip():
+        return list(available)
+    selected = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in selected if f not in available]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 필드: {', '.join(unknown)}")
+    return selected
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def list_response(db, request, query, model, sort, direction, default, page, limit, after, fields):
+    """*_list_query 결과(정렬/페이징 전)를 열 방향 JSON 응답으로"""
+    validator = conditional.validator(db, request, [model.__tablename__])
+    if validator.matches(request):
+        return validator.not_modified()
+
+    selected = parse_fields(model, fields)
+    # 커서 계산용으로 report_id / 정렬 컬럼은 항상 조회 (응답에는 요청한 필드만)
+    keys = list(dict.fromkeys(selected + ["report_id", sort_column(model, sort, default).key]))
+    query = query.with_entities(*[getattr(model, key) for key in keys])
+
+    page_data = list_page(query, model, sort, direction, default, page, limit, after, LIST_API_MAX_LIMIT)
+
+    return validator.apply(JSONResponse({
+        "fields": selected,
+        "columns": [[_json_value(getattr(row, key)) for row in page_data.items] for key in selected],
+        "count": len(page_data.items),
+        "page": page_data.page,
+        "total": page_data.total,
+        "total_pages": page_data.total_pages,
+        "next_cursor": page_data.next_cursor
+    }))
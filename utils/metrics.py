@@ -0,0 +1,250 @@
+# utils/metrics.py
+#
+# 요청 처리 시간 계측 (Prometheus 텍스트 형식 — /admin/metrics)
+# - MetricsMiddleware: 경로 템플릿(/report/{report_id})별 응답 시간 / 응답 크기 히스토그램
+# - 요청마다 DB 시간·쿼리 수(SQLAlchemy before/after_cursor_execute), 템플릿 렌더링 시간을 함께 집계
+#   → 느린 화면이 SQL / 파이썬 처리 / Jinja 중 어디서 시간을 쓰는지 구분
+#   응답 헤더 Server-Timing 에도 같은 값 (브라우저 개발자 도구에서 확인)
+# - 요청 단위 값은 contextvar 에 담음 (스레드풀 핸들러/AsyncSession 에도 전달됨)
+# - METRICS_ENABLED=false 면 미들웨어/이벤트를 등록하지 않음
+# - 외부 의존성 없음 (prometheus_client 미사용), 요청당 잠금 1회
+
+import contextvars
+import hmac
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from jinja2 import Template
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")  # 수집기용 Authorization: Bearer <token> (미지정 시 관리자 로그인만)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+BYTES_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 * 1024, 10 * 1024 * 1024)
+
+UNMATCHED = "<unmatched>"
+
+
+class RequestStats:
+    """요청 1건의 DB / 템플릿 집계"""
+    __slots__ = ("db_seconds", "db_count", "template_seconds")
+
+    def __init__(self):
+        self.db_seconds = 0.0
+        self.db_count = 0
+        self.template_seconds = 0.0
+
+
+_current = contextvars.ContextVar("request_stats", default=None)
+
+
+def current():
+    """처리 중인 요청의 RequestStats (요청 밖이면 None)"""
+    return _current.get()
+
+
+class Histogram:
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self.series = {}  # 라벨 값 tuple → [버킷별 건수..., +Inf 건수, 합계]
+
+    def observe(self, labels, value):
+        data = self.series.get(labels)
+        if data is None:
+            data = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        data[bisect_left(self.buckets, value)] += 1
+        data[-1] += value
+
+    def render(self, lines):
+        lines.append(f"# HELP {self.name} {self.help}")
+        lines.append(f"# TYPE {self.name} histogram")
+        for labels, data in sorted(self.series.items()):
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(self.label_names, labels))
+            prefix = label_text + "," if label_text else ""
+            cumulative = 0
+            for bound, count in zip(self.buckets, data):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            cumulative += data[len(self.buckets)]
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {data[-1]:.6f}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        route = ("method", "route")
+        self.duration = Histogram(
+            "http_request_duration_seconds", "요청 처리 시간", route + ("status",), SECONDS_BUCKETS)
+        self.db_seconds = Histogram(
+            "http_request_db_seconds", "요청당 DB 쿼리 시간 합계", route, SECONDS_BUCKETS)
+        self.db_statements = Histogram(
+            "http_request_db_statements", "요청당 실행한 SQL 수", route, COUNT_BUCKETS)
+        self.template_seconds = Histogram(
+            "http_request_template_seconds", "요청당 템플릿 렌더링 시간 합계", route, SECONDS_BUCKETS)
+        self.response_bytes = Histogram(
+            "http_response_size_bytes", "응답 본문 크기", route, BYTES_BUCKETS)
+        self.template_render = Histogram(
+            "template_render_seconds", "템플릿별 렌더링 시간", ("template",), SECONDS_BUCKETS)
+
+    def record_request(self, method, route, status, seconds, stats, size):
+        labels = (method, route)
+        with self.lock:
+            self.duration.observe((method, route, str(status)), seconds)
+            self.db_seconds.observe(labels, stats.db_seconds)
+            self.db_statements.observe(labels, stats.db_count)
+            self.template_seconds.observe(labels, stats.template_seconds)
+            self.response_bytes.observe(labels, size)
+
+    def record_template(self, name, seconds):
+        with self.lock:
+            self.template_render.observe((name,), seconds)
+
+    def template_summary(self, limit=20):
+        """템플릿별 렌더링 시간 (합계가 큰 순) — 무거운 템플릿 찾기용"""
+        with self.lock:
+            series = list(self.template_render.series.items())
+        rows = []
+        for (name,), data in series:
+            count = sum(data[:-1])
+            rows.append({
+                "template": name,
+                "count": count,
+                "total_ms": round(data[-1] * 1000, 1),
+                "avg_ms": round(data[-1] * 1000 / count, 2) if count else 0.0,
+            })
+        rows.sort(key=lambda row: -row["total_ms"])
+        return rows[:limit]
+
+    def render(self, gauges=None):
+        """gauges: {이름: 값} — 커넥션 풀 등 요청과 무관한 현재 값"""
+        lines = []
+        with self.lock:
+            for histogram in (self.duration, self.db_seconds, self.db_statements,
+                              self.template_seconds, self.response_bytes, self.template_render):
+                histogram.render(lines)
+        for name, value in (gauges or {}).items():
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+# ------------------------------------------------------------------
+# 미들웨어 (순수 ASGI — 스트리밍 응답/contextvar 를 그대로 통과)
+# ------------------------------------------------------------------
+def route_label(scope):
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Mount(/static 등)는 root_path 가 마운트 경로
+    return scope.get("root_path") or UNMATCHED
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed = time.perf_counter() - start
+                timing = (
+                    f"db;dur={stats.db_seconds * 1000:.1f};desc=\"{stats.db_count} queries\", "
+                    f"tpl;dur={stats.template_seconds * 1000:.1f}, app;dur={elapsed * 1000:.1f}"
+                )
+                message["headers"] = [*message.get("headers", ()), (b"server-timing", timing.encode("latin-1"))]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            registry.record_request(
+                scope["method"], route_label(scope), status, time.perf_counter() - start, stats, size
+            )
+
+
+# ------------------------------------------------------------------
+# DB / 템플릿 훅
+# ------------------------------------------------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None and context is not None:
+        context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    start = getattr(context, "_metrics_start", None)
+    if stats is not None and start is not None:
+        stats.db_seconds += time.perf_counter() - start
+        stats.db_count += 1
+
+
+class TimedTemplate(Template):
+    """render() 시간을 요청 집계 + 템플릿별 히스토그램에 기록"""
+
+    def render(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            stats = _current.get()
+            if stats is not None:
+                stats.template_seconds += seconds
+            registry.record_template(self.name or "<string>", seconds)
+
+
+_installed = False
+
+
+def install(app, template_env):
+    """main.py 에서 1회 호출: 미들웨어 + SQLAlchemy 이벤트 + Jinja 템플릿 클래스"""
+    global _installed
+    if not METRICS_ENABLED or _installed:
+        return
+    _installed = True
+    app.add_middleware(MetricsMiddleware)
+    # Engine 클래스에 등록 → 동기 엔진/비동기 엔진(sync_engine) 모두 적용
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    template_env.template_class = TimedTemplate
+    if template_env.cache is not None:
+        template_env.cache.clear()  # 이미 로드된 템플릿도 TimedTemplate 으로 다시 로드
+
+
+def token_allowed(request):
+    if not METRICS_TOKEN:
+        return False
+    return hmac.compare_digest(request.headers.get("authorization", ""), f"Bearer {METRICS_TOKEN}")
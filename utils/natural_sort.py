@@ -0,0 +1,39 @@
+# utils/natural_sort.py
+
+import re
+
+# 문자열 조각 뒤에 붙이는 구분자 (실제 데이터에 등장하는 어떤 문자보다 작아야 함)
+_CHUNK_END = "\x01"
+
+
+def natural_keys(text):
+    return [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', text)]
+
+
+def natsorted(values):
+    """
+    natsort.natsorted 와 같은 순서 (숫자는 숫자로, 문자는 대소문자 구분)
+    natural_keys 는 소문자로 비교하므로 드롭다운 순서가 달라짐 → 기존 natsorted 를 쓰던 곳에 사용
+    """
+    return sorted(values, key=lambda text: [int(t) if t.isdigit() else t for t in re.split(r'(\d+)', text)])
+
+
+def natural_sort_key(text):
+    """
+    natural_keys() 와 같은 순서를 갖는 문자열 정렬키
+    - 문자열 조각: 소문자 + 구분자
+    - 숫자 조각: 자릿수(2자리) + 숫자 (앞자리 0 제거)
+    DB 에서 바이너리 비교만으로 자연정렬이 되도록 저장용 컬럼에 사용
+    """
+    parts = []
+    for chunk in natural_keys(text or ""):
+        if isinstance(chunk, int):
+            digits = str(chunk)
+            parts.append(f"{len(digits):02d}{digits}")
+        else:
+            parts.append(chunk + _CHUNK_END)
+    return "".join(parts)
+
+
+def sort_key_column(field):
+    return f"{field}_sort_key"
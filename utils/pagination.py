@@ -0,0 +1,180 @@
+# utils/pagination.py
+
+import base64
+import binascii
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from math import ceil
+from typing import Any, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import asc, desc, and_, or_, DateTime
+
+from utils.natural_sort import sort_key_column
+
+# 한 페이지 최대 행 수 (limit 파라미터 상한)
+LIST_MAX_LIMIT = int(os.getenv("LIST_MAX_LIMIT", "500"))
+
+
+@dataclass
+class Page:
+    items: List[Any]
+    page: int
+    total: Optional[int]
+    total_pages: int
+    start_page: int
+    end_page: int
+    next_cursor: Optional[str] = None
+
+
+def sort_column(model, sort, default):
+    """정렬 파라미터 → ORDER BY 컬럼 (자연정렬 필드는 정렬키 컬럼 사용)"""
+    if sort in model.__natural_sort__:
+        return getattr(model, sort_key_column(sort))
+    if sort in model.__table__.columns:
+        return getattr(model, sort)
+    return getattr(model, default)
+
+
+def apply_sort(query, model, sort, direction, default):
+    order = desc if direction == "desc" else asc
+    # report_id 를 보조 정렬로 붙여 페이지 간 순서가 흔들리지 않게 함
+    return query.order_by(order(sort_column(model, sort, default)), order(model.report_id))
+
+
+def page_range(page, total_pages):
+    # 최대 5개의 페이징 번호만 표시
+    start_page = max(1, page - 2)
+    end_page = min(start_page + 4, total_pages)
+    start_page = max(1, end_page - 4)
+    return start_page, end_page
+
+
+def paginate(query, page, limit):
+    """정렬된 query 에 COUNT / LIMIT / OFFSET 을 DB 에서 적용"""
+    page = max(page, 1)
+    total = query.order_by(None).count()
+    total_pages = ceil(total / limit) if limit > 0 else 1
+    start_page, end_page = page_range(page, total_pages)
+    items = query.offset((page - 1) * limit).limit(limit).all() if limit > 0 else []
+
+    return Page(
+        items=items,
+        page=page,
+        total=total,
+        total_pages=total_pages,
+        start_page=start_page,
+        end_page=end_page
+    )
+
+
+# ------------------------------------------------------------------
+# 커서(keyset) 페이징: OFFSET 없이 (정렬값, report_id) 이후 행만 조회
+# ------------------------------------------------------------------
+def encode_cursor(sort, direction, value, report_id):
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort, "d": direction, "v": value, "id": report_id}, ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token, sort, direction, column):
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(raw.decode("utf-8"))
+        value, report_id = data["v"], int(data["id"])
+        if data["s"] != sort or data["d"] != direction:
+            raise ValueError("cursor sort mismatch")
+        if value is not None and isinstance(column.expression.type, DateTime):
+            value = datetime.fromisoformat(value)
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    return value, report_id
+
+
+def keyset_filter(model, column, direction, value, report_id):
+    """
+    (정렬값, report_id) 다음 행 조건
+    NULL 은 MySQL/SQLite 기준 가장 작은 값 (ASC 에서 맨 앞, DESC 에서 맨 뒤)
+    """
+    if direction == "desc":
+        if value is None:
+            return and_(column.is_(None), model.report_id < report_id)
+        return or_(
+            column < value,
+            and_(column == value, model.report_id < report_id),
+            column.is_(None)
+        )
+    if value is None:
+        return or_(
+            and_(column.is_(None), model.report_id > report_id),
+            column.isnot(None)
+        )
+    return or_(
+        column > value,
+        and_(column == value, model.report_id > report_id)
+    )
+
+
+def cursor_after(model, sort, direction, default, item):
+    column = sort_column(model, sort, default)
+    return encode_cursor(sort, direction, getattr(item, column.key), item.report_id)
+
+
+def keyset_page(query, model, sort, direction, default, after, limit):
+    """정렬 전 query 를 받아 after 커서 다음 limit 건과 다음 커서를 반환"""
+    if after:
+        column = sort_column(model, sort, default)
+        value, report_id = decode_cursor(after, sort, direction, column)
+        query = query.filter(keyset_filter(model, column, direction, value, report_id))
+
+    rows = apply_sort(query, model, sort, direction, default).limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and items:
+        next_cursor = cursor_after(model, sort, direction, default, items[-1])
+    return items, next_cursor
+
+
+def clamp_limit(limit, max_limit=LIST_MAX_LIMIT):
+    """1 ~ max_limit (0/음수 LIMIT → 빈 페이지 또는 SQLite 에서 무제한 조회 방지)"""
+    return min(max(limit, 1), max_limit)
+
+
+def list_page(query, model, sort, direction, default, page, limit, after="", max_limit=LIST_MAX_LIMIT):
+    """
+    목록 페이지 공통 처리
+    - after 없음: 번호 페이징 (COUNT + LIMIT/OFFSET), 다음 페이지 커서도 함께 계산
+    - after 지정: 커서 페이징 (COUNT 생략)
+    - limit 은 1 ~ max_limit 로 제한
+    """
+    limit = clamp_limit(limit, max_limit)
+    if after:
+        items, next_cursor = keyset_page(query, model, sort, direction, default, after, limit)
+        return Page(
+            items=items,
+            page=0,
+            total=None,
+            total_pages=0,
+            start_page=1,
+            end_page=0,
+            next_cursor=next_cursor
+        )
+
+    page_data = paginate(apply_sort(query, model, sort, direction, default), page, limit)
+    if page_data.items and page_data.page < page_data.total_pages:
+        page_data.next_cursor = cursor_after(model, sort, direction, default, page_data.items[-1])
+    return page_data
+
+
+def row_to_dict(row):
+    """JSON 응답용 (정렬키 컬럼 제외, 일시는 ISO 문자열)"""
+    data = {}
+    for column in row.__table__.columns:
+        if column.key.endswith("_sort_key"):
+            continue
+        value = getattr(row, column.key)
+        data[column.key] = value.isoformat() if isinstance(value, datetime) else value
+    return data
@@ -0,0 +1,240 @@
+# utils/pdf_render.py
+#
+# 서버 측 PDF 렌더링 (WeasyPrint)
+# - 렌더링은 별도 프로세스 풀(PDF_WORKERS 개)에서 수행 → 웹 워커/이벤트 루프를 막지 않음
+#   풀 프로세스는 nice 값을 올려 실행 (대량 생성 중에도 화면 요청이 CPU 를 먼저 사용)
+# - 결과는 스풀 디렉터리(PDF_SPOOL_DIR)에 (이름, 데이터 버전) 파일로 저장 → 같은 버전은 재렌더링 없이 재사용
+#   같은 파일을 동시에 요청하면 렌더링 1회를 함께 기다림, 새 버전이 만들어지면 이전 버전 파일은 삭제
+# - 스풀 용량(PDF_SPOOL_MAX_MB) 초과 / 보관기간(PDF_SPOOL_TTL 초) 경과 파일은 오래 사용하지 않은 순으로 삭제
+# - weasyprint 는 풀 프로세스 안에서만 import (PDF 일괄 내보내기는 작업 워커 프로세스에서 render_file 을 직접 호출)
+
+import asyncio
+import glob
+import hashlib
+import importlib.util
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import unquote, urlparse
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+PDF_WORKER_NICE = int(os.getenv("PDF_WORKER_NICE", "10"))
+PDF_SPOOL_DIR = os.getenv("PDF_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "report_system_pdf"))
+PDF_SPOOL_MAX_MB = float(os.getenv("PDF_SPOOL_MAX_MB", "500"))
+PDF_SPOOL_TTL = float(os.getenv("PDF_SPOOL_TTL", str(7 * 24 * 3600)))
+
+# 렌더링 도중 죽은 프로세스가 남긴 임시 파일 보관 시간(초)
+TMP_FILE_TTL = 3600
+
+_pool = None
+_lock = threading.Lock()
+_inflight = {}  # 스풀 파일 경로 → Future
+
+
+def available():
+    """weasyprint 설치 여부 (import 하지 않고 확인)"""
+    return importlib.util.find_spec("weasyprint") is not None
+
+
+# ------------------------------------------------------------------
+# 풀 프로세스에서 실행되는 함수 (spawn 으로 pickle 되므로 모듈 최상위에 둠)
+# ------------------------------------------------------------------
+def _init_worker(nice):
+    if nice and hasattr(os, "nice"):
+        os.nice(nice)
+
+
+def _url_fetcher(url):
+    from weasyprint import default_url_fetcher
+
+    # 템플릿의 /static/... 은 웹서버를 거치지 않고 로컬 파일로 읽음
+    parsed = urlparse(url)
+    if parsed.scheme == "file" and parsed.path.startswith("/static/"):
+        local = os.path.join(STATIC_DIR, unquote(parsed.path[len("/static/"):]))
+        url = "file://" + local
+    return default_url_fetcher(url)
+
+
+def render_file(html, path):
+    """HTML → PDF 파일 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 완성된 파일만 봄)"""
+    from weasyprint import HTML
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    HTML(string=html, base_url="file:///", url_fetcher=_url_fetcher).write_pdf(tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def merge_files(paths, path):
+    """PDF 파일 여러 개를 순서대로 하나로 병합 (pypdf)"""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part in paths:
+        writer.append(part)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+# ------------------------------------------------------------------
+# 웹 프로세스 쪽
+# ------------------------------------------------------------------
+def get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            os.makedirs(PDF_SPOOL_DIR, exist_ok=True)
+            _pool = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(PDF_WORKER_NICE,),
+            )
+        return _pool
+
+
+def shutdown(pool=None):
+    """풀 종료 (pool 지정 시 그 풀이 현재 풀일 때만 — 비정상 종료된 풀 교체용)"""
+    global _pool
+    with _lock:
+        if pool is not None and pool is not _pool:
+            return
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _name_hash(name):
+    return hashlib.sha1(name.encode("utf-8")).hexdigest()[:16]
+
+
+def spool_path(name, version):
+    return os.path.join(PDF_SPOOL_DIR, f"{_name_hash(name)}-{version}.pdf")
+
+
+def submit(name, version, build_html):
+    """
+    (name, version) PDF 파일 경로의 Future
+    - 스풀에 있으면 바로 완료된 Future, 렌더링 중이면 진행 중인 Future 를 공유
+    - build_html() 은 새로 렌더링할 때만 호출
+    """
+    path = spool_path(name, version)
+    with _lock:
+        future = _inflight.get(path)
+        if future is not None:
+            return future
+        if os.path.exists(path):
+            os.utime(path)  # 최근 사용 시각 (스풀 정리 순서)
+            future = Future()
+            future.set_result(path)
+            return future
+
+    html = build_html()
+    for retry in (False, True):
+        pool = get_pool()
+        try:
+            future = pool.submit(render_file, html, path)
+            break
+        except BrokenProcessPool:
+            # 풀 프로세스가 비정상 종료된 경우 새 풀로 1회 재시도
+            shutdown(pool)
+            if retry:
+                raise
+    with _lock:
+        _inflight[path] = future
+    future.add_done_callback(lambda f: _finished(pool, name, path, f))
+    return future
+
+
+async def render(name, version, build_html):
+    """async 핸들러용: 렌더링이 끝날 때까지 이벤트 루프를 막지 않고 대기"""
+    return await asyncio.wrap_future(submit(name, version, build_html))
+
+
+def _finished(pool, name, path, future):
+    with _lock:
+        if _inflight.get(path) is future:
+            del _inflight[path]
+    if future.cancelled():
+        return
+    if future.exception() is not None:
+        if isinstance(future.exception(), BrokenProcessPool):
+            shutdown(pool)
+        return
+    # 같은 이름의 이전 버전 삭제 후 용량/기간 정리
+    for old in glob.glob(os.path.join(PDF_SPOOL_DIR, f"{_name_hash(name)}-*.pdf")):
+        if old != path:
+            _remove(old)
+    evict()
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _spool_entries():
+    try:
+        entries = list(os.scandir(PDF_SPOOL_DIR))
+    except FileNotFoundError:
+        return []
+    result = []
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except FileNotFoundError:
+            continue
+        result.append((st.st_mtime, st.st_size, entry.path))
+    return result
+
+
+def evict(max_bytes=None, ttl=None):
+    """보관기간이 지났거나 용량을 넘는 파일을 오래 사용하지 않은 순으로 삭제, 삭제 건수 반환"""
+    max_bytes = PDF_SPOOL_MAX_MB * 1024 * 1024 if max_bytes is None else max_bytes
+    ttl = PDF_SPOOL_TTL if ttl is None else ttl
+    now = time.time()
+
+    files = []
+    removed = 0
+    for mtime, size, path in _spool_entries():
+        if path.endswith(".tmp"):
+            if now - mtime > TMP_FILE_TTL:
+                _remove(path)
+                removed += 1
+        elif path.endswith(".pdf"):
+            files.append((mtime, size, path))
+
+    files.sort()
+    total = sum(size for _, size, _ in files)
+    for mtime, size, path in files:
+        if total <= max_bytes and now - mtime <= ttl:
+            break
+        _remove(path)
+        total -= size
+        removed += 1
+    return removed
+
+
+def spool_stats():
+    files = [e for e in _spool_entries() if e[2].endswith(".pdf")]
+    with _lock:
+        inflight = len(_inflight)
+    return {
+        "dir": PDF_SPOOL_DIR,
+        "files": len(files),
+        "bytes": sum(e[1] for e in files),
+        "max_bytes": int(PDF_SPOOL_MAX_MB * 1024 * 1024),
+        "rendering": inflight,
+        "workers": PDF_WORKERS,
+    }
@@ -0,0 +1,103 @@
+# utils/pytest_query_budget.py
+#
+# pytest 플러그인: SQL 수 예산 (utils.query_diagnostics 사용)
+#   python -m pytest -p utils.pytest_query_budget
+#
+# 1) 엔드포인트별 예산 — pytest.ini 의 query_budgets (한 줄에 "METHOD 경로템플릿 최대SQL수")
+#      [pytest]
+#      query_budgets =
+#          GET /solideo/options 4
+#          GET /admin/stats 10
+#    어느 테스트든 TestClient 로 그 엔드포인트를 호출해 예산을 넘으면 해당 테스트 실패 (쿼리 보고서 포함)
+# 2) 마커 — @pytest.mark.query_budget(5) : 테스트 전체에서 실행한 SQL 수 제한
+# 3) fixture — with query_budget(3): client.get(...)
+# --query-repeats : 같은 모양의 SQL 이 QUERY_REPEAT_THRESHOLD 번 이상인 요청(N+1 의심)도 실패
+
+import os
+from contextlib import contextmanager
+
+import pytest
+
+
+def _parse_budgets(lines):
+    budgets = {}
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        try:
+            method, route, limit = line.split()
+            budgets[(method.upper(), route)] = int(limit)
+        except ValueError:
+            raise pytest.UsageError(f"query_budgets 형식 오류 (METHOD 경로 개수): {line!r}")
+    return budgets
+
+
+def _over_budget(title, log, limit):
+    return f"{title}: SQL {log.count}개 (예산 {limit}개)\n{log.report()}"
+
+
+def pytest_addoption(parser):
+    parser.addini("query_budgets", "엔드포인트별 최대 SQL 수 (METHOD 경로템플릿 개수)", type="linelist", default=[])
+    parser.addoption("--query-repeats", action="store_true",
+                     help="같은 모양의 SQL 을 반복 실행한 요청(N+1 의심)이 있으면 실패")
+
+
+def pytest_configure(config):
+    # main 을 import 하기 전에 진단 미들웨어가 켜지도록 (query_diagnostics 는 import 시점에 설정을 읽음)
+    if os.getenv("QUERY_DIAGNOSTICS", "off").lower() == "off":
+        os.environ["QUERY_DIAGNOSTICS"] = "flagged"
+    config.addinivalue_line("markers", "query_budget(max_queries): 테스트 전체에서 실행할 수 있는 SQL 수")
+
+    from utils import query_diagnostics
+
+    plugin = QueryBudgetPlugin(_parse_budgets(config.getini("query_budgets")), config.getoption("query_repeats"))
+    query_diagnostics.request_hooks.append(plugin.on_request)
+    config.pluginmanager.register(plugin, "query_budget_plugin")
+
+
+class QueryBudgetPlugin:
+    def __init__(self, budgets, repeats=False):
+        self.budgets = budgets  # (METHOD, 경로 템플릿) → 최대 SQL 수
+        self.repeats = repeats
+        self.violations = []
+
+    def on_request(self, method, route, log):
+        limit = self.budgets.get((method, route))
+        if limit is not None and log.count > limit:
+            self.violations.append(_over_budget(f"{method} {route}", log, limit))
+        elif self.repeats and log.repeated():
+            self.violations.append(f"{method} {route}: 반복 쿼리 (N+1 의심)\n{log.report()}")
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item):
+        from utils import query_diagnostics
+
+        self.violations = []
+        marker = item.get_closest_marker("query_budget")
+        if marker is None:
+            result = yield
+        else:
+            limit = marker.args[0] if marker.args else marker.kwargs["max_queries"]
+            with query_diagnostics.capture() as log:
+                result = yield
+            if log.count > limit:
+                self.violations.append(_over_budget(item.nodeid, log, limit))
+        if self.violations:
+            pytest.fail("\n\n".join(self.violations), pytrace=False)
+        return result
+
+
+@pytest.fixture
+def query_budget():
+    """with query_budget(3) as log: ... — 블록 안의 SQL 수가 예산을 넘으면 실패"""
+    from utils import query_diagnostics
+
+    @contextmanager
+    def budget(max_queries):
+        with query_diagnostics.capture() as log:
+            yield log
+        if log.count > max_queries:
+            pytest.fail(_over_budget("query_budget", log, max_queries), pytrace=False)
+
+    return budget
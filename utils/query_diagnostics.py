@@ -0,0 +1,194 @@
+# utils/query_diagnostics.py
+#
+# SQL 진단 (개발/테스트용) — 요청마다 실행한 SQL 을 기록해 반복 쿼리(N+1)와 느린 쿼리를 찾음
+# - QUERY_DIAGNOSTICS=off(기본) / flagged(문제 있는 요청만 로그) / all(모든 요청 로그)
+# - 같은 모양(파라미터 자리/IN 목록/숫자·문자 리터럴을 정규화한 SQL)이 QUERY_REPEAT_THRESHOLD 번 이상
+#   → N+1 의심, QUERY_SLOW_MS 이상 걸린 쿼리 → 느린 쿼리
+# - 로그: logging "report_system.queries" (WARNING, 설정이 없으면 stderr)
+# - 테스트/스크립트: with capture() as log: ... → log.count, log.report()
+#   쿼리 수 예산 검사는 utils.pytest_query_budget (pytest -p utils.pytest_query_budget)
+
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from utils.metrics import route_label
+
+QUERY_DIAGNOSTICS = os.getenv("QUERY_DIAGNOSTICS", "off").lower()
+QUERY_SLOW_MS = float(os.getenv("QUERY_SLOW_MS", "100"))
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "5"))
+
+logger = logging.getLogger("report_system.queries")
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\s*(?:\?|%s|:\w+)(?:\s*,\s*(?:\?|%s|:\w+))+\s*\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+
+def statement_shape(statement):
+    """리터럴/IN 목록 길이가 달라도 같은 쿼리로 묶이도록 정규화"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _STRING.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    return _IN_LIST.sub("(?...)", shape)
+
+
+@dataclass
+class ShapeStats:
+    shape: str
+    count: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class QueryLog:
+    """실행한 SQL 목록 (statement, 소요 초)"""
+
+    def __init__(self):
+        self.statements = []
+        self._lock = threading.Lock()
+
+    def add(self, statement, seconds):
+        with self._lock:
+            self.statements.append((statement, seconds))
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    @property
+    def seconds(self):
+        return sum(seconds for _, seconds in self.statements)
+
+    def shapes(self):
+        """모양별 집계 (실행 횟수 많은 순)"""
+        grouped = {}
+        for statement, seconds in list(self.statements):
+            shape = statement_shape(statement)
+            item = grouped.get(shape)
+            if item is None:
+                item = grouped[shape] = ShapeStats(shape)
+            item.count += 1
+            item.seconds += seconds
+            item.max_seconds = max(item.max_seconds, seconds)
+        return sorted(grouped.values(), key=lambda s: (-s.count, -s.seconds))
+
+    def repeated(self, threshold=None):
+        threshold = QUERY_REPEAT_THRESHOLD if threshold is None else threshold
+        return [s for s in self.shapes() if s.count >= threshold]
+
+    def slow(self, slow_ms=None):
+        slow_ms = QUERY_SLOW_MS if slow_ms is None else slow_ms
+        return [(statement, seconds) for statement, seconds in list(self.statements) if seconds * 1000 >= slow_ms]
+
+    def flagged(self):
+        return bool(self.repeated() or self.slow())
+
+    def report(self, title="", limit=10):
+        lines = [f"{title} {self.count} queries, {self.seconds * 1000:.1f} ms".strip()]
+        for s in self.repeated():
+            lines.append(f"  [N+1?] x{s.count} {s.seconds * 1000:.1f} ms  {_short(s.shape)}")
+        for statement, seconds in sorted(self.slow(), key=lambda item: -item[1])[:limit]:
+            lines.append(f"  [slow] {seconds * 1000:.1f} ms  {_short(statement)}")
+        lines.append("  상위 쿼리:")
+        for s in self.shapes()[:limit]:
+            lines.append(f"    x{s.count:<4} {s.seconds * 1000:8.1f} ms  {_short(s.shape)}")
+        return "\n".join(lines)
+
+
+def _short(text, width=200):
+    text = _WHITESPACE.sub(" ", text).strip()
+    return text if len(text) <= width else text[:width] + " ..."
+
+
+# ------------------------------------------------------------------
+# SQLAlchemy 이벤트 (요청별 QueryLog + capture() 로 연 전역 QueryLog 에 기록)
+# ------------------------------------------------------------------
+_current = contextvars.ContextVar("query_log", default=None)
+_captures = []
+_listening = False
+_listen_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and (_captures or _current.get() is not None):
+        context._diagnostics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_diagnostics_start", None)
+    if start is None:
+        return
+    seconds = time.perf_counter() - start
+    log = _current.get()
+    if log is not None:
+        log.add(statement, seconds)
+    for log in list(_captures):
+        log.add(statement, seconds)
+
+
+def _listen():
+    global _listening
+    with _listen_lock:
+        if not _listening:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            _listening = True
+
+
+@contextmanager
+def capture():
+    """블록 안에서 실행된 모든 SQL (프로세스 전체 — 테스트/스크립트용)"""
+    _listen()
+    log = QueryLog()
+    _captures.append(log)
+    try:
+        yield log
+    finally:
+        _captures.remove(log)
+
+
+# ------------------------------------------------------------------
+# 요청별 진단 미들웨어
+# ------------------------------------------------------------------
+# 요청이 끝날 때 호출: hook(method, route, log) — pytest 쿼리 예산 플러그인 등
+request_hooks = []
+
+
+class QueryDiagnosticsMiddleware:
+    def __init__(self, app, mode=QUERY_DIAGNOSTICS):
+        self.app = app
+        self.mode = mode
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        log = QueryLog()
+        token = _current.set(log)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+            method, route = scope["method"], route_label(scope)
+            if self.mode == "all" or (self.mode == "flagged" and log.flagged()):
+                logger.warning(log.report(f"{method} {route} ({scope['path']})"))
+            for hook in list(request_hooks):
+                hook(method, route, log)
+
+
+def install(app):
+    """main.py 에서 1회 호출 (QUERY_DIAGNOSTICS=off 면 아무것도 하지 않음)"""
+    if QUERY_DIAGNOSTICS == "off":
+        return
+    _listen()
+    app.add_middleware(QueryDiagnosticsMiddleware)
@@ -0,0 +1,271 @@
+# utils/report_import.py
+#
+# 리포트 일괄 가져오기 (CSV / XLSX)
+# - 컬럼 구성은 download_*_csv 내보내기와 동일 (헤더 이름으로 매칭, 순서 무관)
+# - 행 단위로 읽으면서 검증 → batch_size 건씩 report / 상세 테이블에 executemany INSERT (배치당 1 트랜잭션)
+# - ORM 이벤트를 거치지 않으므로 정렬키 / 통계 롤업 / 검색 인덱스 / 테이블 버전은 여기서 함께 반영
+# - 오류 행은 건너뛰고 (행 번호, 사유) 로 보고, dry_run 이면 검증만 수행
+# - 읽는 도중 파일 오류(인코딩 / CSV 형식 등)가 나면 그 앞 행까지 저장하고 중단 위치(aborted)와 함께 반환
+
+import csv
+import io
+import zipfile
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import insert, DateTime, String
+
+from models.models import Report, MspReport, ErrorReport, LogReport, ReportDailyRollup, TableVersion
+from utils.natural_sort import natural_sort_key, sort_key_column
+from utils.rollup import rollup_key, apply_deltas
+from utils.search import index_rows
+from utils.versions import bump
+
+BATCH_SIZE = 1000
+MAX_ERRORS = 1000
+
+# (헤더, 필드, 필수 여부) — 내보내기 CSV 헤더와 동일한 이름
+IMPORT_COLUMNS = {
+    "msp": (MspReport, [
+        ("요청일자", "request_date", True),
+        ("고객사", "client_name", True),
+        ("시스템명", "system_name", True),
+        ("대상 환경", "target_env", False),
+        ("요청자", "requester", True),
+        ("요청유형", "request_type", True),
+        ("요청내용", "request_content", False),
+        ("참고사항", "purpose", False),
+        ("담당자", "manager", True),
+        ("상태", "status", False),
+        ("완료일자", "completed_date", False),
+        ("답변내용", "response", False),
+        ("비고", "etc", False),
+    ]),
+    "error": (ErrorReport, [
+        ("장애일자", "error_start_date", True),
+        ("고객사", "client_name", True),
+        ("시스템명", "system_name", True),
+        ("대상 환경", "target_env", False),
+        ("장애대상", "target_component", False),
+        ("고객 영향", "customer_impact", False),
+        ("장애내용", "error_info", True),
+        ("장애원인", "error_reason", False),
+        ("조치내용", "action_taken", False),
+        ("담당자", "manager", True),
+        ("상태", "status", False),
+        ("장애종료일자", "error_end_date", False),
+        ("비고", "etc", False),
+    ]),
+    "log": (LogReport, [
+        ("담당자", "manager", True),
+        ("일자", "log_date", True),
+        ("고객사", "client_name", True),
+        ("프로젝트", "system_name", True),
+        ("작업내용", "content", False),
+        ("특이사항", "etc", False),
+    ]),
+}
+
+# 파일 자체를 더 읽을 수 없는 오류 (행 단위 검증 오류와 구분)
+READ_ERRORS = (UnicodeDecodeError, csv.Error, zipfile.BadZipFile)
+
+DATETIME_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y/%m/%d %H:%M", "%Y/%m/%d")
+
+
+@dataclass
+class RowError:
+    line: int
+    message: str
+
+
+@dataclass
+class ImportResult:
+    report_type: str
+    dry_run: bool
+    total: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[RowError] = field(default_factory=list)
+    aborted: Optional[RowError] = None  # 읽기 중단 위치 — imported 는 그 앞 행까지 저장된 건수
+
+    def add_error(self, line, message):
+        self.failed += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(RowError(line, message))
+
+    def to_dict(self):
+        return {
+            "report_type": self.report_type,
+            "dry_run": self.dry_run,
+            "total": self.total,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": [{"line": e.line, "message": e.message} for e in self.errors],
+            "aborted": {"line": self.aborted.line, "message": self.aborted.message} if self.aborted else None,
+        }
+
+
+# ------------------------------------------------------------------
+# 파일 읽기: (행 번호, 값 목록) 을 한 행씩 생성
+# ------------------------------------------------------------------
+def iter_csv_rows(binary_file):
+    text = io.TextIOWrapper(binary_file, encoding="utf-8-sig", newline="")
+    for line, values in enumerate(csv.reader(text), start=1):
+        yield line, values
+
+
+def iter_xlsx_rows(binary_file):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("XLSX 가져오기에는 openpyxl 패키지가 필요합니다.")
+    workbook = load_workbook(binary_file, read_only=True, data_only=True)
+    try:
+        for line, values in enumerate(workbook.active.iter_rows(values_only=True), start=1):
+            yield line, list(values)
+    finally:
+        workbook.close()
+
+
+def iter_file_rows(filename, binary_file):
+    if filename.lower().endswith((".xlsx", ".xlsm")):
+        return iter_xlsx_rows(binary_file)
+    return iter_csv_rows(binary_file)
+
+
+# ------------------------------------------------------------------
+# 검증 / 변환
+# ------------------------------------------------------------------
+def _parse_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    value = str(value)
+    for fmt in DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"날짜 형식이 올바르지 않습니다: {value}")
+
+
+def _column_map(columns, header):
+    labels = [str(h).strip() if h is not None else "" for h in header]
+    missing = [label for label, _, required in columns if required and label not in labels]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+    return [(labels.index(label), label, name, required) for label, name, required in columns if label in labels]
+
+
+def parse_row(model, column_map, values):
+    """값 목록 → 상세 테이블 INSERT 값 (오류 시 ValueError)"""
+    table = model.__table__
+    row = {}
+    for index, label, name, required in column_map:
+        value = values[index] if index < len(values) else None
+        if isinstance(value, str):
+            value = value.strip() or None
+        if value is None:
+            if required:
+                raise ValueError(f"{label}: 필수 값이 비어 있습니다.")
+            row[name] = None
+            continue
+
+        col_type = table.c[name].type
+        if isinstance(col_type, DateTime):
+            try:
+                value = _parse_datetime(value)
+            except ValueError as e:
+                raise ValueError(f"{label}: {e}")
+        else:
+            value = str(value)
+            if isinstance(col_type, String) and col_type.length and len(value) > col_type.length:
+                raise ValueError(f"{label}: 최대 {col_type.length}자까지 입력할 수 있습니다.")
+        row[name] = value
+
+    for name in model.__natural_sort__:
+        row[sort_key_column(name)] = natural_sort_key(row.get(name))
+    return row
+
+
+# ------------------------------------------------------------------
+# 저장
+# ------------------------------------------------------------------
+def _insert_parents(conn, parents):
+    table = Report.__table__
+    if conn.dialect.insert_executemany_returning:
+        # SQLite / MariaDB 등: RETURNING 으로 배치 INSERT 후 생성된 report_id 를 입력 순서대로 받음
+        result = conn.execute(insert(table).returning(table.c.report_id, sort_by_parameter_order=True), parents)
+        return [r[0] for r in result]
+    # MySQL: RETURNING 미지원 → 행별 INSERT 로 lastrowid 획득 (같은 트랜잭션 안에서 수행)
+    return [conn.execute(insert(table), parent).inserted_primary_key[0] for parent in parents]
+
+
+def insert_batch(conn, model, rows, create_by):
+    now = datetime.now()
+    parents = [
+        {"create_by": create_by, "report_type": model.__report_type__, "created_at": now}
+        for _ in rows
+    ]
+    for report_id, row in zip(_insert_parents(conn, parents), rows):
+        row["report_id"] = report_id
+    conn.execute(insert(model.__table__), rows)
+
+    # 통계 롤업: 같은 키끼리 합쳐서 한 번씩 반영
+    deltas = Counter()
+    for row in rows:
+        deltas[tuple(rollup_key(model, row).items())] += 1
+    apply_deltas(conn, ReportDailyRollup.__table__, [(dict(key), delta) for key, delta in deltas.items()])
+
+    index_rows(conn, model, rows)
+    bump(conn, TableVersion.__table__, [Report.__tablename__, model.__tablename__])
+
+
+def import_reports(engine, report_type, rows, create_by=None, dry_run=False, batch_size=BATCH_SIZE):
+    """
+    rows: (행 번호, 값 목록) 이터레이터 — 첫 행은 헤더
+    반환: ImportResult (헤더 오류는 ValueError, 이후 읽기 오류는 result.aborted)
+    """
+    if report_type not in IMPORT_COLUMNS:
+        raise ValueError(f"알 수 없는 리포트 유형입니다: {report_type}")
+    model, columns = IMPORT_COLUMNS[report_type]
+    result = ImportResult(report_type=report_type, dry_run=dry_run)
+
+    rows = iter(rows)
+    try:
+        header = next(rows, None)
+    except READ_ERRORS as e:
+        raise ValueError(f"파일을 읽을 수 없습니다: {e}")
+    if header is None:
+        raise ValueError("빈 파일입니다.")
+    column_map = _column_map(columns, header[1])
+
+    def flush(batch):
+        if batch and not dry_run:
+            with engine.begin() as conn:
+                insert_batch(conn, model, batch, create_by)
+        result.imported += len(batch)
+
+    batch = []
+    line = header[0]
+    try:
+        for line, values in rows:
+            if not any(v not in (None, "") for v in values):
+                continue
+            result.total += 1
+            try:
+                batch.append(parse_row(model, column_map, values))
+            except ValueError as e:
+                result.add_error(line, str(e))
+                continue
+
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+    except READ_ERRORS as e:
+        # 이미 저장한 배치는 되돌리지 않음 → 마지막으로 읽은 행까지 저장하고 다음 행부터 다시 가져오도록 보고
+        result.aborted = RowError(line + 1, f"파일을 읽을 수 없습니다: {e}")
+
+    flush(batch)
+    return result
@@ -0,0 +1,110 @@
+# utils/report_pdf.py
+#
+# 리포트 상세 PDF 일괄 내보내기 (목록 필터 조건에 맞는 리포트 전체)
+# - 백그라운드 작업(utils.job_tasks 의 pdf_export)에서 실행 → 진행률/결과 파일 보관·만료는 utils.jobs
+# - 작업 워커 프로세스 안에서 직접 렌더링 (이미 웹과 분리된 nice 프로세스 → 렌더링 풀을 따로 두지 않음)
+#   동시에 만드는 내보내기 수는 JOB_WORKERS 로 제한
+# - format=zip : 리포트당 PDF 1개를 ZIP 에 추가 (목록 순서대로 기록)
+#   format=pdf : EXPORT_CHUNK 건씩 렌더링 후 하나로 병합 (pypdf 없으면 전체를 한 번에 렌더링)
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import zipfile
+from contextlib import nullcontext
+
+from utils import pdf_render, templating
+from utils.pagination import row_to_dict
+
+PDF_EXPORT_MAX = int(os.getenv("PDF_EXPORT_MAX", "5000"))
+EXPORT_CHUNK = 20
+YIELD_PER = 200
+
+FORMATS = {"pdf": "application/pdf", "zip": "application/zip"}
+
+_env = None
+
+
+def report_version(report):
+    """리포트 내용 해시 (단건 PDF 스풀 캐시 키)"""
+    data = json.dumps(row_to_dict(report), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+
+def check_total(total):
+    """내보낼 건수 검사 (0건 / PDF_EXPORT_MAX 초과면 ValueError)"""
+    if not total:
+        raise ValueError("조건에 맞는 리포트가 없습니다.")
+    if total > PDF_EXPORT_MAX:
+        raise ValueError(f"한 번에 {PDF_EXPORT_MAX}건까지 내보낼 수 있습니다. (현재 {total}건)")
+
+
+def report_html(reports, env=None):
+    """리포트 목록 → PDF 용 HTML (env: 웹은 main.templates.env, 작업 워커는 생략 → 템플릿 환경을 한 번 생성)"""
+    global _env
+    if env is None:
+        if _env is None:
+            _env = templating.create_env()
+        env = _env
+    return env.get_template("report/report_pdf.html").render({"reports": reports})
+
+
+def _chunks(reports, size):
+    chunk = []
+    for report in reports:
+        chunk.append(report)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def write_export(path, report_type, fmt, reports, total, progress):
+    """
+    reports : 대상 리포트 (ORM 엔티티, 목록과 같은 순서)
+    progress: progress(done) — 렌더링이 끝난 리포트 수
+    path 에 zip / pdf 파일 작성 (작업 워커 프로세스 안에서 직접 렌더링)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+
+    work_dir = f"{path}.parts"
+    tmp_path = f"{path}.tmp"
+
+    if fmt == "zip":
+        chunk_size = 1
+    elif importlib.util.find_spec("pypdf") is not None:
+        chunk_size = EXPORT_CHUNK
+    else:
+        chunk_size = total
+
+    done = 0
+    parts = []  # format=pdf 병합용 (순서대로)
+    try:
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_STORED) if fmt == "zip" else nullcontext() as archive:
+            for index, chunk in enumerate(_chunks(reports, chunk_size)):
+                if archive is not None:
+                    name = f"{report_type}_{chunk[0].report_id}.pdf"
+                else:
+                    name = f"{index:05d}.pdf"
+                part_path = pdf_render.render_file(report_html(chunk), os.path.join(work_dir, name))
+                if archive is not None:
+                    archive.write(part_path, name)
+                    os.remove(part_path)
+                else:
+                    parts.append(part_path)
+                done += len(chunk)
+                progress(done)
+
+        if len(parts) == 1:
+            os.replace(parts[0], tmp_path)
+        elif parts:
+            pdf_render.merge_files(parts, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
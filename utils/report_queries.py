@@ -0,0 +1,319 @@
+# utils/report_queries.py
+#
+# 리포트 목록 / 내보내기 조회 조건
+# - *_list_query : 목록 화면·목록 API·PDF 일괄 내보내기 공용 (ORM Query, 정렬/페이징 전)
+# - *_csv_query / *_csv_row / *_CSV_HEADER : CSV 다운로드
+# - CSV_EXPORTS / PDF_EXPORTS : 유형별 정의 — 웹(main)과 작업 워커(utils.job_tasks)가 함께 사용
+#   (워커 프로세스가 FastAPI 앱(main)을 import 하지 않도록 여기에 둠)
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.models import MspReport, ErrorReport, LogReport
+from utils.search import search_filter
+
+
+# ------------------------------------------------------------------
+# 목록 조회 조건
+# ------------------------------------------------------------------
+def msp_list_query(
+    db: Session,
+    manager: str = "",
+    requester: str = "",
+    status: str = "",
+    client_name: str = "",
+    system_name: str = "",
+    target_env: str = "",
+    request_type: str = "",
+    start_date: str = "",
+    end_date: str = "",
+    search: str = ""
+):
+    query = db.query(MspReport)
+
+    if requester:
+        query = query.filter(MspReport.requester.contains(requester))
+    if manager:
+        query = query.filter(MspReport.manager.contains(manager))
+    if status:
+        query = query.filter(MspReport.status == status)
+    if client_name:
+        query = query.filter(MspReport.client_name.contains(client_name))
+    if system_name:
+        query = query.filter(MspReport.system_name.contains(system_name))
+    if target_env:
+        query = query.filter(MspReport.target_env.contains(target_env))
+    if request_type:
+        query = query.filter(MspReport.request_type.contains(request_type))
+    if start_date and end_date:
+        query = query.filter(
+            MspReport.request_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
+        )
+        
+
+    # ✅ 통합검색: 검색 인덱스(FULLTEXT/FTS5) 사용, 불가 시 여러 필드 LIKE
+    if search:
+        query = query.filter(search_filter(db, MspReport, search))
+
+    return query
+
+
+def error_list_query(
+    db: Session,
+    manager: str = "",
+    status: str = "",
+    client_name: str = "",
+    system_name: str = "",
+    target_env: str = "",
+    target_component: str = "",
+    start_date: str = "",
+    end_date: str = "",
+    search: str = ""
+):
+    query = db.query(ErrorReport)
+
+    if manager:
+        query = query.filter(ErrorReport.manager.contains(manager))
+    if status:
+        query = query.filter(ErrorReport.status == status)
+    if client_name:
+        query = query.filter(ErrorReport.client_name.contains(client_name))
+    if system_name:
+        query = query.filter(ErrorReport.system_name.contains(system_name))
+    if target_env:
+        query = query.filter(ErrorReport.target_env.contains(target_env))
+    if target_component:
+        query = query.filter(ErrorReport.target_component.contains(target_component))
+    if start_date and end_date:
+        query = query.filter(
+            ErrorReport.error_start_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
+        )
+
+    # ✅ 통합검색
+    if search:
+        query = query.filter(search_filter(db, ErrorReport, search))
+
+    return query
+
+
+def log_list_query(
+    db: Session,
+    manager: str = "",
+    status: str = "",
+    client_name: str = "",
+    system_name: str = "",
+    target_env: str = "",
+    log_type: str = "",
+    start_date: str = "",
+    end_date: str = "",
+    search: str = ""
+):
+    query = db.query(LogReport)
+
+    if manager:
+        query = query.filter(LogReport.manager.contains(manager))
+    if status:
+        query = query.filter(LogReport.status == status)
+    if client_name:
+        query = query.filter(LogReport.client_name == client_name)  # 정확 매칭
+    if system_name:
+        query = query.filter(LogReport.system_name == system_name)  # 정확 매칭
+    if target_env:
+        query = query.filter(LogReport.target_env.contains(target_env))
+    if log_type:
+        query = query.filter(LogReport.log_type.contains(log_type))
+    if start_date and end_date:
+        query = query.filter(
+            LogReport.log_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
+        )
+
+    # 통합검색(검색 인덱스)
+    if search:
+        query = query.filter(search_filter(db, LogReport, search))
+
+    return query
+
+
+# ------------------------------------------------------------------
+# CSV 내보내기
+# ------------------------------------------------------------------
+MSP_CSV_HEADER = [
+    "요청일자", "고객사", "시스템명", "대상 환경",
+    "요청자", "요청유형", "요청내용", "참고사항",
+    "담당자", "상태", "완료일자", "답변내용", "비고"
+]
+
+
+def msp_csv_query(
+    start_date, end_date, manager, requester, status, client_name,
+    system_name, target_env, request_type, search
+):
+    query = select(MspReport)
+
+    if manager:
+        query = query.where(MspReport.manager.contains(manager))
+    if requester:
+        query = query.where(MspReport.requester.contains(requester))
+    if status:
+        query = query.where(MspReport.status == status)
+    if client_name:
+        query = query.where(MspReport.client_name.contains(client_name))
+    if system_name:
+        query = query.where(MspReport.system_name.contains(system_name))
+    if target_env:
+        query = query.where(MspReport.target_env.contains(target_env))
+    if request_type:
+        query = query.where(MspReport.request_type.contains(request_type))
+    if start_date and end_date:
+        query = query.where(
+            MspReport.request_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
+        )
+    if search:
+        query = query.where(
+            MspReport.client_name.contains(search) |
+            MspReport.system_name.contains(search) |
+            MspReport.manager.contains(search)
+        )
+
+    # ✅ 최신 요청일자 기준 내림차순 정렬 추가
+    return query.order_by(MspReport.request_date.desc())
+
+
+def msp_csv_row(r):
+    return [
+        r.request_date.strftime("%Y-%m-%d %H:%M") if r.request_date else '',
+        r.client_name or '',
+        r.system_name or '',
+        r.target_env or '',
+        r.requester or '',
+        r.request_type or '',
+        r.request_content or '',
+        r.purpose or '',
+        r.manager or '',
+        r.status or '',
+        r.completed_date.strftime("%Y-%m-%d %H:%M") if r.completed_date else '',
+        r.response or '',
+        r.etc or ''
+    ]
+
+
+ERROR_CSV_HEADER = [
+    "장애일자", "고객사", "시스템명", "대상 환경", "장애대상", "고객 영향",
+    "장애내용", "장애원인", "조치내용", "담당자", "상태", "장애종료일자", "비고"
+]
+
+
+def error_csv_query(
+    start_date, end_date, manager, status, client_name,
+    system_name, target_env, target_component, search
+):
+    query = select(ErrorReport)
+
+    if manager:
+        query = query.where(ErrorReport.manager.contains(manager))
+    if status:
+        query = query.where(ErrorReport.status == status)
+    if client_name:
+        query = query.where(ErrorReport.client_name.contains(client_name))
+    if system_name:
+        query = query.where(ErrorReport.system_name.contains(system_name))
+    if target_env:
+        query = query.where(ErrorReport.target_env.contains(target_env))
+    if target_component:
+        query = query.where(ErrorReport.target_component.contains(target_component))
+    if start_date and end_date:
+        query = query.where(
+            ErrorReport.error_start_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
+        )
+    if search:
+        query = query.where(
+            ErrorReport.client_name.contains(search) |
+            ErrorReport.system_name.contains(search) |
+            ErrorReport.manager.contains(search)
+        )
+
+    # ✅ 최신 장애일자 기준 정렬 추가
+    return query.order_by(ErrorReport.error_start_date.desc())
+
+
+def error_csv_row(r):
+    return [
+        r.error_start_date.strftime("%Y-%m-%d %H:%M") if r.error_start_date else '',
+        r.client_name or '',
+        r.system_name or '',
+        r.target_env or '',
+        r.target_component or '',
+        r.customer_impact or '',
+        r.error_info or '',
+        r.error_reason or '',
+        r.action_taken or '',
+        r.manager or '',
+        r.status or '',
+        r.error_end_date.strftime("%Y-%m-%d %H:%M") if r.error_end_date else '',
+        r.etc or ''
+    ]
+
+
+# ✅ 헤더: 프로젝트는 system_name 값을 CSV 상에서 "프로젝트"로 표기
+LOG_CSV_HEADER = ["담당자", "일자", "고객사", "프로젝트", "작업내용", "특이사항"]
+
+
+def log_csv_query(
+    start_date, end_date, manager, status, client_name,
+    system_name, target_env, log_type, search
+):
+    query = select(LogReport)
+
+    if manager:
+        query = query.where(LogReport.manager.contains(manager))
+    if status:
+        query = query.where(LogReport.status == status)
+    if client_name:
+        query = query.where(LogReport.client_name.contains(client_name))
+    if system_name:
+        query = query.where(LogReport.system_name.contains(system_name))
+    if target_env:
+        query = query.where(LogReport.target_env.contains(target_env))
+    if log_type:
+        query = query.where(LogReport.log_type.contains(log_type))
+    if start_date and end_date:
+        query = query.where(
+            LogReport.log_date.between(start_date + " 00:00:00", end_date + " 23:59:59")
+        )
+    if search:
+        query = query.where(
+            LogReport.client_name.contains(search) |
+            LogReport.system_name.contains(search) |
+            LogReport.manager.contains(search)
+        )
+
+    # ✅ 최신 일자 기준 정렬 유지
+    return query.order_by(LogReport.log_date.desc())
+
+
+def log_csv_row(r):
+    return [
+        r.manager or '',
+        r.log_date.strftime("%Y-%m-%d") if r.log_date else '',
+        r.client_name or '',
+        r.system_name or '',   # ← CSV에서는 "프로젝트"로 표기
+        r.content or '',       # ← 작업내용
+        r.etc or ''            # ← 특이사항
+    ]
+
+
+# 유형별 CSV 내보내기 정의 (파일 이름, 헤더, 조회 조건, 행 변환) — main 의 /X/download 와 백그라운드 작업(utils.job_tasks)
+CSV_EXPORTS = {
+    "msp": ("msp_reports.csv", MSP_CSV_HEADER, msp_csv_query, msp_csv_row),
+    "error": ("error_reports.csv", ERROR_CSV_HEADER, error_csv_query, error_csv_row),
+    "log": ("log_reports.csv", LOG_CSV_HEADER, log_csv_query, log_csv_row),
+}
+
+
+# 리포트 상세 PDF 일괄 내보내기 (백그라운드 작업 pdf_export) — 유형별 (모델, 목록 조회 조건, 기본 정렬)
+# 목록 화면과 같은 조회 조건 (통합검색 인덱스 / 일지 고객사·프로젝트 정확 매칭 포함)
+PDF_EXPORTS = {
+    "msp": (MspReport, msp_list_query, "request_date"),
+    "error": (ErrorReport, error_list_query, "error_start_date"),
+    "log": (LogReport, log_list_query, "log_date"),
+}
@@ -0,0 +1,31 @@
+# utils/report_service.py
+#
+# 리포트 등록 공통 처리 (submit_msp / submit_error / submit_log / solideo / 대체휴가)
+# - 상세 모델(MspReport 등) 한 객체로 생성 → flush 에서 report → 상세 테이블 순으로 INSERT
+# - report_id 는 flush 로 확보, commit 은 1회 (중간 실패 시 report 행만 남는 일 없음)
+
+from datetime import datetime
+
+
+def new_report(model, create_by=None, **values):
+    return model(create_by=create_by, created_at=datetime.now(), **values)
+
+
+def create_report(db, model, create_by=None, **values):
+    """동기 Session 용"""
+    report = new_report(model, create_by, **values)
+    db.add(report)
+    db.flush()
+    report_id = report.report_id
+    db.commit()
+    return report_id
+
+
+async def create_report_async(db, model, create_by=None, **values):
+    """AsyncSession 용"""
+    report = new_report(model, create_by, **values)
+    db.add(report)
+    await db.flush()
+    report_id = report.report_id
+    await db.commit()
+    return report_id
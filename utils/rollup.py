@@ -0,0 +1,90 @@
+# utils/rollup.py
+#
+# report_daily_rollup: (일자, 유형, 고객사, 시스템, 담당자, 상태, 장애대상) 별 건수
+# - 등록/수정/삭제 시 models 의 ORM 이벤트에서 +1 / -1 을 누적 (upsert)
+# - 통계 화면은 원본 테이블 대신 이 테이블만 조회
+# - 전체 재계산: python -m scripts.rebuild_rollup
+# - 일자가 없는 리포트는 day=NO_DAY 로 저장 (NULL 은 유니크 키에서 서로 다른 값 → upsert 가 합치지 못하고 행이 계속 늘어남)
+
+from datetime import date
+
+from sqlalchemy import Date, select, insert, update, delete, literal, func, and_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+DIMENSIONS = ("client_name", "system_name", "manager", "status", "target_component")
+KEY_COLUMNS = ("day", "report_type") + DIMENSIONS
+
+# 일자 없음 (MySQL DATE 최솟값 — 통계의 일자별 집계에서는 제외)
+NO_DAY = date(1000, 1, 1)
+
+
+def rollup_key(model, values):
+    """리포트 값 → 롤업 키 (NULL 은 '' / NO_DAY 로 저장해 유니크 키가 동작하도록)"""
+    day = values.get(model.__date_column__)
+    key = {
+        "day": day.date() if day is not None else NO_DAY,
+        "report_type": model.__report_type__,
+    }
+    for dim in DIMENSIONS:
+        key[dim] = (values.get(dim) or "") if dim in model.__table__.columns else ""
+    return key
+
+
+def _upsert(table, dialect):
+    """report_count 를 더하는 upsert 문 (값은 실행 시 파라미터로 전달, executemany 가능)"""
+    if dialect == "mysql":
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(report_count=table.c.report_count + stmt.inserted.report_count)
+    if dialect == "sqlite":
+        stmt = sqlite_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c[k] for k in KEY_COLUMNS],
+            set_={"report_count": table.c.report_count + stmt.excluded.report_count}
+        )
+    return None
+
+
+def apply_delta(connection, table, key, delta):
+    apply_deltas(connection, table, [(key, delta)])
+
+
+def apply_deltas(connection, table, deltas):
+    """(키, 증감) 목록을 한 번에 반영 — MySQL/SQLite 는 executemany upsert 1회"""
+    params = [dict(key, report_count=delta) for key, delta in deltas]
+    if not params:
+        return
+    stmt = _upsert(table, connection.dialect.name)
+    if stmt is not None:
+        connection.execute(stmt, params)
+        return
+
+    for values in params:
+        key = {k: values[k] for k in KEY_COLUMNS}
+        condition = and_(*[table.c[k] == v for k, v in key.items()])
+        result = connection.execute(
+            update(table).where(condition).values(report_count=table.c.report_count + values["report_count"])
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(table).values(**values))
+
+
+def rebuild(connection, table, models):
+    """원본 테이블에서 롤업 전체 재계산"""
+    connection.execute(delete(table))
+    for model in models:
+        # 상세 테이블 컬럼만 사용 (report 테이블 조인 불필요)
+        columns = model.__table__.c
+        dims = [
+            func.coalesce(columns[dim], "") if dim in columns else literal("")
+            for dim in DIMENSIONS
+        ]
+        day = func.coalesce(func.date(columns[model.__date_column__]), literal(NO_DAY, Date))
+        group_cols = [day] + [func.coalesce(columns[dim], "") for dim in DIMENSIONS if dim in columns]
+        source = select(
+            day,
+            literal(model.__report_type__),
+            *dims,
+            func.count()
+        ).group_by(*group_cols)
+        connection.execute(insert(table).from_select(list(KEY_COLUMNS) + ["report_count"], source))
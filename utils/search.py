@@ -0,0 +1,217 @@
+# utils/search.py
+#
+# 통합검색 인덱스
+# - MySQL : 테이블별 FULLTEXT 인덱스 (ngram parser, 한글 부분검색)
+# - SQLite: FTS5 가상 테이블 report_search (trigram tokenizer) — 테스트/로컬용
+# 인덱스가 없거나 검색어가 n-gram 길이보다 짧으면 LIKE 검색으로 대체
+# - 어느 쪽이든 공백으로 나눈 단어가 모두 (어느 컬럼에든) 포함된 리포트 → 결과는 같고 속도만 다름
+
+import os
+import time
+
+from sqlalchemy import and_, inspect, or_, select, literal, union_all, text, bindparam, Integer
+from sqlalchemy.dialects.mysql import match
+
+FTS_TABLE = "report_search"
+
+# 검색어 최소 길이 (MySQL ngram_token_size 기본 2, SQLite trigram 3)
+MIN_TOKEN = {"mysql": 2, "sqlite": 3}
+
+# 엔진별 인덱스 존재 여부 캐시 {(url, 테이블): (존재 여부, 확인 시각)}
+# - SEARCH_INDEX_RECHECK 초마다 다시 확인 → 실행 중에 인덱스를 만들어도(scripts.build_search_index)
+#   재시작 없이 모든 워커가 사용 (SQLite FTS: 생성 후 확인 전까지 등록된 행은 색인되지 않음 → 재실행으로 보완)
+SEARCH_INDEX_RECHECK = float(os.getenv("SEARCH_INDEX_RECHECK", "60"))
+_ready = {}
+
+
+def fulltext_index_name(model):
+    return f"ft_{model.__tablename__}"
+
+
+def search_columns(model):
+    # 테이블 컬럼 사용: 상속 매핑(report JOIN)을 거치지 않고 상세 테이블만 조회
+    return [model.__table__.c[c] for c in model.__search_columns__]
+
+
+def _terms(keyword):
+    return [w.replace('"', " ").strip() for w in keyword.split() if w.replace('"', " ").strip()]
+
+
+def _index_ready(bind, model):
+    key = (str(bind.engine.url), model.__tablename__)
+    cached = _ready.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[1] < SEARCH_INDEX_RECHECK:
+        return cached[0]
+
+    insp = inspect(bind)
+    if bind.dialect.name == "mysql":
+        names = {ix["name"] for ix in insp.get_indexes(model.__tablename__)}
+        ready = fulltext_index_name(model) in names
+    elif bind.dialect.name == "sqlite":
+        ready = insp.has_table(FTS_TABLE)
+    else:
+        ready = False
+    _ready[key] = (ready, now)
+    return ready
+
+
+def _use_index(bind, model, terms):
+    min_len = MIN_TOKEN.get(bind.dialect.name)
+    if not terms or min_len is None or min(len(t) for t in terms) < min_len:
+        return False
+    return _index_ready(bind, model)
+
+
+def _like_clause(model, terms):
+    # 인덱스 검색과 같은 의미: 단어마다 어느 컬럼에든 포함 (AND)
+    columns = search_columns(model)
+    return and_(*[or_(*[col.like(f"%{term}%") for col in columns]) for term in terms])
+
+
+def _mysql_match(model, terms):
+    # 단어별 구문검색(+"단어") → ngram 연속 일치 = 부분문자열 검색
+    query = " ".join(f'+"{t}"' for t in terms)
+    return match(*search_columns(model), against=query).in_boolean_mode()
+
+
+def _fts_query(terms):
+    return " ".join(f'"{t}"' for t in terms)
+
+
+def search_filter(db, model, keyword):
+    """목록 조회용 통합검색 조건 (model 쿼리에 filter 로 사용)"""
+    bind = db.get_bind()
+    terms = _terms(keyword)
+    if not terms:
+        return _like_clause(model, [keyword])
+    if not _use_index(bind, model, terms):
+        return _like_clause(model, terms)
+    if bind.dialect.name == "mysql":
+        return _mysql_match(model, terms)
+    sub = text(
+        f"SELECT report_id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :fts_q AND report_type = :fts_t"
+    ).bindparams(fts_q=_fts_query(terms), fts_t=model.__report_type__).columns(report_id=Integer)
+    return model.report_id.in_(sub)
+
+
+def ranked_report_ids(db, models, keyword, limit=50):
+    """
+    여러 리포트 유형을 통틀어 관련도 순 (report_id, report_type, score) 목록
+    인덱스를 쓸 수 없으면 최신순(report_id 내림차순)
+    """
+    bind = db.get_bind()
+    terms = _terms(keyword)
+    if not terms:
+        return []
+
+    if all(_use_index(bind, m, terms) for m in models):
+        if bind.dialect.name == "sqlite":
+            types = [m.__report_type__ for m in models]
+            rows = db.execute(
+                text(
+                    f"SELECT report_id, report_type, -bm25({FTS_TABLE}) AS score FROM {FTS_TABLE} "
+                    f"WHERE {FTS_TABLE} MATCH :q AND report_type IN :types ORDER BY rank LIMIT :limit"
+                ).bindparams(bindparam("types", expanding=True)),
+                {"q": _fts_query(terms), "types": types, "limit": limit}
+            ).all()
+            return [(r[0], r[1], r[2]) for r in rows]
+
+        selects = [
+            select(
+                m.__table__.c.report_id.label("report_id"),
+                literal(m.__report_type__).label("report_type"),
+                _mysql_match(m, terms).label("score")
+            ).where(_mysql_match(m, terms))
+            for m in models
+        ]
+    else:
+        selects = [
+            select(
+                m.__table__.c.report_id.label("report_id"),
+                literal(m.__report_type__).label("report_type"),
+                literal(0).label("score")
+            ).where(_like_clause(m, terms))
+            for m in models
+        ]
+
+    merged = union_all(*selects).subquery()
+    rows = db.execute(
+        select(merged.c.report_id, merged.c.report_type, merged.c.score)
+        .order_by(merged.c.score.desc(), merged.c.report_id.desc())
+        .limit(limit)
+    ).all()
+    return [(r[0], r[1], float(r[2] or 0)) for r in rows]
+
+
+# ------------------------------------------------------------------
+# SQLite FTS 인덱스 유지 (models 의 after_insert/update/delete 이벤트에서 호출)
+# MySQL FULLTEXT 는 DB 가 직접 유지하므로 아무것도 하지 않음
+# ------------------------------------------------------------------
+def _search_body(target):
+    return "\n".join(str(getattr(target, c)) for c in target.__search_columns__ if getattr(target, c))
+
+
+def index_rows(connection, model, rows):
+    """일괄 가져오기(utils/report_import)용: report_id 가 채워진 dict 행 목록을 색인"""
+    if not rows or connection.dialect.name != "sqlite" or not _index_ready(connection, model):
+        return
+    connection.execute(
+        text(f"INSERT INTO {FTS_TABLE} (report_id, report_type, body) VALUES (:id, :t, :body)"),
+        [
+            {
+                "id": row["report_id"],
+                "t": model.__report_type__,
+                "body": "\n".join(str(row[c]) for c in model.__search_columns__ if row.get(c)),
+            }
+            for row in rows
+        ]
+    )
+
+
+def index_report(mapper, connection, target):
+    if connection.dialect.name != "sqlite" or not _index_ready(connection, type(target)):
+        return
+    connection.execute(text(f"DELETE FROM {FTS_TABLE} WHERE report_id = :id AND report_type = :t"),
+                       {"id": target.report_id, "t": target.__report_type__})
+    connection.execute(text(f"INSERT INTO {FTS_TABLE} (report_id, report_type, body) VALUES (:id, :t, :body)"),
+                       {"id": target.report_id, "t": target.__report_type__, "body": _search_body(target)})
+
+
+def unindex_report(mapper, connection, target):
+    if connection.dialect.name != "sqlite" or not _index_ready(connection, type(target)):
+        return
+    connection.execute(text(f"DELETE FROM {FTS_TABLE} WHERE report_id = :id AND report_type = :t"),
+                       {"id": target.report_id, "t": target.__report_type__})
+
+
+def create_search_index(conn, models):
+    """검색 인덱스 생성 + 기존 데이터 색인 (scripts/build_search_index.py)"""
+    if conn.dialect.name == "mysql":
+        names_by_table = {m.__tablename__: {ix["name"] for ix in inspect(conn).get_indexes(m.__tablename__)} for m in models}
+        for m in models:
+            if fulltext_index_name(m) in names_by_table[m.__tablename__]:
+                continue
+            cols = ", ".join(m.__search_columns__)
+            conn.execute(text(
+                f"CREATE FULLTEXT INDEX {fulltext_index_name(m)} ON {m.__tablename__} ({cols}) WITH PARSER ngram"
+            ))
+    elif conn.dialect.name == "sqlite":
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            f"USING fts5(report_id UNINDEXED, report_type UNINDEXED, body, tokenize='trigram')"
+        ))
+        conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+        for m in models:
+            table = m.__table__
+            cols = [table.c[c] for c in m.__search_columns__]
+            rows = conn.execute(select(table.c.report_id, *cols)).all()
+            if not rows:
+                continue
+            conn.execute(
+                text(f"INSERT INTO {FTS_TABLE} (report_id, report_type, body) VALUES (:id, :t, :body)"),
+                [{"id": r[0], "t": m.__report_type__, "body": "\n".join(str(v) for v in r[1:] if v)} for r in rows]
+            )
+    else:
+        raise RuntimeError(f"지원하지 않는 DB 입니다: {conn.dialect.name}")
+    _ready.clear()
@@ -0,0 +1,143 @@
+# utils/stats.py
+#
+# 통계 집계: 원본 리포트 테이블 대신 report_daily_rollup 만 조회
+# - 분류별(상태/고객사/담당자/시스템/장애대상) : GROUP BY 1회
+# - 일자별(월별/최근 7일/30일)                  : GROUP BY 1회
+
+import hashlib
+import json
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import select, func
+
+from models.models import MspReport, ErrorReport, LogReport, ReportDailyRollup
+from utils.rollup import NO_DAY
+
+REPORT_MODELS = (MspReport, ErrorReport, LogReport)
+DONE_STATUS = "완료"
+
+
+def _type_counts():
+    return {"msp": 0, "error": 0, "log": 0}
+
+
+@dataclass
+class ReportStats:
+    total_reports: int = 0
+    recent_7: int = 0
+    recent_30: int = 0
+    type_counts: Dict[str, int] = field(default_factory=_type_counts)
+    status_counts: Dict[Optional[str], int] = field(default_factory=dict)
+    client_summary: Dict[Optional[str], Dict[str, int]] = field(default_factory=dict)
+    manager_counts: Dict[Optional[str], Dict[str, int]] = field(default_factory=dict)
+    system_counts: Dict[Optional[str], int] = field(default_factory=dict)
+    component_counts: Dict[str, int] = field(default_factory=dict)
+    monthly_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+
+def _as_date(value):
+    # SQLite 의 DATE() 결과는 문자열로 저장될 수 있음
+    if isinstance(value, str):
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    return value
+
+
+def stats_statements(client_name=None):
+    """통계 집계 SELECT (분류별, 일자별)"""
+    rollup = ReportDailyRollup
+    breakdown = select(
+        rollup.report_type, rollup.status, rollup.client_name, rollup.manager,
+        rollup.system_name, rollup.target_component, func.sum(rollup.report_count)
+    ).group_by(
+        rollup.report_type, rollup.status, rollup.client_name, rollup.manager,
+        rollup.system_name, rollup.target_component
+    )
+    daily = select(rollup.day, rollup.report_type, func.sum(rollup.report_count)).group_by(
+        rollup.day, rollup.report_type
+    )
+    if client_name is not None:
+        breakdown = breakdown.where(rollup.client_name == client_name)
+        daily = daily.where(rollup.client_name == client_name)
+    return breakdown, daily
+
+
+def compute_stats(db, client_name=None):
+    """
+    전체 통계 (client_name 지정 시 해당 고객사만)
+    """
+    stats = ReportStats()
+
+    status_counts = defaultdict(int)
+    client_summary = defaultdict(_type_counts)
+    manager_counts = defaultdict(lambda: {"count": 0, "done": 0})
+    system_counts = defaultdict(int)
+    component_counts = defaultdict(int)
+
+    breakdown, daily = stats_statements(client_name)
+    for report_type, status, client, manager, system, component, cnt in db.execute(breakdown):
+        cnt = int(cnt or 0)
+        if not cnt:
+            continue
+        stats.type_counts[report_type] += cnt
+        status_counts[status] += cnt
+        client_summary[client][report_type] += cnt
+        manager_counts[manager]["count"] += cnt
+        if status == DONE_STATUS:
+            manager_counts[manager]["done"] += cnt
+        system_counts[system] += cnt
+        if component:
+            component_counts[component] += cnt
+
+    today = date.today()
+    last_7_days = today - timedelta(days=7)
+    last_30_days = today - timedelta(days=30)
+    monthly_counts = defaultdict(_type_counts)
+    for day, report_type, cnt in db.execute(daily):
+        cnt = int(cnt or 0)
+        day = _as_date(day)
+        if not cnt or day == NO_DAY:
+            continue
+        monthly_counts[f"{day.year:04d}-{day.month:02d}"][report_type] += cnt
+        if day >= last_7_days:
+            stats.recent_7 += cnt
+        if day >= last_30_days:
+            stats.recent_30 += cnt
+
+    stats.status_counts = dict(status_counts)
+    stats.client_summary = dict(client_summary)
+    stats.manager_counts = dict(manager_counts)
+    stats.system_counts = dict(system_counts)
+    stats.component_counts = dict(component_counts)
+    stats.monthly_counts = dict(sorted(monthly_counts.items()))
+    stats.total_reports = sum(stats.type_counts.values())
+
+    return stats
+
+
+def stats_version(stats):
+    """집계 결과 해시 — 내용이 같으면 같은 값 (통계 PDF 캐시 키)"""
+    def canonical(value):
+        if isinstance(value, dict):
+            return sorted((str(k), canonical(v)) for k, v in value.items())
+        return value
+
+    data = json.dumps(canonical(asdict(stats)), ensure_ascii=False)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+
+def stats_clients_statement():
+    return (
+        select(ReportDailyRollup.client_name)
+        .where(ReportDailyRollup.client_name != "")
+        .group_by(ReportDailyRollup.client_name)
+        .having(func.sum(ReportDailyRollup.report_count) > 0)
+    )
+
+
+def stats_clients(db):
+    """통계 대상 고객사 목록"""
+    rows = db.execute(stats_clients_statement()).all()
+    return sorted(r[0] for r in rows)
@@ -0,0 +1,73 @@
+# utils/templating.py
+#
+# Jinja2 템플릿 환경 (main.templates 하나만 사용)
+# - 컴파일 결과를 파일 바이트코드 캐시(TEMPLATE_CACHE_DIR)에 저장 → 재시작/다른 워커는 파싱·컴파일 없이 로드
+#   (scripts.precompile_templates 를 배포 때 실행하면 첫 요청 전에 캐시가 채워짐)
+# - auto_reload 는 기본 끔 (렌더링마다 템플릿 파일 mtime 확인 안 함)
+#   템플릿을 고치면서 개발할 때만 TEMPLATE_AUTO_RELOAD=true
+# - 기동 시 warm_up() 으로 전체 템플릿을 미리 로드 → 첫 화면 요청이 컴파일 시간을 기다리지 않음
+# - 템플릿별 렌더링 시간은 utils.metrics (template_render_seconds, /admin/cache 의 templates)
+
+import logging
+import os
+import tempfile
+import time
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
+TEMPLATE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "report_system_jinja"))
+TEMPLATE_AUTO_RELOAD = os.getenv("TEMPLATE_AUTO_RELOAD", "false").lower() in ("1", "true", "yes")
+
+TEMPLATE_EXTENSIONS = (".html",)
+
+logger = logging.getLogger("report_system.templates")
+
+warmup_stats = {}
+
+
+def create_env(**options):
+    os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    options.setdefault("loader", FileSystemLoader(TEMPLATE_DIR))
+    options.setdefault("autoescape", True)
+    options.setdefault("auto_reload", TEMPLATE_AUTO_RELOAD)
+    options.setdefault("bytecode_cache", FileSystemBytecodeCache(TEMPLATE_CACHE_DIR))
+    options.setdefault("cache_size", -1)  # 템플릿 수가 적으므로 전부 메모리에 유지
+    return Environment(**options)
+
+
+def create_templates():
+    return Jinja2Templates(env=create_env())
+
+
+def template_names(env):
+    return env.list_templates(filter_func=lambda name: name.endswith(TEMPLATE_EXTENSIONS))
+
+
+def warm_up(env):
+    """전체 템플릿 로드(바이트코드 캐시가 있으면 컴파일 생략), {이름: 오류} 반환"""
+    start = time.perf_counter()
+    errors = {}
+    names = template_names(env)
+    for name in names:
+        try:
+            env.get_template(name)
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+            logger.warning("template %s: %s", name, errors[name])
+    warmup_stats.update({
+        "templates": len(names),
+        "errors": len(errors),
+        "ms": round((time.perf_counter() - start) * 1000, 1),
+    })
+    return errors
+
+
+def stats():
+    return {
+        "cache_dir": TEMPLATE_CACHE_DIR,
+        "auto_reload": TEMPLATE_AUTO_RELOAD,
+        "warmup": warmup_stats,
+    }
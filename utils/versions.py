@@ -0,0 +1,61 @@
+# utils/versions.py
+#
+# 테이블별 데이터 버전 (table_version) — 조회 화면 조건부 응답(utils.conditional)용
+# - 리포트/고객사 테이블이 INSERT/UPDATE/DELETE 되면 같은 트랜잭션에서 version + 1
+#   ORM 경로는 models 의 Session after_flush 이벤트(모든 핸들러 공통),
+#   ORM 을 거치지 않는 일괄 가져오기는 bump() 직접 호출
+
+from datetime import datetime
+
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import object_mapper
+
+# 버전을 관리하는 테이블 (조회 화면이 의존하는 테이블)
+VERSIONED_TABLES = ("report", "msp_report", "error_report", "log_report", "client")
+
+
+def _upsert(table, dialect):
+    if dialect == "mysql":
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(version=table.c.version + 1, updated_at=stmt.inserted.updated_at)
+    if dialect == "sqlite":
+        stmt = sqlite_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.name],
+            set_={"version": table.c.version + 1, "updated_at": stmt.excluded.updated_at}
+        )
+    return None
+
+
+def bump(connection, table, names):
+    """names 중 버전 관리 대상 테이블의 version + 1"""
+    names = sorted(set(names) & set(VERSIONED_TABLES))
+    if not names:
+        return
+    now = datetime.now().replace(microsecond=0)
+    stmt = _upsert(table, connection.dialect.name)
+    if stmt is not None:
+        connection.execute(stmt, [{"name": name, "version": 1, "updated_at": now} for name in names])
+        return
+
+    for name in names:
+        result = connection.execute(
+            update(table).where(table.c.name == name).values(version=table.c.version + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(table).values(name=name, version=1, updated_at=now))
+
+
+def flushed_tables(session):
+    """이번 flush 에서 변경된 객체들의 테이블 이름 (조인 상속은 부모 테이블 포함)"""
+    names = set()
+    for obj in session.new:
+        names.update(table.name for table in object_mapper(obj).tables)
+    for obj in session.deleted:
+        names.update(table.name for table in object_mapper(obj).tables)
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            names.update(table.name for table in object_mapper(obj).tables)
+    return names